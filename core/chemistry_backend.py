@@ -36,6 +36,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Tuple, Any
 from pathlib import Path
 
+import numpy as np
 import phreeqpython
 
 logger = logging.getLogger(__name__)
@@ -85,6 +86,12 @@ VALID_IONS: Dict[str, Dict[str, float]] = {
     "OH-": {"charge": -1, "mw": 17.01, "name": "Hydroxide"},
 }
 
+# VALID_IONS as aligned arrays for the vectorized charge balance
+_ION_INDEX: Dict[str, int] = {ion: i for i, ion in enumerate(VALID_IONS)}
+_ION_MW = np.array([props["mw"] for props in VALID_IONS.values()])
+_ION_ABS_CHARGE = np.array([abs(props["charge"]) for props in VALID_IONS.values()], dtype=float)
+_ION_SIGN = np.sign([props["charge"] for props in VALID_IONS.values()]).astype(float)
+
 # Map ion names to PHREEQC element keywords
 # Format: (PHREEQC_keyword, conversion_factor)
 ION_TO_PHREEQC: Dict[str, Tuple[str, float]] = {
@@ -224,26 +231,22 @@ def calculate_charge_balance(ion_dict: Dict[str, float]) -> float:
     Returns:
         Charge balance error as percentage
     """
-    cation_meq = 0.0
-    anion_meq = 0.0
-
-    for ion, conc_mg_L in ion_dict.items():
-        props = VALID_IONS.get(ion)
-        if not props:
+    conc_mg_L = np.zeros(len(_ION_INDEX))
+    for ion, conc in ion_dict.items():
+        idx = _ION_INDEX.get(ion)
+        if idx is None:
             logger.warning(f"Unknown ion '{ion}' in charge balance calculation")
             continue
+        conc_mg_L[idx] = conc
 
-        meq_L = mg_L_to_meq_L(conc_mg_L, props["mw"], props["charge"])
-        if props["charge"] > 0:
-            cation_meq += meq_L
-        else:
-            anion_meq += meq_L
+    # Same conversion as mg_L_to_meq_L, for all ions at once
+    meq_L = conc_mg_L / _ION_MW / 1000.0 * _ION_ABS_CHARGE * 1000.0
 
-    total_meq = cation_meq + anion_meq
+    total_meq = float(meq_L.sum())
     if total_meq == 0:
         return 0.0
 
-    return (cation_meq - anion_meq) / total_meq * 100.0
+    return float(meq_L @ _ION_SIGN) / total_meq * 100.0
 
 
 # ---------------------------------------------------------------------------
@@ -23,9 +23,14 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List, Union
 from pathlib import Path
 
+import numpy as np
+
+# Optional JIT for the mixed-potential kernel (no-op without numba)
+from utils._numba_compat import njit
+
 # Import authoritative materials database (BUG-010, BUG-012 fixes)
 from data import (
     get_material_data,
@@ -52,17 +57,112 @@ logger = logging.getLogger(__name__)
 FARADAY = 96485.3321  # C/mol
 R_GAS = 8.314462618  # J/mol·K
 T_STD = 298.15  # 25°C in K
+_LN10 = 2.302585092994046  # ln(10): 10**x evaluated as exp(x × ln10)
+
+
+# ---------------------------------------------------------------------------
+# Mixed-potential kernel (JIT-compiled when numba is available)
+# ---------------------------------------------------------------------------
+
+# Largest η/β for which 10**(η/β) stays finite in float64
+_MAX_DECADES = 308.0
+
+
+@njit(cache=True)
+def _tafel_magnitude(eta, i0, beta):
+    """Scalar |i| = i0 × 10^(η/β), with the same overflow clamp as the array path."""
+    x = eta / beta
+    if x > _MAX_DECADES:
+        return 1e10 if eta > 0 else 1e-10
+    return i0 * math.exp(x * _LN10)
+
+
+@njit(cache=True)
+def _solve_mixed_potential_nb(
+    E_corr_a, i0_a, ba_a,
+    E_corr_c, i0_c, bc_c,
+    area_ratio, i_lim,
+    E_min, E_max,
+    tolerance, max_iterations,
+):
+    """
+    Bisect [E_min, E_max] for i_anodic + area_ratio × i_cathodic = 0.
+
+    A negative i_lim disables the diffusion limit.
+
+    Returns:
+        Tuple of (E_couple, i_anodic, converged)
+    """
+    E_mid = 0.5 * (E_min + E_max)
+    i_anodic = 0.0
+    for _ in range(max_iterations):
+        E_mid = 0.5 * (E_min + E_max)
+
+        i_anodic = _tafel_magnitude(E_mid - E_corr_a, i0_a, ba_a)
+        i_cathodic = _tafel_magnitude(E_mid - E_corr_c, i0_c, bc_c)
+        if i_lim >= 0.0 and i_cathodic > i_lim:
+            i_cathodic = i_lim
+        i_net = i_anodic - i_cathodic * area_ratio
+
+        if abs(i_net) < tolerance or (E_max - E_min) < tolerance:
+            return E_mid, i_anodic, True
+
+        if i_net > 0:
+            E_max = E_mid
+        else:
+            E_min = E_mid
+
+    return 0.5 * (E_min + E_max), i_anodic, False
+
+
+def _check_tafel_validity(eta: Union[float, np.ndarray]) -> None:
+    """Warn when any overpotential is inside the Tafel region's lower bound."""
+    # Tafel approximation valid for |η| > ~50-100 mV per Codex
+    abs_eta = np.abs(eta)
+    if np.any(abs_eta < 0.05):
+        eta_min = float(np.min(abs_eta))
+        logger.warning(f"Tafel approximation questionable for η = {eta_min*1000:.1f} mV < 50 mV")
+
+
+def _tafel_current(
+    eta: np.ndarray,
+    i0: float,
+    beta: float,
+    is_anodic: bool,
+) -> Union[float, np.ndarray]:
+    """
+    Tafel current i = ±i0 × 10^(η/β) without the validity logging.
+
+    Used directly for the Evans sweep, whose grid points near each E_corr
+    are not operating points and should not be reported.
+    """
+    with np.errstate(over="ignore"):
+        i = i0 * np.exp((eta / beta) * _LN10)
+
+    # Handle extreme overpotentials
+    overflow = ~np.isfinite(i)
+    if np.any(overflow):
+        # Very large anodic current / very small cathodic current
+        i = np.where(overflow, np.where(eta > 0, 1e10, 1e-10), i)
+
+    # Apply sign convention: anodic positive, cathodic negative
+    if not is_anodic:
+        i = -i
+
+    return float(i) if i.ndim == 0 else i
 
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PolarizationCurve:
     """
     Polarization curve data for a material/reaction.
 
+    Immutable and hashable, so curves can be cached and shared across calls.
+
     Attributes:
         material: Material name (e.g., "carbon steel", "316L")
         reaction: Reaction type ("anodic", "orr", "her")
@@ -119,30 +219,37 @@ class GalvanicBackend:
     Uses Evans diagram approach to find E_couple and i_galv.
     """
 
+    # Points in the vectorized Evans sweep used to bracket E_couple before
+    # bisection refines it to tolerance
+    EVANS_GRID_POINTS = 201
+
     def __init__(self):
         """Initialize galvanic backend."""
-        pass
+        # Polarization curves keyed by (branch, material, temperature_C, electrolyte).
+        # Built from static NRL/ASTM G82 data, so shared read-only across calls.
+        self._curve_cache: Dict[Tuple[str, str, float, str], PolarizationCurve] = {}
 
     def calculate_tafel_current(
         self,
-        E: float,
+        E: Union[float, np.ndarray],
         E_corr: float,
         i0: float,
         beta: float,
         is_anodic: bool = True,
-    ) -> float:
+    ) -> Union[float, np.ndarray]:
         """
         Calculate current density from Tafel equation.
 
         Args:
-            E: Applied potential (V vs SHE)
+            E: Applied potential (V vs SHE) - scalar or array of potentials
             E_corr: Corrosion potential (V vs SHE)
             i0: Exchange current density (A/m²)
             beta: Tafel slope (V/decade) - positive for anodic, negative for cathodic
             is_anodic: True for anodic branch, False for cathodic
 
         Returns:
-            Current density (A/m²) - positive for anodic, negative for cathodic
+            Current density (A/m²) - positive for anodic, negative for cathodic.
+            Same shape as E (float for scalar E).
 
         Tafel equation:
             i = i0 × 10^(η / β)
@@ -150,26 +257,48 @@ class GalvanicBackend:
             η = E - E_corr (overpotential)
             β = ba (anodic) or bc (cathodic)
         """
-        eta = E - E_corr  # Overpotential
-
-        # Tafel approximation valid for |η| > ~50-100 mV per Codex
-        if abs(eta) < 0.05:
-            logger.warning(f"Tafel approximation questionable for η = {eta*1000:.1f} mV < 50 mV")
-
-        try:
-            i = i0 * 10.0 ** (eta / beta)
-        except (OverflowError, ValueError):
-            # Handle extreme overpotentials
-            if eta > 0:
-                i = 1e10  # Very large anodic current
-            else:
-                i = 1e-10  # Very small cathodic current
+        eta = np.asarray(E, dtype=float) - E_corr  # Overpotential
+        _check_tafel_validity(eta)
+        return _tafel_current(eta, i0, beta, is_anodic)
 
-        # Apply sign convention: anodic positive, cathodic negative
-        if not is_anodic:
-            i = -i
+    def _net_current(
+        self,
+        E: Union[float, np.ndarray],
+        anodic_curve: PolarizationCurve,
+        cathodic_curve: PolarizationCurve,
+        area_ratio: float,
+        i_lim: Optional[float],
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Evaluate the Evans diagram at potential(s) E.
+
+        Skips the Tafel validity logging; callers check the operating point.
+
+        Returns:
+            Tuple of (i_anodic, i_net) where i_net = i_anodic + area-weighted
+            (diffusion-limited) cathodic current
+        """
+        E = np.asarray(E, dtype=float)
+
+        # Anodic current (positive)
+        i_anodic = _tafel_current(
+            E - anodic_curve.E_corr, anodic_curve.i0, anodic_curve.ba, is_anodic=True
+        )
+
+        # Cathodic current (negative) scaled by area
+        i_cathodic_raw = _tafel_current(
+            E - cathodic_curve.E_corr, cathodic_curve.i0, cathodic_curve.bc, is_anodic=False
+        )
 
-        return i
+        # FIX BUG-011: Apply diffusion limit to cathodic current
+        # ORR caps at i_lim due to O₂ mass transport (NRL data: 0.5-1 mA/cm²)
+        if i_lim is not None:
+            # Clamp magnitude of cathodic current (it's negative)
+            i_cathodic_raw = np.maximum(i_cathodic_raw, -i_lim)
+
+        i_cathodic = i_cathodic_raw * area_ratio
+
+        return i_anodic, i_anodic + i_cathodic
 
     def find_mixed_potential(
         self,
@@ -181,7 +310,10 @@ class GalvanicBackend:
         """
         Find mixed potential (E_couple) and galvanic current (i_galv).
 
-        Uses bisection to find intersection of anodic and cathodic curves.
+        Sweeps the Evans diagram on a grid (one vectorized evaluation) to
+        bracket the intersection of the anodic and cathodic curves, then
+        refines it by bisection in ``_solve_mixed_potential_nb`` (compiled
+        with numba when installed).
 
         Args:
             anodic_curve: Anodic polarization curve (metal dissolution)
@@ -201,63 +333,38 @@ class GalvanicBackend:
         E_min = min(anodic_curve.E_corr, cathodic_curve.E_corr) - 0.5
         E_max = max(anodic_curve.E_corr, cathodic_curve.E_corr) + 0.5
 
+        # Vectorized Evans sweep: i_net rises with E, so the first grid point
+        # with i_net > 0 brackets E_couple with its predecessor
+        E_grid = np.linspace(E_min, E_max, self.EVANS_GRID_POINTS)
+        _, i_net_grid = self._net_current(
+            E_grid, anodic_curve, cathodic_curve, area_ratio, i_lim
+        )
+        k = int(np.argmax(i_net_grid > 0))
+        if k > 0 and i_net_grid[k] > 0:
+            E_min, E_max = float(E_grid[k - 1]), float(E_grid[k])
+
         # Bisection to find E where i_anodic = i_cathodic × area_ratio
         tolerance = 1e-6  # 1 µV
         max_iterations = 100
 
-        for iteration in range(max_iterations):
-            E_mid = (E_min + E_max) / 2.0
-
-            # Anodic current (positive)
-            i_anodic = self.calculate_tafel_current(
-                E_mid,
-                anodic_curve.E_corr,
-                anodic_curve.i0,
-                anodic_curve.ba,
-                is_anodic=True,
-            )
+        E_couple, i_anodic, converged = _solve_mixed_potential_nb(
+            anodic_curve.E_corr, anodic_curve.i0, anodic_curve.ba,
+            cathodic_curve.E_corr, cathodic_curve.i0, cathodic_curve.bc,
+            area_ratio, -1.0 if i_lim is None else i_lim,
+            E_min, E_max,
+            tolerance, max_iterations,
+        )
 
-            # Cathodic current (negative) scaled by area
-            i_cathodic_raw = self.calculate_tafel_current(
-                E_mid,
-                cathodic_curve.E_corr,
-                cathodic_curve.i0,
-                cathodic_curve.bc,
-                is_anodic=False,
-            )
+        if not converged:
+            logger.warning(f"Mixed potential failed to converge after {max_iterations} iterations")
 
-            # FIX BUG-011: Apply diffusion limit to cathodic current
-            # ORR caps at i_lim due to O₂ mass transport (NRL data: 0.5-1 mA/cm²)
-            if i_lim is not None:
-                # Clamp magnitude of cathodic current (it's negative)
-                if abs(i_cathodic_raw) > i_lim:
-                    i_cathodic_raw = -i_lim  # Apply limit
-                    logger.debug(f"ORR diffusion limit applied: {i_lim} A/m²")
-
-            i_cathodic = i_cathodic_raw * area_ratio
-
-            # Find where i_anodic + i_cathodic = 0 (charge balance)
-            i_net = i_anodic + i_cathodic
-
-            if abs(i_net) < tolerance or (E_max - E_min) < tolerance:
-                # Converged
-                E_couple = E_mid
-                i_galv = i_anodic  # Galvanic current on anode
-                return E_couple, i_galv
-
-            # Bisection update
-            if i_net > 0:
-                # Too anodic, lower potential
-                E_max = E_mid
-            else:
-                # Too cathodic, raise potential
-                E_min = E_mid
+        # Tafel validity is judged once, at the operating point
+        _check_tafel_validity(
+            min(abs(E_couple - anodic_curve.E_corr), abs(E_couple - cathodic_curve.E_corr))
+        )
 
-        # Failed to converge
-        logger.warning(f"Mixed potential failed to converge after {max_iterations} iterations")
-        E_couple = (E_min + E_max) / 2.0
-        i_galv = abs(i_anodic)
-        return E_couple, i_galv
+        # Galvanic current on anode
+        return float(E_couple), float(i_anodic)
 
     def current_to_corrosion_rate(
         self,
@@ -351,8 +458,8 @@ class GalvanicBackend:
         Per Codex: Use Tafel approximations and weight by area
         """
         # Get polarization curves (BUG-010 partial fix: uses ASTM G82 data)
-        anodic_curve = self._get_anodic_curve(anode_material, temperature_C, electrolyte)
-        cathodic_curve = self._get_cathodic_curve(cathode_material, temperature_C, electrolyte)
+        anodic_curve = self._get_curve("anodic", anode_material, temperature_C, electrolyte)
+        cathodic_curve = self._get_curve("cathodic", cathode_material, temperature_C, electrolyte)
 
         # Get ORR diffusion limit (BUG-011 fix: add transport limits)
         i_lim = get_orr_diffusion_limit(electrolyte, temperature_C)
@@ -385,6 +492,35 @@ class GalvanicBackend:
             interpretation=interpretation,
         )
 
+    def _get_curve(
+        self,
+        branch: str,
+        material: str,
+        temperature_C: float,
+        electrolyte: str,
+    ) -> PolarizationCurve:
+        """
+        Memoized wrapper around _get_anodic_curve / _get_cathodic_curve.
+
+        Args:
+            branch: "anodic" or "cathodic"
+            material: Material name
+            temperature_C: Temperature (°C)
+            electrolyte: Electrolyte type
+
+        Returns:
+            Cached (frozen) PolarizationCurve
+        """
+        key = (branch, material, temperature_C, electrolyte)
+        curve = self._curve_cache.get(key)
+        if curve is None:
+            if branch == "anodic":
+                curve = self._get_anodic_curve(material, temperature_C, electrolyte)
+            else:
+                curve = self._get_cathodic_curve(material, temperature_C, electrolyte)
+            self._curve_cache[key] = curve
+        return curve
+
     def _get_galvanic_potential(
         self,
         material: str,
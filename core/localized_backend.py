@@ -27,10 +27,17 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List
 
+import numpy as np
+
+# Optional JIT for the grid-sweep kernel (no-op without numba)
+from utils._numba_compat import njit, prange
+
 # Import authoritative data (BUG-013, BUG-014, BUG-016 fixes)
 from data import (
+    ASTM_G48_CPT_DATA,
     get_material_data,
     get_cpt_from_astm,
     get_chloride_threshold,
@@ -74,11 +81,96 @@ CL_THRESHOLD_BASE = {
 }
 
 
+@lru_cache(maxsize=128)
+def _pren(Cr: float, Mo: float, N: float, grade_type: str) -> float:
+    """
+    PREN with the default PREN_COEFFS for grade_type, memoized per composition.
+
+    Catalog sweeps and repeated assessments revisit the same few grades.
+    Call _pren.cache_clear() after editing PREN_COEFFS at runtime.
+    """
+    coeffs = PREN_COEFFS.get(grade_type, PREN_COEFFS["standard"])
+    return coeffs["a"] * Cr + coeffs["b"] * Mo + coeffs["c"] * N
+
+
+# ASTM G48 table flattened into arrays indexed by an integer material code
+# (row order of astm_g48_cpt_data.csv); a missing CCT is stored as NaN
+_G48_MATERIALS = tuple(ASTM_G48_CPT_DATA)
+_CPT_TABLE = np.array([ASTM_G48_CPT_DATA[m]["CPT_C"] for m in _G48_MATERIALS], dtype=float)
+_CCT_TABLE = np.array(
+    [ASTM_G48_CPT_DATA[m].get("CCT_C", np.nan) for m in _G48_MATERIALS], dtype=float
+)
+_G48_SOURCES = tuple(ASTM_G48_CPT_DATA[m]["source"] for m in _G48_MATERIALS)
+
+
+@lru_cache(maxsize=256)
+def _astm_g48_code(material_name: str) -> int:
+    """
+    Row of material_name in the flattened ASTM G48 table, or -1 if absent.
+
+    Resolution goes through get_cpt_from_astm (exact match, then substring)
+    once per name; later lookups are a cache hit plus an array index.
+    """
+    cpt_data = get_cpt_from_astm(material_name)
+    if cpt_data is None:
+        return -1
+    for code, material in enumerate(_G48_MATERIALS):
+        if ASTM_G48_CPT_DATA[material] is cpt_data:
+            return code
+    return -1
+
+
+# Susceptibility levels indexed by the risk codes of _localized_grid_kernel
+RISK_LEVELS = ("low", "moderate", "high", "critical")
+
+
+@njit(parallel=True, cache=True)
+def _localized_grid_kernel(
+    CPT, CCT, Cl_threshold, T, Cl, pH, gap_mm, current_density,
+    out_ir_drop, out_acidification, out_pitting_risk, out_crevice_risk,
+):
+    """
+    Tier 1 pitting and crevice risk codes for each point of a flattened grid.
+
+    Same rules as calculate_pitting_susceptibility and
+    calculate_crevice_susceptibility; results are written into the out_*
+    arrays (risk codes index RISK_LEVELS).
+    """
+    for i in prange(T.shape[0]):
+        margin_pit = CPT[i] - T[i]
+        if margin_pit > 20.0 and Cl[i] < Cl_threshold[i] * 0.5:
+            out_pitting_risk[i] = 0
+        elif margin_pit > 10.0 and Cl[i] < Cl_threshold[i]:
+            out_pitting_risk[i] = 1
+        elif margin_pit > 0 or Cl[i] < Cl_threshold[i] * 1.5:
+            out_pitting_risk[i] = 2
+        else:
+            out_pitting_risk[i] = 3
+
+        # Oldfield-Sutton simplified IR drop (seawater-scaled resistivity)
+        R_solution = 0.2 * (19000.0 / max(Cl[i], 100.0))
+        IR_drop = current_density * R_solution * (gap_mm[i] / 1000.0) * 10.0
+        delta_pH = min(2.0 + (IR_drop / 0.1) * 2.0, pH[i] - 2.0)
+        acidification = 10.0 ** delta_pH
+        out_ir_drop[i] = IR_drop
+        out_acidification[i] = acidification
+
+        margin_crev = CCT[i] - T[i]
+        if margin_crev > 15.0 and acidification < 10:
+            out_crevice_risk[i] = 0
+        elif margin_crev > 5.0 and acidification < 100:
+            out_crevice_risk[i] = 1
+        elif margin_crev > -5.0:
+            out_crevice_risk[i] = 2
+        else:
+            out_crevice_risk[i] = 3
+
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MaterialComposition:
     """
     Material composition for PREN calculation.
@@ -107,7 +199,7 @@ class MaterialComposition:
             PREN value (unitless)
         """
         if coeffs is None:
-            coeffs = PREN_COEFFS.get(self.grade_type, PREN_COEFFS["standard"])
+            return _pren(self.Cr, self.Mo, self.N, self.grade_type)
 
         pren = coeffs["a"] * self.Cr + coeffs["b"] * self.Mo + coeffs["c"] * self.N
         return pren
@@ -199,7 +291,8 @@ class LocalizedBackend:
 
     def __init__(self):
         """Initialize localized corrosion backend."""
-        pass
+        # Material name -> MaterialComposition (frozen, so safe to share)
+        self._composition_cache: Dict[str, MaterialComposition] = {}
 
     def calculate_pitting_susceptibility(
         self,
@@ -239,12 +332,12 @@ class LocalizedBackend:
         pren = material_comp.calculate_pren()
 
         # FIX BUG-013: Get CPT from ASTM G48 tabulated data
-        cpt_data = get_cpt_from_astm(material_name)
+        code = _astm_g48_code(material_name)
 
-        if cpt_data is not None:
+        if code >= 0:
             # Use ASTM G48 measured CPT
-            CPT = cpt_data["CPT_C"]
-            logger.info(f"Using ASTM G48 CPT for {material_name}: {CPT}°C (source: {cpt_data['source']})")
+            CPT = float(_CPT_TABLE[code])
+            logger.info(f"Using ASTM G48 CPT for {material_name}: {CPT}°C (source: {_G48_SOURCES[code]})")
         elif custom_cpt_correlation is not None:
             # Use custom correlation if provided
             cpt_corr = custom_cpt_correlation
@@ -286,6 +379,18 @@ class LocalizedBackend:
         else:
             interpretation = f"LOW RISK: T = {temperature_C}°C well below CPT = {CPT:.1f}°C (margin {margin_C:.1f}°C); Cl⁻ = {Cl_mg_L:.0f} mg/L < {Cl_threshold:.0f} mg/L"
 
+        # Without DO there is no E_mix, so return Tier 1 before any Tier 2
+        # imports or NRL Tafel/Arrhenius work (Tier 2 fields default to None)
+        if dissolved_oxygen_mg_L is None:
+            return PittingResult(
+                CPT_C=CPT,
+                PREN=pren,
+                Cl_threshold_mg_L=Cl_threshold,
+                susceptibility=susceptibility,
+                margin_C=margin_C,
+                interpretation=interpretation,
+            )
+
         # PHASE 3: Tier 2 Electrochemical Assessment (E_pit vs E_mix)
         # Only if dissolved_oxygen_mg_L provided and material in NRL database
         E_pit_VSCE = None
@@ -294,101 +399,100 @@ class LocalizedBackend:
         electrochemical_risk = None
         electrochemical_interpretation = None
 
-        if dissolved_oxygen_mg_L is not None:
-            # Check if material is in NRL database (HY80, HY100, SS316)
-            # Also support common aliases (316L, UNS codes)
-            nrl_materials = ["HY80", "HY100", "SS316"]
-
-            # Material alias mapping (per Codex recommendation)
-            material_aliases = {
-                "316L": "SS316",
-                "316": "SS316",
-                "UNS S31600": "SS316",
-                "UNS S31603": "SS316",  # 316L UNS
-                "HY-80": "HY80",
-                "HY-100": "HY100",
-            }
-
-            material_upper = material_name.upper()
-            # Map alias to canonical NRL name
-            material_nrl = material_aliases.get(material_upper, material_upper)
-
-            if material_nrl in nrl_materials:
-                try:
-                    # Import Tier 2 modules
-                    from utils.pitting_assessment import (
-                        calculate_pitting_potential,
-                        assess_pitting_risk_electrochemical,
-                    )
-                    from utils.redox_state import do_to_eh
-                    from utils.nrl_constants import C
-
-                    # Calculate E_pit using NRL Butler-Volmer pitting kinetics
-                    E_pit_VSCE, pit_details = calculate_pitting_potential(
-                        material_name=material_nrl,  # Use canonical NRL name
-                        temperature_C=temperature_C,
-                        chloride_mg_L=Cl_mg_L,
-                        pH=pH,
-                        i_threshold_A_cm2=1e-6,  # 1 µA/cm² threshold
-                    )
-
-                    # Calculate E_mix from DO using RedoxState
-                    Eh_VSHE, redox_warnings = do_to_eh(
-                        dissolved_oxygen_mg_L=dissolved_oxygen_mg_L,
-                        pH=pH,
-                        temperature_C=temperature_C,
-                    )
-                    # Convert SHE to SCE: E_SCE = E_SHE - 0.241 V
-                    E_mix_VSCE = Eh_VSHE - C.E_SHE_to_SCE
-
-                    # Assess electrochemical pitting risk
-                    electrochemical_risk, electrochemical_interpretation, electrochemical_margin_V = (
-                        assess_pitting_risk_electrochemical(E_mix_VSCE, E_pit_VSCE)
-                    )
-
-                    # Append RedoxState warnings to interpretation (per Codex recommendation)
-                    if redox_warnings:
-                        electrochemical_interpretation += f" [RedoxState: {redox_warnings[0]}]"
-
-                    logger.info(
-                        f"Tier 2 electrochemical pitting assessment for {material_name}: "
-                        f"E_pit = {E_pit_VSCE:.3f} V_SCE, E_mix = {E_mix_VSCE:.3f} V_SCE, "
-                        f"dE = {electrochemical_margin_V*1000:.0f} mV, Risk = {electrochemical_risk.upper()}"
-                    )
-
-                except ValueError as e:
-                    # Activation energy out of range (e.g., HY80 at seawater)
-                    logger.warning(
-                        f"Tier 2 electrochemical assessment failed for {material_name}: {str(e)}\n"
-                        f"Falling back to Tier 1 PREN/CPT only."
-                    )
-                    # Per Codex: Add explanation to electrochemical_interpretation
-                    electrochemical_interpretation = (
-                        f"Tier 2 unavailable: NRL coefficients out of valid range at "
-                        f"(Cl={Cl_mg_L:.0f} mg/L, T={temperature_C:.0f}°C, pH={pH:.1f}). "
-                        f"Use Tier 1 PREN/CPT assessment only."
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error in Tier 2 electrochemical assessment for {material_name}: {str(e)}\n"
-                        f"Falling back to Tier 1 PREN/CPT only."
-                    )
-                    # Per Codex: Add explanation to electrochemical_interpretation
-                    electrochemical_interpretation = (
-                        f"Tier 2 unavailable: Unexpected error during calculation. "
-                        f"Use Tier 1 PREN/CPT assessment only."
-                    )
-            else:
-                # Per Codex: Add explanation when material not in NRL database
+        # Check if material is in NRL database (HY80, HY100, SS316)
+        # Also support common aliases (316L, UNS codes)
+        nrl_materials = ["HY80", "HY100", "SS316"]
+
+        # Material alias mapping (per Codex recommendation)
+        material_aliases = {
+            "316L": "SS316",
+            "316": "SS316",
+            "UNS S31600": "SS316",
+            "UNS S31603": "SS316",  # 316L UNS
+            "HY-80": "HY80",
+            "HY-100": "HY100",
+        }
+
+        material_upper = material_name.upper()
+        # Map alias to canonical NRL name
+        material_nrl = material_aliases.get(material_upper, material_upper)
+
+        if material_nrl in nrl_materials:
+            try:
+                # Import Tier 2 modules
+                from utils.pitting_assessment import (
+                    calculate_pitting_potential,
+                    assess_pitting_risk_electrochemical,
+                )
+                from utils.redox_state import do_to_eh
+                from utils.nrl_constants import C
+
+                # Calculate E_pit using NRL Butler-Volmer pitting kinetics
+                E_pit_VSCE, pit_details = calculate_pitting_potential(
+                    material_name=material_nrl,  # Use canonical NRL name
+                    temperature_C=temperature_C,
+                    chloride_mg_L=Cl_mg_L,
+                    pH=pH,
+                    i_threshold_A_cm2=1e-6,  # 1 µA/cm² threshold
+                )
+
+                # Calculate E_mix from DO using RedoxState
+                Eh_VSHE, redox_warnings = do_to_eh(
+                    dissolved_oxygen_mg_L=dissolved_oxygen_mg_L,
+                    pH=pH,
+                    temperature_C=temperature_C,
+                )
+                # Convert SHE to SCE: E_SCE = E_SHE - 0.241 V
+                E_mix_VSCE = Eh_VSHE - C.E_SHE_to_SCE
+
+                # Assess electrochemical pitting risk
+                electrochemical_risk, electrochemical_interpretation, electrochemical_margin_V = (
+                    assess_pitting_risk_electrochemical(E_mix_VSCE, E_pit_VSCE)
+                )
+
+                # Append RedoxState warnings to interpretation (per Codex recommendation)
+                if redox_warnings:
+                    electrochemical_interpretation += f" [RedoxState: {redox_warnings[0]}]"
+
                 logger.info(
-                    f"Material '{material_name}' not in NRL database (HY80, HY100, SS316). "
-                    f"Tier 2 electrochemical assessment not available. Using Tier 1 PREN/CPT only."
+                    f"Tier 2 electrochemical pitting assessment for {material_name}: "
+                    f"E_pit = {E_pit_VSCE:.3f} V_SCE, E_mix = {E_mix_VSCE:.3f} V_SCE, "
+                    f"dE = {electrochemical_margin_V*1000:.0f} mV, Risk = {electrochemical_risk.upper()}"
+                )
+
+            except ValueError as e:
+                # Activation energy out of range (e.g., HY80 at seawater)
+                logger.warning(
+                    f"Tier 2 electrochemical assessment failed for {material_name}: {str(e)}\n"
+                    f"Falling back to Tier 1 PREN/CPT only."
+                )
+                # Per Codex: Add explanation to electrochemical_interpretation
+                electrochemical_interpretation = (
+                    f"Tier 2 unavailable: NRL coefficients out of valid range at "
+                    f"(Cl={Cl_mg_L:.0f} mg/L, T={temperature_C:.0f}°C, pH={pH:.1f}). "
+                    f"Use Tier 1 PREN/CPT assessment only."
+                )
+            except Exception as e:
+                logger.error(
+                    f"Unexpected error in Tier 2 electrochemical assessment for {material_name}: {str(e)}\n"
+                    f"Falling back to Tier 1 PREN/CPT only."
                 )
+                # Per Codex: Add explanation to electrochemical_interpretation
                 electrochemical_interpretation = (
-                    f"Tier 2 unavailable: Material '{material_name}' not in NRL database "
-                    f"(supported: HY80, HY100, SS316, and aliases 316/316L/UNS S31600). "
+                    f"Tier 2 unavailable: Unexpected error during calculation. "
                     f"Use Tier 1 PREN/CPT assessment only."
                 )
+        else:
+            # Per Codex: Add explanation when material not in NRL database
+            logger.info(
+                f"Material '{material_name}' not in NRL database (HY80, HY100, SS316). "
+                f"Tier 2 electrochemical assessment not available. Using Tier 1 PREN/CPT only."
+            )
+            electrochemical_interpretation = (
+                f"Tier 2 unavailable: Material '{material_name}' not in NRL database "
+                f"(supported: HY80, HY100, SS316, and aliases 316/316L/UNS S31600). "
+                f"Use Tier 1 PREN/CPT assessment only."
+            )
 
         return PittingResult(
             # Tier 1: PREN/CPT (always present)
@@ -436,11 +540,11 @@ class LocalizedBackend:
         Per Codex: Simplified Oldfield-Sutton for IR drop iteration
         """
         # BUG-017 fix: Get CCT from ASTM G48 tabulated data
-        cpt_data = get_cpt_from_astm(material_name)
-        if cpt_data is not None and "CCT_C" in cpt_data:
-            CCT = cpt_data["CCT_C"]  # ASTM G48-11 measured CCT
-            CPT = cpt_data["CPT_C"]  # Also get CPT for reference
-            logger.info(f"Using ASTM G48 CCT: {CCT}°C (source: {cpt_data['source']})")
+        code = _astm_g48_code(material_name)
+        if code >= 0 and not math.isnan(_CCT_TABLE[code]):
+            CCT = float(_CCT_TABLE[code])  # ASTM G48-11 measured CCT
+            CPT = float(_CPT_TABLE[code])  # Also get CPT for reference
+            logger.info(f"Using ASTM G48 CCT: {CCT}°C (source: {_G48_SOURCES[code]})")
         else:
             # Fallback: CCT is typically CPT - 10 to 20°C (more aggressive than pitting)
             pren = material_comp.calculate_pren()
@@ -540,8 +644,8 @@ class LocalizedBackend:
         Per Codex: Separate pitting vs crevice outputs, shared Cl⁻ threshold logic
         Phase 3: Dual-Tier pitting (Tier 1 PREN/CPT + optional Tier 2 E_pit/E_mix)
         """
-        # Get material composition from database
-        material_comp = self._get_material_composition(material)
+        # Get material composition from database (resolved once per material)
+        material_comp = self._cached_composition(material)
 
         # Calculate pitting susceptibility (Tier 1 + optional Tier 2)
         pitting_result = self.calculate_pitting_susceptibility(
@@ -572,6 +676,104 @@ class LocalizedBackend:
             overall_risk=overall_risk,
         )
 
+    def calculate_localized_grid(
+        self,
+        materials,
+        temperature_C,
+        Cl_mg_L,
+        pH=7.0,
+        crevice_gap_mm=0.1,
+        current_density_A_per_m2: float = 1e-4,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Tier 1 pitting and crevice assessment over a broadcast parameter grid.
+
+        Vectorized counterpart of calculate_localized_corrosion for
+        material x temperature x chloride x pH sweeps: CPT/CCT and the
+        ISO 18070 threshold are resolved once per material, then a
+        numba-parallel kernel (plain Python without numba) applies the
+        susceptibility rules point by point. Tier 2 and the text
+        interpretations are not produced.
+
+        Args:
+            materials: Material name(s), array-like of str
+            temperature_C: Operating temperature(s) (°C)
+            Cl_mg_L: Chloride concentration(s) (mg/L)
+            pH: Solution pH value(s)
+            crevice_gap_mm: Crevice gap width(s) (mm)
+            current_density_A_per_m2: Corrosion current density (A/m²)
+
+        Returns:
+            Dict of arrays shaped like the broadcast inputs: CPT_C, CCT_C,
+            Cl_threshold_mg_L, pitting_margin_C, crevice_margin_C, IR_drop_V,
+            acidification_factor, pitting_susceptibility,
+            crevice_susceptibility and overall_risk (the last three as
+            RISK_LEVELS strings)
+        """
+        materials, T, Cl, pH, gap = np.broadcast_arrays(
+            np.asarray(materials, dtype=object),
+            np.asarray(temperature_C, dtype=float),
+            np.asarray(Cl_mg_L, dtype=float),
+            np.asarray(pH, dtype=float),
+            np.asarray(crevice_gap_mm, dtype=float),
+        )
+        shape = T.shape
+        materials = materials.ravel()
+        T, Cl, pH, gap = (np.ascontiguousarray(a).ravel() for a in (T, Cl, pH, gap))
+
+        n = T.size
+        CPT = np.empty(n)
+        CCT = np.empty(n)
+        Cl_threshold = np.empty(n)
+        for material in set(materials):
+            mask = materials == material
+            CPT[mask], CCT[mask] = self._cpt_cct(material)
+            Cl_threshold[mask] = get_chloride_threshold(material, T[mask], pH[mask])
+
+        IR_drop = np.empty(n)
+        acidification = np.empty(n)
+        pitting_risk = np.empty(n, dtype=np.int64)
+        crevice_risk = np.empty(n, dtype=np.int64)
+        _localized_grid_kernel(
+            CPT, CCT, Cl_threshold, T, Cl, pH, gap, float(current_density_A_per_m2),
+            IR_drop, acidification, pitting_risk, crevice_risk,
+        )
+
+        levels = np.array(RISK_LEVELS)
+        return {
+            "CPT_C": CPT.reshape(shape),
+            "CCT_C": CCT.reshape(shape),
+            "Cl_threshold_mg_L": Cl_threshold.reshape(shape),
+            "pitting_margin_C": (CPT - T).reshape(shape),
+            "crevice_margin_C": (CCT - T).reshape(shape),
+            "IR_drop_V": IR_drop.reshape(shape),
+            "acidification_factor": acidification.reshape(shape),
+            "pitting_susceptibility": levels[pitting_risk].reshape(shape),
+            "crevice_susceptibility": levels[crevice_risk].reshape(shape),
+            "overall_risk": levels[np.maximum(pitting_risk, crevice_risk)].reshape(shape),
+        }
+
+    def _cpt_cct(self, material: str) -> Tuple[float, float]:
+        """
+        (CPT, CCT) in °C for material, as the scalar pitting/crevice paths pick them.
+
+        ASTM G48 values where tabulated, otherwise the PREN correlation for
+        CPT and CPT - 15°C for CCT.
+        """
+        code = _astm_g48_code(material)
+        comp = self._cached_composition(material)
+        cpt_corr = CPT_CORRELATIONS.get(comp.grade_type, CPT_CORRELATIONS["austenitic"])
+        CPT_estimate = cpt_corr["m"] * comp.calculate_pren() + cpt_corr["b"]
+
+        if code < 0:
+            logger.warning(f"Material {material} not in ASTM G48; using PREN estimates for CPT/CCT")
+        CPT = float(_CPT_TABLE[code]) if code >= 0 else CPT_estimate
+        if code >= 0 and not math.isnan(_CCT_TABLE[code]):
+            CCT = float(_CCT_TABLE[code])
+        else:
+            CCT = CPT_estimate - 15.0
+        return CPT, CCT
+
     def _get_base_chloride_threshold(self, pren: float) -> float:
         """
         Get base chloride threshold from PREN.
@@ -583,6 +785,14 @@ class LocalizedBackend:
         Cl_threshold = 10.0 ** ((pren - 10.0) / 10.0)
         return max(Cl_threshold, 10.0)  # Minimum 10 mg/L
 
+    def _cached_composition(self, material: str) -> MaterialComposition:
+        """_get_material_composition, resolved once per material name."""
+        material_comp = self._composition_cache.get(material)
+        if material_comp is None:
+            material_comp = self._get_material_composition(material)
+            self._composition_cache[material] = material_comp
+        return material_comp
+
     def _get_material_composition(self, material: str) -> MaterialComposition:
         """
         Get material composition from authoritative UNS database.
@@ -13,7 +13,11 @@ All data is from authoritative published standards, NOT simplified heuristics.
 Per Codex Review (2025-10-18): Replace placeholder data with real coefficients.
 """
 
-from typing import Dict, Optional, Tuple
+import math
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
 
 # Import CSV loaders and MaterialComposition dataclass
 from .csv_loaders import (
@@ -170,23 +174,14 @@ def get_cpt_from_astm(material_name: str) -> Optional[Dict]:
     return None
 
 
-def get_chloride_threshold(
-    material_name: str,
-    temperature_C: float = 25.0,
-    pH: float = 7.0,
-) -> float:
+@lru_cache(maxsize=256)
+def _chloride_threshold_params(material_name: str) -> Optional[Tuple[float, float]]:
     """
-    Get chloride threshold from ISO 18070/NORSOK data.
-
-    Args:
-        material_name: Material designation
-        temperature_C: Temperature (°C)
-        pH: Solution pH
+    (Cl_25C, k) for material_name, or None if it has no ISO 18070 threshold.
 
-    Returns:
-        Chloride threshold (mg/L)
+    Resolving the name scans CHLORIDE_THRESHOLD_25C and the materials
+    database; memoized so (T, pH) sweeps pay that once per material.
     """
-    # Get base threshold at 25°C
     material_upper = material_name.upper()
     Cl_25C = None
     for key in CHLORIDE_THRESHOLD_25C:
@@ -195,7 +190,7 @@ def get_chloride_threshold(
             break
 
     if Cl_25C is None:
-        return 100.0  # Conservative fallback
+        return None
 
     # Get material composition for grade type
     comp = get_material_data(material_name)
@@ -204,8 +199,37 @@ def get_chloride_threshold(
     else:
         k = CHLORIDE_TEMP_COEFFICIENT.get(comp.grade_type, 0.05)
 
+    return Cl_25C, k
+
+
+def get_chloride_threshold(
+    material_name: str,
+    temperature_C: Union[float, np.ndarray] = 25.0,
+    pH: Union[float, np.ndarray] = 7.0,
+) -> Union[float, np.ndarray]:
+    """
+    Get chloride threshold from ISO 18070/NORSOK data.
+
+    Args:
+        material_name: Material designation
+        temperature_C: Temperature (°C), scalar or array
+        pH: Solution pH, scalar or array (broadcast against temperature_C)
+
+    Returns:
+        Chloride threshold (mg/L); an array if temperature_C or pH is one
+    """
+    params = _chloride_threshold_params(material_name)
+    if params is None:
+        return 100.0  # Conservative fallback
+    Cl_25C, k = params
+
+    if np.ndim(temperature_C) or np.ndim(pH):
+        # Same formula as below on numpy arrays for (T, pH) grids
+        T = np.asarray(temperature_C, dtype=float)
+        pH_factor = np.clip((np.asarray(pH, dtype=float) - 4.0) / 6.0 + 0.5, 0.5, 1.5)
+        return Cl_25C * np.exp(-k * (T - 25.0)) * pH_factor
+
     # Temperature correction: Cl(T) = Cl_25C × exp(-k × (T - 25))
-    import math
     delta_T = temperature_C - 25.0
     Cl_T = Cl_25C * math.exp(-k * delta_T)
 
@@ -27,11 +27,14 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path(__file__).parent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MaterialComposition:
     """
     Material composition from CSV file.
 
+    Frozen: instances live in the shared materials cache and are handed to
+    every caller of get_material_data.
+
     Source: materials_compositions.csv (ASTM A240, B443, B152, etc.)
     """
     UNS: str
@@ -0,0 +1,553 @@
+"""
+Shared pytest fixtures for the corrosion engineering MCP test suite.
+
+Session-scoped fixtures here wrap expensive, deterministic loaders so that
+each authoritative data file is parsed once per test session instead of
+once per test.
+
+Under pytest-xdist every worker process builds its own session fixtures
+(and PHREEQCBackend its own thread-local PHREEQC instance), so nothing
+mutable is shared between workers; file-backed caches go under per-worker
+temp dirs.
+"""
+
+import asyncio
+import atexit
+import os
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Persist numba's compiled kernels under the (git-ignored) pytest cache so
+# repeated runs load machine code instead of recompiling. Must be set before
+# any @njit module is imported.
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR",
+    str(Path(__file__).resolve().parent.parent / ".pytest_cache" / "numba"),
+)
+
+# Importing utils.material_database installs a sqlite requests-cache; point it
+# at a per-process (so per xdist worker) temp dir before anything imports it,
+# so test runs never write responses into the repo's .cache/.
+_HTTP_CACHE_DIR = tempfile.mkdtemp(prefix="corrosion_mcp_http_cache_")
+atexit.register(shutil.rmtree, _HTTP_CACHE_DIR, ignore_errors=True)
+os.environ["CORROSION_MCP_CACHE_DIR"] = _HTTP_CACHE_DIR
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
+
+from data.csv_loaders import (  # noqa: E402
+    load_chloride_thresholds_from_csv,
+    load_cpt_data_from_csv,
+    load_galvanic_series_from_csv,
+    load_materials_from_csv,
+    load_orr_diffusion_limits_from_csv,
+    load_temperature_coefficients_from_csv,
+)
+
+# ============================================================================
+# Command-line options
+# ============================================================================
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help=(
+            "Skip tests marked slow (PHREEQC solves) and use coarse Pourbaix "
+            "grids for a quick inner-loop run"
+        ),
+    )
+
+
+def pytest_configure(config):
+    """
+    Import the heavy dependencies and tool packages once per (worker) process.
+
+    Done before collection so their init cost is paid up front rather than
+    by whichever test module happens to import them first. Any of them may
+    be missing; the tests that need it fail on their own import instead.
+    """
+    # Third-party stacks plus the project packages most test modules import
+    # (tools.mechanistic pulls in the NORSOK, ORR and localized-corrosion
+    # stacks). Guarded so a missing dependency only fails the tests that
+    # need it, not collection.
+    for module in (
+        "fluids",
+        "ht",
+        "numpy",
+        "numba",
+        "phreeqpython",
+        "tools.mechanistic",
+        "utils.nrl_materials",
+    ):
+        try:
+            __import__(module)
+        except ImportError:
+            pass
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--fast"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test skipped by --fast")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """
+    Run pytest-asyncio tests on uvloop where it is installed.
+
+    uvloop (libuv) schedules callbacks with far less per-await overhead
+    than the stdlib loop, which the FastMCP in-memory round-trips lean on.
+    Falls back to the stdlib loop on Windows or without uvloop. Optional
+    hook: older pytest-asyncio releases without it keep their default loop.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            return {"uvloop": uvloop.new_event_loop}
+        except ImportError:
+            pass
+    return {"asyncio": asyncio.new_event_loop}
+
+
+# ============================================================================
+# Test isolation
+# ============================================================================
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_jit_kernels():
+    """
+    Call each @njit kernel once so tests never time its compilation.
+
+    Without numba the kernels are plain Python and this is a few cheap calls.
+    """
+    from core.galvanic_backend import _solve_mixed_potential_nb
+    from core.localized_backend import LocalizedBackend
+    from utils.fast_ph_solver import _newton_pH, ph_residual_and_jac
+    from utils.mass_transfer import (
+        calculate_sherwood_number_flat_plate,
+        calculate_sherwood_number_laminar_pipe,
+        calculate_sherwood_number_turbulent_pipe,
+    )
+    from utils.nrl_electrochemical_reactions import _bv_branches, _bv_current
+
+    calculate_sherwood_number_laminar_pipe(1200.0, 600.0, 36.0, 0.05)
+    calculate_sherwood_number_turbulent_pipe(50000.0, 600.0)
+    calculate_sherwood_number_flat_plate(1e4, 600.0, regime="laminar")
+    calculate_sherwood_number_flat_plate(1e6, 600.0, regime="turbulent")
+    _solve_mixed_potential_nb(
+        -0.44, 1e-3, 0.06, 0.401, 1e-7, -0.12, 1.0, -1.0, -0.44, 0.401, 1e-6, 100
+    )
+    LocalizedBackend().calculate_localized_grid(["316L"], [25.0], [100.0])
+    eta = np.linspace(-0.5, 0.5, 4)
+    _bv_branches(eta, 1e-9, 1e-12, 0.5, 38.9)
+    _bv_current(eta, 1e-9, 1e-12, 0.5, 38.9, np.full(4, -1e-4))
+    ph_residual_and_jac(7.0, 1e-3, 1e-3, 4.45e-7, 4.69e-11, 1e-14)
+    _newton_pH(7.0, 1e-3, 1e-3, 4.45e-7, 4.69e-11, 1e-14)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_data_caches():
+    """
+    Fill the module-level coefficient caches before the first test runs.
+
+    The NRL coefficient table is read once per process; loading it here
+    keeps that file I/O out of whichever test happens to build a material
+    first.
+    """
+    from utils.nrl_materials import _load_all_coefficients
+
+    _load_all_coefficients()
+
+
+# ============================================================================
+# CSV data (data/*.csv)
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def materials_csv():
+    """Material compositions from materials_compositions.csv"""
+    return load_materials_from_csv()
+
+
+@pytest.fixture(scope="session")
+def cpt_csv():
+    """ASTM G48 CPT/CCT data from astm_g48_cpt_data.csv"""
+    return load_cpt_data_from_csv()
+
+
+@pytest.fixture(scope="session")
+def galvanic_csv():
+    """ASTM G82 galvanic series (V vs SCE) from astm_g82_galvanic_series.csv"""
+    return load_galvanic_series_from_csv()
+
+
+@pytest.fixture(scope="session")
+def galvanic_index(galvanic_csv):
+    """
+    Inverted index of the galvanic series by lower-cased name token.
+
+    Each alphanumeric token of a material name ("stainless", "316",
+    "zinc", ...) maps to the potential (V vs SCE) of the first material in
+    CSV order that contains it, so tests can use a dict lookup instead of
+    scanning every key.
+    """
+    index = {}
+    for material, potential in galvanic_csv.items():
+        for token in re.findall(r"[A-Za-z0-9]+", material):
+            index.setdefault(token.lower(), potential)
+    return index
+
+
+@pytest.fixture(scope="session")
+def orr_limits_csv():
+    """ORR diffusion limits (A/m²) from orr_diffusion_limits.csv"""
+    return load_orr_diffusion_limits_from_csv()
+
+
+@pytest.fixture(scope="session")
+def chloride_thresholds_csv():
+    """ISO 18070 chloride thresholds (mg/L) from iso18070_chloride_thresholds.csv"""
+    return load_chloride_thresholds_from_csv()
+
+
+@pytest.fixture(scope="session")
+def temp_coefficients_csv():
+    """ISO 18070 temperature coefficients (/°C) from iso18070_temperature_coefficients.csv"""
+    return load_temperature_coefficients_from_csv()
+
+
+@pytest.fixture(scope="session")
+def external_manifest():
+    """
+    Every path under external/ (vendored NRL data and references).
+
+    Returns:
+        Frozenset of POSIX paths relative to external/, directories included,
+        e.g. "nrl_coefficients/HY80ORRCoeffs.csv"
+    """
+    root = Path(__file__).resolve().parent.parent / "external"
+    return frozenset(path.relative_to(root).as_posix() for path in root.rglob("*"))
+
+
+# ============================================================================
+# Backends and databases
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def echem_db():
+    """
+    ElectrochemistryDatabase on the shipped electrochemistry.yaml.
+
+    Shared across the session; tests that assert on its result cache should
+    build their own instance instead.
+    """
+    from utils.electrochemistry_db import ElectrochemistryDatabase
+
+    return ElectrochemistryDatabase()
+
+
+@pytest.fixture(scope="session")
+def material_db():
+    """
+    AuthoritativeMaterialDatabase shared by the read-only lookup tests.
+
+    Its sources load lazily once for the session; tests that assert on
+    lazy-loading state or cache on/off semantics build their own instance.
+    """
+    from utils.material_database import AuthoritativeMaterialDatabase
+
+    return AuthoritativeMaterialDatabase(use_cache=True)
+
+
+@pytest.fixture
+def mocked_sources(monkeypatch):
+    """
+    Stub the remote sources behind AuthoritativeMaterialDatabase.
+
+    Replaces pd.read_xml (USNRL galvanic XML) with an empty-frame mock and
+    requests.get (KittyCAD JSON) with a mock returning {}; tests override
+    return_value / side_effect as needed.
+
+    Yields:
+        (read_xml mock, requests.get mock)
+    """
+    from unittest.mock import MagicMock
+
+    import pandas as pd
+
+    fake_xml = MagicMock(return_value=pd.DataFrame({"Material": [], "Potential": []}))
+    fake_get = MagicMock()
+    fake_get.return_value.json.return_value = {}
+
+    monkeypatch.setattr("utils.material_database.pd.read_xml", fake_xml)
+    monkeypatch.setattr("utils.material_database.requests.get", fake_get)
+    yield fake_xml, fake_get
+
+
+@pytest.fixture(scope="session")
+def galv_backend():
+    """
+    GalvanicBackend shared across the session.
+
+    Its polarization-curve cache is warmed here for the materials the
+    galvanic tests couple, so the NRL/ASTM G82 lookups run once.
+    """
+    from core.galvanic_backend import GalvanicBackend
+
+    backend = GalvanicBackend()
+    for material in ("carbon steel", "zinc"):
+        backend._get_curve("anodic", material, 25.0, "seawater")
+    backend._get_curve("cathodic", "316L", 25.0, "seawater")
+    return backend
+
+
+@pytest.fixture(scope="session")
+def cs_316l_curves():
+    """
+    (anodic, cathodic) polarization curves for carbon steel coupled to 316L.
+
+    Carbon steel Fe oxidation against ORR on 316L in seawater; the curves
+    are frozen, so sharing them across the session is safe.
+    """
+    from core.galvanic_backend import PolarizationCurve
+
+    anodic = PolarizationCurve(
+        material="carbon steel", reaction="Fe_oxidation",
+        E_corr=-0.44, i0=1e-3, ba=0.06, bc=-0.12,
+    )
+    cathodic = PolarizationCurve(
+        material="316L", reaction="ORR",
+        E_corr=0.401, i0=1e-7, ba=0.12, bc=-0.12,
+    )
+    return anodic, cathodic
+
+
+# ============================================================================
+# Galvanic couples
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def galvanic_cache():
+    """Session-wide store of galvanic predictions, filled by galvanic_couple."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def galvanic_couple(galvanic_cache):
+    """
+    predict_galvanic_corrosion memoized in galvanic_cache.
+
+    Keyed on the full set of keyword arguments, so a couple that several
+    tests evaluate under the same conditions and area ratio (material
+    construction, both polarization curves and the mixed-potential solve)
+    is only computed once per session. Results are shared: tests must not
+    mutate them.
+    """
+    from tools.mechanistic.predict_galvanic_corrosion import predict_galvanic_corrosion
+
+    def _predict(**kwargs):
+        key = tuple(sorted(kwargs.items()))
+        if key not in galvanic_cache:
+            galvanic_cache[key] = predict_galvanic_corrosion(**kwargs)
+        return galvanic_cache[key]
+
+    return _predict
+
+
+# ============================================================================
+# Pourbaix diagrams
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def pourbaix_grid(pytestconfig):
+    """
+    Pourbaix grid_points for diagram tests.
+
+    Cost is quadratic in grid_points, so --fast drops from the default 50
+    to 20; full runs keep the default boundary resolution.
+    """
+    return 20 if pytestconfig.getoption("--fast") else 50
+
+
+@pytest.fixture(scope="session")
+def fe_pourbaix(pourbaix_grid):
+    """
+    Fe Pourbaix diagrams at 25°C and 80°C on the pourbaix_grid resolution.
+
+    Returns:
+        Dict mapping temperature (°C) to the calculate_pourbaix result.
+        Results are shared: tests must not mutate them.
+    """
+    from tools.chemistry.calculate_pourbaix import calculate_pourbaix
+
+    return {
+        T: calculate_pourbaix(element="Fe", temperature_C=T, grid_points=pourbaix_grid)
+        for T in (25.0, 80.0)
+    }
+
+
+# ============================================================================
+# MCP server
+# ============================================================================
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_client():
+    """
+    In-memory FastMCP client connected to the server for the whole session.
+
+    The handshake and tool discovery run once; tests using it must run on
+    the session event loop (@pytest.mark.asyncio(loop_scope="session")).
+    """
+    from fastmcp import Client
+
+    from server import mcp
+
+    async with Client(mcp) as client:
+        yield client
+
+
+# ============================================================================
+# Localized corrosion
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def loc_backend():
+    """Stateless LocalizedBackend shared across the session"""
+    from core.localized_backend import LocalizedBackend
+
+    return LocalizedBackend()
+
+
+@pytest.fixture(scope="session")
+def comp_316L():
+    """316L: Cr 16.5, Mo 2.0, N 0.05 (austenitic, PREN ≈ 23.9)"""
+    from core.localized_backend import MaterialComposition
+
+    return MaterialComposition(Cr=16.5, Mo=2.0, N=0.05, grade_type="austenitic")
+
+
+@pytest.fixture(scope="session")
+def comp_2205():
+    """2205: Cr 22.0, Mo 3.0, N 0.17 (duplex, PREN ≈ 37.0)"""
+    from core.localized_backend import MaterialComposition
+
+    return MaterialComposition(Cr=22.0, Mo=3.0, N=0.17, grade_type="duplex")
+
+
+@pytest.fixture(scope="session")
+def comp_304():
+    """304: Cr 18.0, Mo 0.0, N 0.05 (austenitic, PREN ≈ 18.8)"""
+    from core.localized_backend import MaterialComposition
+
+    return MaterialComposition(Cr=18.0, Mo=0.0, N=0.05, grade_type="austenitic")
+
+
+@pytest.fixture(scope="session")
+def comp_254SMO():
+    """254SMO: Cr 20.0, Mo 6.0, N 0.20 (superaustenitic, PREN ≈ 43.0)"""
+    from core.localized_backend import MaterialComposition
+
+    return MaterialComposition(Cr=20.0, Mo=6.0, N=0.20, grade_type="superaustenitic")
+
+
+@pytest.fixture(scope="session")
+def localized_cache():
+    """Session-wide store of localized corrosion results, filled by localized_corrosion."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def localized_corrosion(localized_cache):
+    """
+    calculate_localized_corrosion memoized in localized_cache.
+
+    Keyed on the full set of keyword arguments, so conditions shared by
+    several tests (e.g. SS316 in aerated seawater) run the Tier 1 and
+    Tier 2 assessment once per session. Results are shared: tests must not
+    mutate them.
+    """
+    from tools.mechanistic.localized_corrosion import calculate_localized_corrosion
+
+    def _assess(**kwargs):
+        key = tuple(sorted(kwargs.items()))
+        if key not in localized_cache:
+            localized_cache[key] = calculate_localized_corrosion(**kwargs)
+        return localized_cache[key]
+
+    return _assess
+
+
+# ============================================================================
+# PHREEQC speciation
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def speciation_cache():
+    """
+    Session-wide store of speciation results, filled by the speciate fixture.
+
+    Populated lazily (solve only on a cache miss) so a given water
+    composition is only speciated once per session.
+    """
+    return {}
+
+
+@pytest.fixture(scope="session")
+def speciate(speciation_cache):
+    """
+    run_phreeqc_speciation memoized in speciation_cache.
+
+    Keyed on the canonical JSON of the ion recipe (dict or JSON string) and
+    keyword arguments, so identical recipes are only solved once per
+    session. Results are shared: tests must not mutate them.
+    """
+    import json
+
+    from tools.chemistry.run_speciation import run_phreeqc_speciation
+
+    def _speciate(ions_json, **kwargs):
+        ions = json.loads(ions_json) if isinstance(ions_json, str) else ions_json
+        key = json.dumps({"ions": ions, **kwargs}, sort_keys=True)
+        if key not in speciation_cache:
+            speciation_cache[key] = run_phreeqc_speciation(ions, **kwargs)
+        return speciation_cache[key]
+
+    return _speciate
+
+
+# Hard water used for calcite temperature-sensitivity checks (mg/L)
+CALCITE_TEST_WATER = {
+    "Ca2+": 120.0,
+    "HCO3-": 250.0,
+    "Cl-": 150.0,
+    "Na+": 100.0,
+}
+
+
+@pytest.fixture(scope="session")
+def calcite_si():
+    """
+    Calcite saturation index of CALCITE_TEST_WATER at 25°C and 60°C.
+
+    Returns:
+        Dict mapping temperature (°C) to SI(Calcite)
+    """
+    from tools.chemistry.run_speciation import run_phreeqc_speciation
+
+    return {
+        T: run_phreeqc_speciation(CALCITE_TEST_WATER, temperature_C=T)[
+            "saturation_indices"
+        ].get("Calcite", -999)
+        for T in (25.0, 60.0)
+    }
@@ -10,11 +10,6 @@ Target coverage: ≥85% (per Codex guidance)
 import pytest
 import threading
 import json
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.chemistry_backend import (
     PHREEQCBackend,
@@ -105,6 +100,27 @@ class TestChargeBalance:
         balance = calculate_charge_balance(ions)
         assert abs(balance) < 5.0  # Seawater should be well-balanced
 
+    def test_charge_balance_matches_per_ion_meq(self):
+        """Test the vectorized balance equals summing mg_L_to_meq_L per ion"""
+        ions = {
+            "Na+": 10770.0,
+            "Mg2+": 1290.0,
+            "Ca2+": 412.0,
+            "Cl-": 19350.0,
+            "SO4-2": 2712.0,
+            "PO4-3": 5.0,
+        }
+
+        meq = {
+            ion: mg_L_to_meq_L(c, VALID_IONS[ion]["mw"], VALID_IONS[ion]["charge"])
+            for ion, c in ions.items()
+        }
+        cations = sum(v for ion, v in meq.items() if VALID_IONS[ion]["charge"] > 0)
+        anions = sum(v for ion, v in meq.items() if VALID_IONS[ion]["charge"] < 0)
+        expected = (cations - anions) / (cations + anions) * 100.0
+
+        assert calculate_charge_balance(ions) == pytest.approx(expected, rel=1e-12)
+
     def test_validate_water_chemistry_pass(self):
         """Test validation passes for balanced water"""
         ions = {
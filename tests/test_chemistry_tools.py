@@ -11,11 +11,6 @@ Target coverage: ≥85%
 
 import pytest
 import json
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tools.chemistry.run_speciation import run_phreeqc_speciation
 from tools.chemistry.predict_scaling import predict_scaling_tendency
@@ -25,14 +20,14 @@ from tools.chemistry.langelier_index import calculate_langelier_index
 class TestRunPhreeqcSpeciation:
     """Test run_phreeqc_speciation MCP tool"""
 
-    def test_basic_speciation(self):
+    def test_basic_speciation(self, speciate):
         """Test basic speciation with simple NaCl solution"""
         ions_json = json.dumps({
             "Na+": 1000.0,
             "Cl-": 1545.0,
         })
 
-        result = run_phreeqc_speciation(ions_json, temperature_C=25.0)
+        result = speciate(ions_json, temperature_C=25.0)
 
         # Check all required fields
         assert "pH" in result
@@ -50,19 +45,19 @@ class TestRunPhreeqcSpeciation:
         assert result["temperature_C"] == 25.0
         assert result["ionic_strength_M"] > 0.0
 
-    def test_speciation_with_pH(self):
+    def test_speciation_with_pH(self, speciate):
         """Test speciation with specified pH"""
         ions_json = json.dumps({
             "Na+": 1000.0,
             "Cl-": 1545.0,
         })
 
-        result = run_phreeqc_speciation(ions_json, temperature_C=25.0, pH=7.5)
+        result = speciate(ions_json, temperature_C=25.0, pH=7.5)
 
         # pH should be close to specified value
         assert abs(result["pH"] - 7.5) < 0.2
 
-    def test_speciation_seawater(self):
+    def test_speciation_seawater(self, speciate):
         """Test speciation for seawater composition"""
         ions_json = json.dumps({
             "Na+": 10770.0,
@@ -74,7 +69,7 @@ class TestRunPhreeqcSpeciation:
             "HCO3-": 142.0,
         })
 
-        result = run_phreeqc_speciation(ions_json, temperature_C=25.0)
+        result = speciate(ions_json, temperature_C=25.0)
 
         # Seawater pH can vary (~7.0-8.3 without atmosphere equilibration)
         assert 6.5 <= result["pH"] <= 8.5
@@ -96,6 +91,20 @@ class TestRunPhreeqcSpeciation:
         with pytest.raises(ValueError, match="must be a JSON object"):
             run_phreeqc_speciation("[1, 2, 3]", temperature_C=25.0)
 
+    def test_dict_input_matches_json_input(self):
+        """Test that a native dict gives the same result as its JSON encoding"""
+        ions = {"Na+": 1000.0, "Cl-": 1545.0, "Ca2+": 100.0, "HCO3-": 200.0}
+
+        result_dict = run_phreeqc_speciation(ions, temperature_C=25.0)
+        result_json = run_phreeqc_speciation(json.dumps(ions), temperature_C=25.0)
+
+        assert result_dict == result_json
+
+    def test_non_dict_input(self):
+        """Test error handling for non-dict native input"""
+        with pytest.raises(ValueError, match="must be a JSON object"):
+            run_phreeqc_speciation([1, 2, 3], temperature_C=25.0)
+
     def test_charge_balance_validation(self):
         """Test charge balance validation catches imbalanced water"""
         ions_json = json.dumps({
@@ -114,19 +123,19 @@ class TestRunPhreeqcSpeciation:
         # Check charge balance is reported
         assert abs(result["charge_balance_percent"]) > 10.0
 
-    def test_interpretation_acidic(self):
+    def test_interpretation_acidic(self, speciate):
         """Test interpretation for acidic water"""
         ions_json = json.dumps({
             "Na+": 100.0,
             "Cl-": 154.5,
         })
 
-        result = run_phreeqc_speciation(ions_json, temperature_C=25.0, pH=4.0)
+        result = speciate(ions_json, temperature_C=25.0, pH=4.0)
 
         # Should indicate corrosive
         assert "acidic" in result["interpretation"].lower() or "corrosive" in result["interpretation"].lower()
 
-    def test_interpretation_scaling(self):
+    def test_interpretation_scaling(self, speciate):
         """Test interpretation for scaling water"""
         ions_json = json.dumps({
             "Ca2+": 200.0,
@@ -136,7 +145,7 @@ class TestRunPhreeqcSpeciation:
             "Na+": 50.0,
         })
 
-        result = run_phreeqc_speciation(ions_json, temperature_C=25.0, pH=8.5)
+        result = speciate(ions_json, temperature_C=25.0, pH=8.5)
 
         # Should indicate scaling risk
         assert "scaling" in result["interpretation"].lower() or "alkaline" in result["interpretation"].lower()
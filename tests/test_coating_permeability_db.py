@@ -5,15 +5,11 @@ Tests hybrid YAML/semantic search approach, provenance tracking,
 regex parsing, and fallback behavior.
 """
 
+import io
 import pytest
-from unittest.mock import Mock, patch, mock_open
-from pathlib import Path
-import sys
+from unittest.mock import Mock, patch
 import yaml
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from utils.coating_permeability_db import CoatingPermeabilityDatabase
 
 
@@ -45,6 +41,11 @@ coatings:
 """
 
 
+def _open_stub(*args, **kwargs):
+    """Stand-in for builtins.open serving MOCK_YAML as a native file object"""
+    return io.StringIO(MOCK_YAML)
+
+
 class TestCoatingPermeabilityDatabase:
     """Test suite for CoatingPermeabilityDatabase"""
 
@@ -52,7 +53,7 @@ class TestCoatingPermeabilityDatabase:
         """Test YAML lookup for epoxy coating"""
         mock_yaml_data = yaml.safe_load(MOCK_YAML)
 
-        with patch('builtins.open', mock_open(read_data=MOCK_YAML)):
+        with patch('builtins.open', _open_stub):
             with patch('pathlib.Path.exists', return_value=True):
                 db = CoatingPermeabilityDatabase(semantic_search_function=None)
                 result = db.get_permeability("epoxy", temperature_C=25.0)
@@ -77,7 +78,7 @@ class TestCoatingPermeabilityDatabase:
 
     def test_cache_behavior(self):
         """Test that results are cached"""
-        with patch('builtins.open', mock_open(read_data=MOCK_YAML)):
+        with patch('builtins.open', _open_stub):
             with patch('pathlib.Path.exists', return_value=True):
                 db = CoatingPermeabilityDatabase()
 
@@ -103,7 +104,7 @@ class TestCoatingPermeabilityDatabase:
                 }
             ]
 
-        with patch('builtins.open', mock_open(read_data=MOCK_YAML)):
+        with patch('builtins.open', _open_stub):
             with patch('pathlib.Path.exists', return_value=True):
                 db = CoatingPermeabilityDatabase(semantic_search_function=mock_search)
 
@@ -185,7 +186,7 @@ class TestCoatingPermeabilityDatabase:
         def mock_search_empty(query, top_k=5):
             return []
 
-        with patch('builtins.open', mock_open(read_data=MOCK_YAML)):
+        with patch('builtins.open', _open_stub):
             with patch('pathlib.Path.exists', return_value=True):
                 db = CoatingPermeabilityDatabase(semantic_search_function=mock_search_empty)
 
@@ -199,7 +200,7 @@ class TestCoatingPermeabilityDatabase:
 
     def test_provenance_metadata_structure(self):
         """Test that provenance metadata has all required fields"""
-        with patch('builtins.open', mock_open(read_data=MOCK_YAML)):
+        with patch('builtins.open', _open_stub):
             with patch('pathlib.Path.exists', return_value=True):
                 db = CoatingPermeabilityDatabase()
                 result = db.get_permeability("epoxy", temperature_C=25.0)
@@ -216,7 +217,7 @@ class TestCoatingPermeabilityDatabase:
 
     def test_list_available_coatings(self):
         """Test listing all available coatings in YAML"""
-        with patch('builtins.open', mock_open(read_data=MOCK_YAML)):
+        with patch('builtins.open', _open_stub):
             with patch('pathlib.Path.exists', return_value=True):
                 db = CoatingPermeabilityDatabase()
                 available = db.list_available_coatings()
@@ -237,7 +238,7 @@ class TestCoatingPermeabilityDatabase:
 
     def test_semantic_search_with_no_function_configured(self):
         """Test fallback when semantic search not configured"""
-        with patch('builtins.open', mock_open(read_data=MOCK_YAML)):
+        with patch('builtins.open', _open_stub):
             with patch('pathlib.Path.exists', return_value=True):
                 db = CoatingPermeabilityDatabase(semantic_search_function=None)
 
@@ -13,169 +13,148 @@ Test cases:
 """
 
 import pytest
-import json
-from pathlib import Path
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Skip the whole module in one decision when PHREEQC is not installed,
+# before the backend imports below fail during collection.
+pytest.importorskip("phreeqpython", reason="PHREEQC (phreeqpython) not installed")
 
 from core.chemistry_backend import PHREEQCBackend
 from tools.chemistry.run_speciation import run_phreeqc_speciation
 
+# Every test here drives a full PHREEQC solve or the PHREEQC backend
+pytestmark = pytest.mark.slow
+
+
+# ============================================================================
+# degasser-design-mcp default waters (utils/water_chemistry.py)
+# ============================================================================
+
+# Municipal water: near-neutral pH, low ionic strength. Charge balance is
+# loose because the degasser template itself has ~7% imbalance.
+MUNICIPAL = {
+    "name": "municipal",
+    "ions": {
+        "Na+": 50.0,
+        "Ca2+": 40.0,
+        "Mg2+": 10.0,
+        "K+": 5.0,
+        "Cl-": 60.0,
+        "SO4-2": 30.0,
+        "HCO3-": 120.0,
+        "NO3-": 10.0,
+    },
+    "pH_range": (7.0, 8.5),
+    "IS_range": (0.0, 0.01),
+    "cb_tol": 10.0,
+}
+
+# Brackish water: near-neutral pH, moderate ionic strength
+BRACKISH = {
+    "name": "brackish",
+    "ions": {
+        "Na+": 1000.0,
+        "Ca2+": 100.0,
+        "Mg2+": 50.0,
+        "K+": 20.0,
+        "Cl-": 1500.0,
+        "SO4-2": 200.0,
+        "HCO3-": 200.0,
+    },
+    "pH_range": (6.5, 8.0),
+    "IS_range": (0.01, 0.1),
+    "cb_tol": 5.0,
+}
+
+# Seawater: high ionic strength (~0.7 M), excellent charge balance
+SEAWATER = {
+    "name": "seawater",
+    "ions": {
+        "Na+": 10770.0,
+        "Mg2+": 1290.0,
+        "Ca2+": 412.0,
+        "K+": 399.0,
+        "Sr2+": 7.9,
+        "Cl-": 19350.0,
+        "SO4-2": 2712.0,
+        "HCO3-": 142.0,
+        "Br-": 67.0,
+        "B(OH)4-": 4.5,
+        "F-": 1.3,
+    },
+    "pH_range": (6.5, 8.5),
+    "IS_range": (0.5, 0.9),
+    "cb_tol": 2.0,
+}
+
+
+# ============================================================================
+# Ion mapping (degasser ION_MAPPING)
+# ============================================================================
+
+ION_MAPPING_INPUT = {
+    "Na+": 1000.0,
+    "Ca2+": 100.0,
+    "Cl-": 1500.0,
+    "SO4-2": 200.0,
+    "HCO3-": 200.0,
+}
+
+# Sulfate: SO4-2 → S(6); degasser: ("S(6)", 96.06 / 32.07)
+_SO4_TO_S6 = 96.06 / 32.07
+
+# Bicarbonate → Alkalinity as CaCO3.
+# NOTE: degasser-design-mcp uses ("Alkalinity", 1.0) which is incorrect
+# per Codex review (BUG-006). We fixed it to convert HCO3- → CaCO3 equivalents.
+# Correct conversion: 200.0 / (61.02 / 50.0) = 163.9 mg/L as CaCO3
+_HCO3_TO_ALK = 61.02 / 50.0
+
+# Expected PHREEQC solution entries for ION_MAPPING_INPUT: (value, tolerance)
+EXPECTED_PHREEQC = {
+    "Na": (1000.0, 0.0),  # ("Na", 1.0)
+    "Ca": (100.0, 0.0),  # ("Ca", 1.0)
+    "Cl": (1500.0, 0.0),  # ("Cl", 1.0)
+    "S(6)": (200.0 / _SO4_TO_S6, 0.1),
+    "Alkalinity": (200.0 / _HCO3_TO_ALK, 1.0),
+}
+
+
+@pytest.fixture(scope="module")
+def backend():
+    """PHREEQC backend shared by all tests in this module"""
+    return PHREEQCBackend()
+
 
 class TestDegasserCrossValidation:
     """Cross-validation tests with degasser-design-mcp water chemistry"""
 
-    def test_municipal_water_comparison(self):
-        """
-        Test municipal water composition matches degasser-design-mcp defaults.
-
-        From degasser-design-mcp/utils/water_chemistry.py:
-        "municipal": {
-            "Na+": 50.0,
-            "Ca2+": 40.0,
-            "Mg2+": 10.0,
-            "K+": 5.0,
-            "Cl-": 60.0,
-            "SO4-2": 30.0,
-            "HCO3-": 120.0,
-            "NO3-": 10.0,
-        }
-        """
-        ions_json = json.dumps({
-            "Na+": 50.0,
-            "Ca2+": 40.0,
-            "Mg2+": 10.0,
-            "K+": 5.0,
-            "Cl-": 60.0,
-            "SO4-2": 30.0,
-            "HCO3-": 120.0,
-            "NO3-": 10.0,
-        })
-
-        result = run_phreeqc_speciation(ions_json, temperature_C=25.0)
-
-        # Municipal water should have near-neutral pH
-        assert 7.0 <= result["pH"] <= 8.5
-
-        # Low ionic strength
-        assert result["ionic_strength_M"] < 0.01
-
-        # Charge balance should be reasonable (degasser template has ~7% imbalance)
-        assert abs(result["charge_balance_percent"]) < 10.0
-
-    def test_brackish_water_comparison(self):
+    @pytest.mark.parametrize(
+        "case", [MUNICIPAL, BRACKISH, SEAWATER], ids=lambda c: c["name"]
+    )
+    def test_water_composition(self, case, speciate):
         """
-        Test brackish water composition matches degasser-design-mcp defaults.
+        Test degasser-design-mcp default waters speciate to expected ranges.
 
-        From degasser-design-mcp/utils/water_chemistry.py:
-        "brackish": {
-            "Na+": 1000.0,
-            "Ca2+": 100.0,
-            "Mg2+": 50.0,
-            "K+": 20.0,
-            "Cl-": 1500.0,
-            "SO4-2": 200.0,
-            "HCO3-": 200.0,
-        }
+        Compositions are from degasser-design-mcp/utils/water_chemistry.py;
+        each case carries its own pH, ionic strength and charge-balance limits.
         """
-        ions_json = json.dumps({
-            "Na+": 1000.0,
-            "Ca2+": 100.0,
-            "Mg2+": 50.0,
-            "K+": 20.0,
-            "Cl-": 1500.0,
-            "SO4-2": 200.0,
-            "HCO3-": 200.0,
-        })
+        result = speciate(case["ions"], temperature_C=25.0)
 
-        result = run_phreeqc_speciation(ions_json, temperature_C=25.0)
+        pH_min, pH_max = case["pH_range"]
+        assert pH_min <= result["pH"] <= pH_max
 
-        # Brackish water should have near-neutral pH
-        assert 6.5 <= result["pH"] <= 8.0
+        IS_min, IS_max = case["IS_range"]
+        assert IS_min <= result["ionic_strength_M"] <= IS_max
 
-        # Moderate ionic strength
-        assert 0.01 < result["ionic_strength_M"] < 0.1
+        assert abs(result["charge_balance_percent"]) < case["cb_tol"]
 
-        # Charge balance should be good
-        assert abs(result["charge_balance_percent"]) < 5.0
-
-    def test_seawater_comparison(self):
-        """
-        Test seawater composition matches degasser-design-mcp defaults.
-
-        From degasser-design-mcp/utils/water_chemistry.py:
-        "seawater": {
-            "Na+": 10770.0,
-            "Mg2+": 1290.0,
-            "Ca2+": 412.0,
-            "K+": 399.0,
-            "Sr2+": 7.9,
-            "Cl-": 19350.0,
-            "SO4-2": 2712.0,
-            "HCO3-": 142.0,
-            "Br-": 67.0,
-            "B(OH)4-": 4.5,
-            "F-": 1.3,
-        }
-        """
-        ions_json = json.dumps({
-            "Na+": 10770.0,
-            "Mg2+": 1290.0,
-            "Ca2+": 412.0,
-            "K+": 399.0,
-            "Sr2+": 7.9,
-            "Cl-": 19350.0,
-            "SO4-2": 2712.0,
-            "HCO3-": 142.0,
-            "Br-": 67.0,
-            "B(OH)4-": 4.5,
-            "F-": 1.3,
-        })
-
-        result = run_phreeqc_speciation(ions_json, temperature_C=25.0)
-
-        # Seawater pH can vary
-        assert 6.5 <= result["pH"] <= 8.5
-
-        # High ionic strength (~0.7 M)
-        assert 0.5 <= result["ionic_strength_M"] <= 0.9
-
-        # Charge balance should be excellent
-        assert abs(result["charge_balance_percent"]) < 2.0
-
-    def test_ion_mapping_consistency(self):
+    def test_ion_mapping_consistency(self, backend):
         """Test that ion mappings match degasser-design-mcp"""
-        backend = PHREEQCBackend()
-
-        # Test a few key mappings from degasser ION_MAPPING
-        ions = {
-            "Na+": 1000.0,
-            "Ca2+": 100.0,
-            "Cl-": 1500.0,
-            "SO4-2": 200.0,
-            "HCO3-": 200.0,
-        }
-
-        phreeqc_solution = backend.convert_to_phreeqc_solution(ions)
-
-        # Check mappings match degasser-design-mcp
-        assert phreeqc_solution["Na"] == 1000.0  # ("Na", 1.0)
-        assert phreeqc_solution["Ca"] == 100.0  # ("Ca", 1.0)
-        assert phreeqc_solution["Cl"] == 1500.0  # ("Cl", 1.0)
-
-        # Sulfate: Convert SO4-2 to S(6)
-        # degasser: ("S(6)", 96.06 / 32.07)
-        expected_s6 = 200.0 / (96.06 / 32.07)
-        assert abs(phreeqc_solution["S(6)"] - expected_s6) < 0.1
+        phreeqc_solution = backend.convert_to_phreeqc_solution(ION_MAPPING_INPUT)
 
-        # Bicarbonate: Alkalinity
-        # NOTE: degasser-design-mcp uses ("Alkalinity", 1.0) which is incorrect
-        # per Codex review (BUG-006). We fixed it to convert HCO3- → CaCO3 equivalents.
-        # Correct conversion: 200.0 / (61.02 / 50.0) = 163.9 mg/L as CaCO3
-        expected_alkalinity = 200.0 / (61.02 / 50.0)
-        assert abs(phreeqc_solution["Alkalinity"] - expected_alkalinity) < 1.0
+        for element, (expected, tol) in EXPECTED_PHREEQC.items():
+            assert abs(phreeqc_solution[element] - expected) <= tol, (
+                f"{element}: expected {expected:.2f}, got {phreeqc_solution[element]:.2f}"
+            )
 
     def test_charge_balance_calculation(self):
         """Test charge balance calculation matches degasser-design-mcp logic"""
@@ -208,17 +187,17 @@ class TestPHREEQCConsistency:
 
     def test_repeated_calls_consistency(self):
         """Test that repeated calls produce identical results"""
-        ions_json = json.dumps({
+        ions = {
             "Na+": 1000.0,
             "Ca2+": 100.0,
             "Cl-": 1500.0,
             "HCO3-": 200.0,
-        })
+        }
 
         # Run speciation 3 times
-        result1 = run_phreeqc_speciation(ions_json, temperature_C=25.0)
-        result2 = run_phreeqc_speciation(ions_json, temperature_C=25.0)
-        result3 = run_phreeqc_speciation(ions_json, temperature_C=25.0)
+        result1 = run_phreeqc_speciation(ions, temperature_C=25.0)
+        result2 = run_phreeqc_speciation(ions, temperature_C=25.0)
+        result3 = run_phreeqc_speciation(ions, temperature_C=25.0)
 
         # pH should be identical
         assert abs(result1["pH"] - result2["pH"]) < 1e-6
@@ -228,22 +207,12 @@ class TestPHREEQCConsistency:
         assert abs(result1["ionic_strength_M"] - result2["ionic_strength_M"]) < 1e-9
         assert abs(result2["ionic_strength_M"] - result3["ionic_strength_M"]) < 1e-9
 
-    def test_temperature_sensitivity(self):
+    def test_temperature_sensitivity(self, calcite_si):
         """Test that temperature affects results appropriately"""
-        ions_json = json.dumps({
-            "Ca2+": 120.0,
-            "HCO3-": 250.0,
-            "Cl-": 150.0,
-            "Na+": 100.0,
-        })
-
-        result_25C = run_phreeqc_speciation(ions_json, temperature_C=25.0)
-        result_60C = run_phreeqc_speciation(ions_json, temperature_C=60.0)
-
         # Temperature should affect saturation indices
         # (Retrograde solubility of CaCO3)
-        si_25C = result_25C["saturation_indices"].get("Calcite", -999)
-        si_60C = result_60C["saturation_indices"].get("Calcite", -999)
+        si_25C = calcite_si[25.0]
+        si_60C = calcite_si[60.0]
 
         # Higher temperature should increase SI for calcite
         assert si_60C > si_25C
@@ -0,0 +1,82 @@
+"""
+Tests for the closed carbonate-system pH solver.
+
+Checks the phreeqc.dat equilibrium constants, the analytic Jacobian of the
+charge-balance residual, and textbook pH values for carbonic acid and
+bicarbonate solutions.
+"""
+
+import math
+
+import pytest
+from scipy.optimize import brentq
+
+from utils.fast_ph_solver import (
+    carbonate_constants,
+    ph_residual_and_jac,
+    solve_carbonate_pH,
+)
+
+
+class TestCarbonateConstants:
+    """Test equilibrium constants against phreeqc.dat log_k values"""
+
+    def test_constants_at_25C(self):
+        """Test pK_a1 ≈ 6.352, pK_a2 ≈ 10.329, pK_w ≈ 14.0 at 25°C"""
+        K_a1, K_a2, K_w = carbonate_constants(25.0)
+
+        assert math.isclose(-math.log10(K_a1), 6.352, abs_tol=0.005)
+        assert math.isclose(-math.log10(K_a2), 10.329, abs_tol=0.005)
+        assert math.isclose(-math.log10(K_w), 14.0, abs_tol=0.005)
+
+    def test_water_ionization_increases_with_temperature(self):
+        """Test K_w grows from 25°C to 60°C (pK_w falls toward ~13)"""
+        assert carbonate_constants(60.0)[2] > carbonate_constants(25.0)[2]
+
+
+class TestResidual:
+    """Test the charge-balance residual kernel"""
+
+    @pytest.mark.parametrize("pH", [3.0, 6.35, 8.3, 11.0])
+    def test_jacobian_matches_finite_difference(self, pH):
+        """Test analytic df/dpH against a central difference"""
+        args = (2e-3, 1e-3, *carbonate_constants(25.0))
+        step = 1e-6
+
+        _, dfdpH = ph_residual_and_jac(pH, *args)
+        f_hi, _ = ph_residual_and_jac(pH + step, *args)
+        f_lo, _ = ph_residual_and_jac(pH - step, *args)
+
+        assert math.isclose(dfdpH, (f_hi - f_lo) / (2 * step), rel_tol=1e-5)
+
+
+class TestSolveCarbonatePH:
+    """Test Newton pH solutions of closed carbonate systems"""
+
+    @pytest.mark.parametrize("c_total, cb_net, expected", [
+        (1e-3, 0.0, 4.68),   # 1 mM carbonic acid
+        (1e-3, 1e-3, 8.30),  # 1 mM NaHCO₃ ≈ (pK_a1 + pK_a2)/2
+        (0.0, 0.0, 7.00),    # Pure water
+    ], ids=["carbonic_acid", "bicarbonate", "pure_water"])
+    def test_textbook_solutions(self, c_total, cb_net, expected):
+        """Test pH of simple carbonate solutions at 25°C"""
+        assert math.isclose(solve_carbonate_pH(c_total, cb_net), expected, abs_tol=0.01)
+
+    @pytest.mark.parametrize("pH_guess", [2.0, 7.0, 13.0])
+    def test_matches_bracketing_solution(self, pH_guess):
+        """Test Newton from any starting pH matches a bracketed root"""
+        args = (5e-3, 3e-3, *carbonate_constants(40.0))
+        reference = brentq(lambda pH: ph_residual_and_jac(pH, *args)[0], 0.0, 14.0, xtol=1e-12)
+
+        pH = solve_carbonate_pH(5e-3, 3e-3, temperature_C=40.0, pH_guess=pH_guess)
+
+        assert math.isclose(pH, reference, abs_tol=1e-8)
+
+    def test_negative_carbonate_raises(self):
+        """Test negative total carbonate is rejected"""
+        with pytest.raises(ValueError, match="non-negative"):
+            solve_carbonate_pH(-1e-3, 0.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
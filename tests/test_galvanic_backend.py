@@ -0,0 +1,212 @@
+"""
+Unit tests for GalvanicBackend (mixed-potential theory)
+
+Tests Tafel current evaluation, Evans-diagram mixed-potential solution,
+Faraday's-law rate conversion, and the end-to-end galvanic couple
+calculation driven by NRL polarization data and the ASTM G82 series.
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from core.galvanic_backend import GalvanicResult
+
+
+class TestTafelCurrent:
+    """Test Tafel equation evaluation"""
+
+    def test_anodic_current_positive(self, galv_backend):
+        """Test anodic branch gives positive current"""
+        i = galv_backend.calculate_tafel_current(
+            E=-0.30, E_corr=-0.44, i0=1e-3, beta=0.06, is_anodic=True
+        )
+        assert i > 0
+
+    def test_cathodic_current_negative(self, galv_backend):
+        """Test cathodic branch gives negative current"""
+        i = galv_backend.calculate_tafel_current(
+            E=0.20, E_corr=0.401, i0=1e-7, beta=-0.12, is_anodic=False
+        )
+        assert i < 0
+
+    def test_one_decade_per_tafel_slope(self, galv_backend):
+        """Test that an overpotential of one Tafel slope gives 10 × i0"""
+        i = galv_backend.calculate_tafel_current(
+            E=-0.38, E_corr=-0.44, i0=1e-3, beta=0.06, is_anodic=True
+        )
+        assert i == pytest.approx(1e-2, rel=1e-9)
+
+    def test_array_potentials_match_scalar(self, galv_backend):
+        """Test a potential sweep evaluates elementwise like scalar calls"""
+        E = np.linspace(-0.40, 0.30, 8)
+        i_sweep = galv_backend.calculate_tafel_current(
+            E=E, E_corr=0.401, i0=1e-7, beta=-0.12, is_anodic=False
+        )
+        i_scalar = [
+            galv_backend.calculate_tafel_current(
+                E=e, E_corr=0.401, i0=1e-7, beta=-0.12, is_anodic=False
+            )
+            for e in E
+        ]
+
+        assert i_sweep.shape == E.shape
+        assert np.allclose(i_sweep, i_scalar, rtol=1e-12)
+
+
+class TestMixedPotential:
+    """Test Evans-diagram mixed-potential solution"""
+
+    def test_mixed_potential_carbon_steel_316L(self, galv_backend, cs_316l_curves):
+        """Test E_couple lies between the anode and cathode potentials"""
+        anodic, cathodic = cs_316l_curves
+
+        E_couple, i_galv = galv_backend.find_mixed_potential(anodic, cathodic)
+
+        assert anodic.E_corr < E_couple < cathodic.E_corr
+        assert i_galv > 0
+
+    def test_area_ratio_effect(self, galv_backend, cs_316l_curves):
+        """Test that a larger cathode raises E_couple and i_galv"""
+        anodic, cathodic = cs_316l_curves
+
+        E_1, i_1 = galv_backend.find_mixed_potential(anodic, cathodic, area_ratio=1.0)
+        E_10, i_10 = galv_backend.find_mixed_potential(anodic, cathodic, area_ratio=10.0)
+
+        assert E_10 > E_1
+        assert i_10 > i_1
+
+    def test_diffusion_limit_caps_current(self, galv_backend, cs_316l_curves):
+        """Test that the ORR diffusion limit caps the galvanic current (BUG-011)"""
+        anodic, cathodic = cs_316l_curves
+
+        _, i_free = galv_backend.find_mixed_potential(anodic, cathodic)
+        _, i_capped = galv_backend.find_mixed_potential(anodic, cathodic, i_lim=0.05)
+
+        assert i_capped < i_free
+        assert i_capped == pytest.approx(0.05, rel=1e-3)
+
+    def test_polarization_curve_frozen_and_hashable(self, cs_316l_curves):
+        """Test curves cannot be mutated and can key a cache"""
+        anodic, cathodic = cs_316l_curves
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            anodic.E_corr = 0.0
+        assert {anodic: 1, cathodic: 2}[anodic] == 1
+
+    def test_solution_satisfies_charge_balance(self, galv_backend, cs_316l_curves):
+        """Test the solver's E_couple zeroes the vectorized Evans net current"""
+        anodic, cathodic = cs_316l_curves
+
+        E_couple, i_galv = galv_backend.find_mixed_potential(
+            anodic, cathodic, area_ratio=5.0, i_lim=0.05
+        )
+        i_anodic, i_net = galv_backend._net_current(
+            E_couple, anodic, cathodic, 5.0, 0.05
+        )
+
+        assert i_anodic == pytest.approx(i_galv)
+        assert abs(i_net) < 1e-3 * i_galv
+
+
+    def test_tafel_validity_logged_once_at_operating_point(
+        self, galv_backend, cs_316l_curves, caplog
+    ):
+        """Test the Evans sweep grid does not emit Tafel validity warnings"""
+        anodic, cathodic = cs_316l_curves
+
+        with caplog.at_level("WARNING", logger="core.galvanic_backend"):
+            E_couple, _ = galv_backend.find_mixed_potential(
+                anodic, cathodic, area_ratio=5.0, i_lim=0.05
+            )
+
+        warnings = [r for r in caplog.records if "questionable" in r.getMessage()]
+        eta_op = min(abs(E_couple - anodic.E_corr), abs(E_couple - cathodic.E_corr))
+        assert len(warnings) == (1 if eta_op < 0.05 else 0)
+
+class TestCorrosionRateConversion:
+    """Test Faraday's-law conversion of current density to corrosion rate"""
+
+    def test_carbon_steel_rate(self, galv_backend):
+        """Test 1 A/m² on carbon steel ≈ 1.16 mm/year"""
+        CR = galv_backend.current_to_corrosion_rate(1.0, "carbon steel")
+        assert 1.1 < CR < 1.25
+
+    def test_rate_proportional_to_current(self, galv_backend):
+        """Test that corrosion rate is linear in current density"""
+        CR_1 = galv_backend.current_to_corrosion_rate(1.0, "carbon steel")
+        CR_10 = galv_backend.current_to_corrosion_rate(10.0, "carbon steel")
+        assert CR_10 == pytest.approx(10.0 * CR_1)
+
+
+class TestGalvanicCorrosionTool:
+    """Test end-to-end galvanic corrosion calculation"""
+
+    @pytest.mark.parametrize("anode, cathode, ratio, expect_sub", [
+        ("carbon steel", "316L", 1.0, "galvanic corrosion"),
+        ("carbon steel", "316L", 20.0, "Large cathode/anode ratio"),
+        ("zinc", "316L", 1.0, "galvanic corrosion"),
+    ])
+    def test_galvanic_variants(self, galv_backend, anode, cathode, ratio, expect_sub):
+        """Test couples in seawater and the interpretation they produce"""
+        result = galv_backend.calculate_galvanic_corrosion(
+            anode_material=anode,
+            cathode_material=cathode,
+            area_ratio=ratio,
+        )
+
+        assert isinstance(result, GalvanicResult)
+        assert result.i_galv > 0
+        assert result.corrosion_rate_mm_per_year > 0
+        assert result.anode_material == anode
+        assert result.cathode_material == cathode
+        assert expect_sub in result.interpretation
+
+    def test_area_ratio_increases_rate(self, galv_backend):
+        """Test that corrosion rate grows with cathode/anode area ratio"""
+        small = galv_backend.calculate_galvanic_corrosion("carbon steel", "316L", 1.0)
+        large = galv_backend.calculate_galvanic_corrosion("carbon steel", "316L", 10.0)
+
+        assert large.corrosion_rate_mm_per_year > small.corrosion_rate_mm_per_year
+
+
+    def test_polarization_curves_cached(self, galv_backend):
+        """Test repeated couples reuse the same cached polarization curves"""
+        first = galv_backend._get_curve("anodic", "carbon steel", 25.0, "seawater")
+        galv_backend.calculate_galvanic_corrosion("carbon steel", "316L", 2.0)
+
+        assert galv_backend._get_curve("anodic", "carbon steel", 25.0, "seawater") is first
+
+
+class TestMaterialPairs:
+    """Test galvanic couples across the NRL material mapping"""
+
+    def test_zinc_anode_more_active_than_carbon_steel(self, galv_backend):
+        """Test zinc couples at a more negative potential than carbon steel"""
+        zinc = galv_backend.calculate_galvanic_corrosion("zinc", "316L", 1.0)
+        steel = galv_backend.calculate_galvanic_corrosion("carbon steel", "316L", 1.0)
+
+        assert zinc.E_couple < steel.E_couple
+
+    @pytest.mark.parametrize("material, nrl_code", [
+        ("316L", "SS316"),
+        ("2205", "SS316"),
+        ("carbon steel", "HY80"),
+        ("HY-100", "HY100"),
+        ("Inconel 625", "I625"),
+        ("titanium", "Ti"),
+        ("CuNi 90-10", "CuNi"),
+    ])
+    def test_nrl_material_mapping(self, galv_backend, material, nrl_code):
+        """Test material names map to the expected NRL material codes"""
+        assert galv_backend._map_to_nrl_material(material) == nrl_code
+
+    def test_unmappable_material_raises(self, galv_backend):
+        """Test that materials outside the NRL set raise ValueError"""
+        with pytest.raises(ValueError, match="cannot be mapped"):
+            galv_backend._map_to_nrl_material("unobtainium")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
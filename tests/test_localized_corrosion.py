@@ -7,21 +7,16 @@ crevice IR drop model, and risk assessment logic.
 Target coverage: ≥85%
 """
 
+import numpy as np
 import pytest
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.localized_backend import (
-    LocalizedBackend,
-    MaterialComposition,
     PREN_COEFFS,
     CPT_CORRELATIONS,
 )
 from tools.mechanistic.localized_corrosion import (
     calculate_localized_corrosion,
+    calculate_localized_corrosion_batch,
     calculate_pren,
 )
 
@@ -29,62 +24,34 @@ from tools.mechanistic.localized_corrosion import (
 class TestPRENCalculation:
     """Test PREN (Pitting Resistance Equivalent Number) calculations"""
 
-    def test_pren_austenitic_316L(self):
+    def test_pren_austenitic_316L(self, comp_316L):
         """Test PREN for 316L: PREN = Cr + 3.3×Mo + 16×N"""
-        comp = MaterialComposition(
-            Cr=16.5,
-            Mo=2.0,
-            N=0.05,
-            grade_type="austenitic",
-        )
-
-        pren = comp.calculate_pren()
+        pren = comp_316L.calculate_pren()
 
         # Expected: 16.5 + 3.3×2.0 + 16×0.05 = 16.5 + 6.6 + 0.8 = 23.9
         expected = 16.5 + 3.3 * 2.0 + 16.0 * 0.05
         assert abs(pren - expected) < 0.1
 
-    def test_pren_duplex_2205(self):
+    def test_pren_duplex_2205(self, comp_2205):
         """Test PREN for duplex 2205 with higher N weighting"""
-        comp = MaterialComposition(
-            Cr=22.0,
-            Mo=3.0,
-            N=0.17,
-            grade_type="duplex",
-        )
-
-        pren = comp.calculate_pren()
+        pren = comp_2205.calculate_pren()
 
         # Duplex: PREN = Cr + 3.3×Mo + 30×N
         # Expected: 22.0 + 3.3×3.0 + 30×0.17 = 22.0 + 9.9 + 5.1 = 37.0
         expected = 22.0 + 3.3 * 3.0 + 30.0 * 0.17
         assert abs(pren - expected) < 0.1
 
-    def test_pren_superaustenitic_254SMO(self):
+    def test_pren_superaustenitic_254SMO(self, comp_254SMO):
         """Test PREN for super austenitic 254SMO"""
-        comp = MaterialComposition(
-            Cr=20.0,
-            Mo=6.0,
-            N=0.20,
-            grade_type="superaustenitic",
-        )
-
-        pren = comp.calculate_pren()
+        pren = comp_254SMO.calculate_pren()
 
         # Expected: 20.0 + 3.3×6.0 + 16×0.20 = 20.0 + 19.8 + 3.2 = 43.0
         expected = 20.0 + 3.3 * 6.0 + 16.0 * 0.20
         assert abs(pren - expected) < 0.1
 
-    def test_pren_low_resistance_304(self):
+    def test_pren_low_resistance_304(self, comp_304):
         """Test PREN for low-resistance 304"""
-        comp = MaterialComposition(
-            Cr=18.0,
-            Mo=0.0,  # No molybdenum
-            N=0.05,
-            grade_type="austenitic",
-        )
-
-        pren = comp.calculate_pren()
+        pren = comp_304.calculate_pren()
 
         # Expected: 18.0 + 0 + 0.8 = 18.8
         expected = 18.0 + 16.0 * 0.05
@@ -95,20 +62,17 @@ class TestPRENCalculation:
 class TestCPTCorrelation:
     """Test CPT (Critical Pitting Temperature) correlations"""
 
-    def test_cpt_austenitic_316L(self):
+    def test_cpt_austenitic_316L(self, loc_backend, comp_316L):
         """
         Test CPT for 316L using ASTM G48-11 authoritative data.
 
         FIX BUG-017: Use published ASTM G48 values, not heuristic.
         Source: ASTM G48-11 Annex, 6% FeCl3 test
         """
-        backend = LocalizedBackend()
-
-        comp = MaterialComposition(Cr=16.5, Mo=2.0, N=0.05, grade_type="austenitic")
-        pren = comp.calculate_pren()  # ≈ 23.9
+        pren = comp_316L.calculate_pren()  # ≈ 23.9
 
-        result = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        result = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_316L,
             temperature_C=20.0,
             Cl_mg_L=100.0,
             pH=7.0,
@@ -119,20 +83,17 @@ class TestCPTCorrelation:
         assert result.CPT_C == 15.0  # ASTM G48-11 Annex
         assert 23.0 < pren < 25.0  # Verify PREN calculation
 
-    def test_cpt_duplex_2205(self):
+    def test_cpt_duplex_2205(self, loc_backend, comp_2205):
         """
         Test CPT for duplex 2205 using ASTM G48-11 authoritative data.
 
         FIX BUG-017: Use published ASTM G48 values, not heuristic.
         Source: ASTM G48-11 Annex, 6% FeCl3 test
         """
-        backend = LocalizedBackend()
+        pren = comp_2205.calculate_pren()  # ≈ 37.0 (duplex uses 30×N)
 
-        comp = MaterialComposition(Cr=22.0, Mo=3.0, N=0.17, grade_type="duplex")
-        pren = comp.calculate_pren()  # ≈ 37.0 (duplex uses 30×N)
-
-        result = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        result = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_2205,
             temperature_C=30.0,
             Cl_mg_L=500.0,
             pH=7.0,
@@ -143,23 +104,34 @@ class TestCPTCorrelation:
         assert result.CPT_C == 35.0  # ASTM G48-11 Annex
         assert 35.0 < pren < 40.0  # Verify duplex PREN calculation
 
+    @pytest.mark.parametrize("material_name", ["304", "316L", "2205", "316L stainless", "unobtainium"])
+    def test_flat_g48_table_matches_database(self, material_name):
+        """Test the flattened ASTM G48 table resolves like get_cpt_from_astm"""
+        from core.localized_backend import _astm_g48_code, _CPT_TABLE, _CCT_TABLE
+        from data import get_cpt_from_astm
+
+        code = _astm_g48_code(material_name)
+        cpt_data = get_cpt_from_astm(material_name)
+
+        if cpt_data is None:
+            assert code == -1
+        else:
+            assert _CPT_TABLE[code] == cpt_data["CPT_C"]
+            assert _CCT_TABLE[code] == cpt_data["CCT_C"]
+
 
 class TestChlorideThreshold:
     """Test chloride threshold calculations"""
 
-    def test_chloride_threshold_temperature_effect(self):
+    def test_chloride_threshold_temperature_effect(self, loc_backend, comp_316L):
         """
         Test that Cl⁻ threshold decreases with temperature (ISO 18070).
 
         FIX BUG-017: Validates physical behavior with authoritative data.
         """
-        backend = LocalizedBackend()
-
-        comp = MaterialComposition(Cr=16.5, Mo=2.0, N=0.05, grade_type="austenitic")
-
         # Low temperature (20°C)
-        result_20C = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        result_20C = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_316L,
             temperature_C=20.0,
             Cl_mg_L=100.0,
             pH=7.0,
@@ -167,8 +139,8 @@ class TestChlorideThreshold:
         )
 
         # High temperature (60°C)
-        result_60C = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        result_60C = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_316L,
             temperature_C=60.0,
             Cl_mg_L=100.0,
             pH=7.0,
@@ -180,20 +152,16 @@ class TestChlorideThreshold:
         # 316L at 20°C should be ~250 mg/L (ISO 18070 baseline)
         assert 200.0 < result_20C.Cl_threshold_mg_L < 300.0
 
-    def test_chloride_threshold_pH_effect(self):
+    def test_chloride_threshold_pH_effect(self, loc_backend, comp_316L):
         """
         Test that low pH reduces Cl⁻ threshold (more aggressive)
 
         FIX BUG-017: Validates physical behavior with authoritative data.
         Lower pH accelerates corrosion, reducing safe chloride threshold.
         """
-        backend = LocalizedBackend()
-
-        comp = MaterialComposition(Cr=16.5, Mo=2.0, N=0.05, grade_type="austenitic")
-
         # Neutral pH
-        result_pH7 = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        result_pH7 = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_316L,
             temperature_C=25.0,
             Cl_mg_L=100.0,
             pH=7.0,
@@ -201,8 +169,8 @@ class TestChlorideThreshold:
         )
 
         # Acidic pH
-        result_pH4 = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        result_pH4 = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_316L,
             temperature_C=25.0,
             Cl_mg_L=100.0,
             pH=4.0,
@@ -213,21 +181,31 @@ class TestChlorideThreshold:
         assert result_pH4.Cl_threshold_mg_L < result_pH7.Cl_threshold_mg_L
 
 
+    def test_chloride_threshold_grid_matches_scalar(self):
+        """Test a (T, pH) grid evaluates like per-point threshold lookups"""
+        from data import get_chloride_threshold
+
+        T = np.array([5.0, 25.0, 60.0, 95.0])
+        pH = np.array([[3.0], [5.5], [7.0], [11.0]])
+
+        grid = get_chloride_threshold("316L", T, pH)
+        expected = [[get_chloride_threshold("316L", t, p) for t in T] for p in pH[:, 0]]
+
+        assert grid.shape == (4, 4)
+        assert np.allclose(grid, expected, rtol=1e-12)
+
+
 class TestPittingSusceptibility:
     """Test pitting susceptibility assessment"""
 
-    def test_pitting_low_risk(self):
+    def test_pitting_low_risk(self, loc_backend, comp_2205):
         """
         Test low risk: T << CPT and Cl⁻ << threshold
 
         FIX BUG-017: Uses ASTM G48 CPT (2205 = 35°C), validates risk logic.
         """
-        backend = LocalizedBackend()
-
-        comp = MaterialComposition(Cr=22.0, Mo=3.0, N=0.17, grade_type="duplex")
-
-        result = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        result = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_2205,
             temperature_C=5.0,  # Well below CPT = 35°C for 2205 (ASTM G48)
             Cl_mg_L=50.0,  # Low chlorides
             pH=7.0,
@@ -238,18 +216,14 @@ class TestPittingSusceptibility:
         assert result.susceptibility in ["low", "moderate"]
         assert result.margin_C > 0  # Positive margin (5°C - 35°C = -30°C margin, T below CPT)
 
-    def test_pitting_critical_risk(self):
+    def test_pitting_critical_risk(self, loc_backend, comp_304):
         """
         Test critical risk: T > CPT and Cl⁻ > threshold
 
         FIX BUG-017: Uses ASTM G48 CPT (304 = 0°C), validates critical risk logic.
         """
-        backend = LocalizedBackend()
-
-        comp = MaterialComposition(Cr=18.0, Mo=0.0, N=0.05, grade_type="austenitic")
-
-        result = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        result = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_304,
             temperature_C=50.0,  # Well above CPT = 0°C for 304 (ASTM G48)
             Cl_mg_L=1000.0,  # High chlorides (well above 50 mg/L threshold for 304)
             pH=7.0,
@@ -263,19 +237,15 @@ class TestPittingSusceptibility:
 class TestCreviceSusceptibility:
     """Test crevice corrosion susceptibility"""
 
-    def test_crevice_ir_drop(self):
+    def test_crevice_ir_drop(self, loc_backend, comp_316L):
         """
         Test that IR drop increases with crevice gap
 
         FIX BUG-017: Validates physical behavior - larger gap = larger IR drop.
         """
-        backend = LocalizedBackend()
-
-        comp = MaterialComposition(Cr=16.5, Mo=2.0, N=0.05, grade_type="austenitic")
-
         # Small gap
-        result_small = backend.calculate_crevice_susceptibility(
-            material_comp=comp,
+        result_small = loc_backend.calculate_crevice_susceptibility(
+            material_comp=comp_316L,
             temperature_C=25.0,
             Cl_mg_L=500.0,
             pH=7.0,
@@ -284,8 +254,8 @@ class TestCreviceSusceptibility:
         )
 
         # Large gap
-        result_large = backend.calculate_crevice_susceptibility(
-            material_comp=comp,
+        result_large = loc_backend.calculate_crevice_susceptibility(
+            material_comp=comp_316L,
             temperature_C=25.0,
             Cl_mg_L=500.0,
             pH=7.0,
@@ -296,18 +266,14 @@ class TestCreviceSusceptibility:
         # Larger gap → larger IR drop
         assert result_large.IR_drop_V > result_small.IR_drop_V
 
-    def test_crevice_acidification(self):
+    def test_crevice_acidification(self, loc_backend, comp_316L):
         """
         Test crevice acidification factor
 
         FIX BUG-017: Validates physical behavior - crevice chemistry acidifies.
         """
-        backend = LocalizedBackend()
-
-        comp = MaterialComposition(Cr=16.5, Mo=2.0, N=0.05, grade_type="austenitic")
-
-        result = backend.calculate_crevice_susceptibility(
-            material_comp=comp,
+        result = loc_backend.calculate_crevice_susceptibility(
+            material_comp=comp_316L,
             temperature_C=40.0,
             Cl_mg_L=1000.0,  # High chlorides
             pH=7.0,
@@ -318,7 +284,7 @@ class TestCreviceSusceptibility:
         # Should have acidification (factor > 1)
         assert result.acidification_factor > 1.0
 
-    def test_cct_lower_than_cpt(self):
+    def test_cct_lower_than_cpt(self, loc_backend, comp_316L):
         """
         Test that CCT < CPT (crevice more aggressive than pitting)
 
@@ -326,13 +292,9 @@ class TestCreviceSusceptibility:
         CCT (crevice corrosion temperature) is always lower than CPT.
         For 316L: CPT = 15°C, CCT = 5°C (ASTM G48-11).
         """
-        backend = LocalizedBackend()
-
-        comp = MaterialComposition(Cr=16.5, Mo=2.0, N=0.05, grade_type="austenitic")
-
         # Get pitting result
-        pitting_result = backend.calculate_pitting_susceptibility(
-            material_comp=comp,
+        pitting_result = loc_backend.calculate_pitting_susceptibility(
+            material_comp=comp_316L,
             temperature_C=25.0,
             Cl_mg_L=500.0,
             pH=7.0,
@@ -340,8 +302,8 @@ class TestCreviceSusceptibility:
         )
 
         # Get crevice result
-        crevice_result = backend.calculate_crevice_susceptibility(
-            material_comp=comp,
+        crevice_result = loc_backend.calculate_crevice_susceptibility(
+            material_comp=comp_316L,
             temperature_C=25.0,
             Cl_mg_L=500.0,
             pH=7.0,
@@ -493,69 +455,91 @@ class TestPRENUtilityFunction:
             )
 
 
+    def test_pren_utility_string_composition_not_coerced(self):
+        """Test non-numeric contents fail validation instead of being coerced"""
+        with pytest.raises(TypeError):
+            calculate_pren(
+                Cr_wt_pct="16.5",
+                Mo_wt_pct=2.0,
+                N_wt_pct=0.05,
+            )
+
 class TestMaterialSpecificCases:
     """Test specific material combinations"""
 
-    def test_304_high_chloride_critical(self):
-        """
-        Test 304 in high chloride (should be critical)
-
-        FIX BUG-017: Uses ASTM G48 data (304 CPT = 0°C, threshold = 50 mg/L).
-        """
-        result = calculate_localized_corrosion(
-            material="304",
-            temperature_C=40.0,
-            Cl_mg_L=500.0,
-            pH=7.0,
-        )
-
-        # 304 has low PREN ≈ 18, CPT = 0°C (ASTM G48)
-        # At 40°C (40°C above CPT!) with 500 mg/L Cl⁻ (10x threshold), should be critical
-        assert result["overall_risk"] in ["high", "critical"]
-        assert result["pitting"]["CPT_C"] == 0.0  # ASTM G48-11
-
-    def test_2205_moderate_chloride_low(self):
-        """
-        Test 2205 duplex in moderate chloride
-
-        FIX BUG-017: Uses ASTM G48 data (2205 CPT = 35°C, CCT = 25°C).
-        """
-        result = calculate_localized_corrosion(
-            material="2205",
-            temperature_C=30.0,
-            Cl_mg_L=500.0,
-            pH=7.0,
-        )
-
-        # 2205 has PREN ≈ 35, CPT = 35°C (ASTM G48), CCT = 25°C
-        # At 30°C (5°C below CPT, 5°C above CCT), crevice will be high/critical
-        # Overall should be high or critical due to crevice
-        assert result["overall_risk"] in ["moderate", "high", "critical"]
-        # But pitting alone should be better (T < CPT)
-        assert result["pitting"]["PREN"] > 30.0
-        assert result["pitting"]["CPT_C"] == 35.0  # ASTM G48-11
-
-    def test_254SMO_high_chloride_low(self):
+    @pytest.mark.parametrize(
+        "material, T, Cl, pH, expected_CPT, expected_CCT, expected_risks, min_PREN",
+        [
+            # 316L: PREN ≈ 24, 5°C above CPT
+            ("316L", 20.0, 100.0, 7.0, 15.0, 5.0, ("high", "critical"), 23.0),
+            # 2205: 5°C below CPT but 5°C above CCT, so crevice drives overall risk
+            ("2205", 30.0, 500.0, 7.0, 35.0, 25.0, ("moderate", "high", "critical"), 30.0),
+            # 304: PREN ≈ 18, 40°C above CPT with 10x the 50 mg/L threshold
+            ("304", 40.0, 500.0, 7.0, 0.0, -10.0, ("high", "critical"), None),
+            # 254SMO: 10°C below CPT and at CCT, so crevice is marginal
+            ("254SMO", 40.0, 2000.0, 7.0, 50.0, 40.0, ("moderate", "high", "critical"), 40.0),
+        ],
+        ids=["316L", "2205", "304", "254SMO"],
+    )
+    def test_astm_g48_cases(
+        self, material, T, Cl, pH, expected_CPT, expected_CCT, expected_risks, min_PREN
+    ):
         """
-        Test 254SMO in high chloride
+        Test CPT/CCT come from ASTM G48-11 and risk follows from them
 
-        FIX BUG-017: Uses ASTM G48 data (254SMO CPT = 50°C, CCT = 40°C).
+        FIX BUG-017: Uses ASTM G48 data, not the PREN heuristic.
         """
         result = calculate_localized_corrosion(
-            material="254SMO",
-            temperature_C=40.0,
-            Cl_mg_L=2000.0,
-            pH=7.0,
+            material=material,
+            temperature_C=T,
+            Cl_mg_L=Cl,
+            pH=pH,
         )
 
-        # 254SMO has PREN ≈ 43, CPT = 50°C (ASTM G48), CCT = 40°C
-        # At 40°C (10°C below CPT, at CCT), crevice is marginal
-        # Pitting should be low (T < CPT by 10°C)
-        # Overall could be moderate to high due to crevice
-        assert result["overall_risk"] in ["moderate", "high", "critical"]
-        # Should have excellent PREN
-        assert result["pitting"]["PREN"] > 40.0
-        assert result["pitting"]["CPT_C"] == 50.0  # ASTM G48-11
+        assert result["pitting"]["CPT_C"] == expected_CPT  # ASTM G48-11
+        assert result["crevice"]["CCT_C"] == expected_CCT  # ASTM G48-11
+        assert result["overall_risk"] in expected_risks
+        if min_PREN is not None:
+            assert result["pitting"]["PREN"] > min_PREN
+
+    def test_grid_matches_scalar(self, loc_backend):
+        """Test the vectorized grid reproduces the scalar Tier 1 assessment"""
+        materials = np.array(["316L", "2205", "304", "254SMO", "Inconel 625"])[:, None]
+        T = np.array([20.0, 40.0])
+
+        grid = loc_backend.calculate_localized_grid(materials, T, 500.0, pH=6.5, crevice_gap_mm=0.2)
+
+        assert grid["overall_risk"].shape == (5, 2)
+        for i, material in enumerate(materials[:, 0]):
+            for j, temperature in enumerate(T):
+                scalar = loc_backend.calculate_localized_corrosion(material, temperature, 500.0, 6.5, 0.2)
+                assert grid["CPT_C"][i, j] == pytest.approx(scalar.pitting.CPT_C)
+                assert grid["CCT_C"][i, j] == pytest.approx(scalar.crevice.CCT_C)
+                assert grid["Cl_threshold_mg_L"][i, j] == pytest.approx(scalar.pitting.Cl_threshold_mg_L)
+                assert grid["acidification_factor"][i, j] == pytest.approx(scalar.crevice.acidification_factor)
+                assert grid["pitting_susceptibility"][i, j] == scalar.pitting.susceptibility
+                assert grid["crevice_susceptibility"][i, j] == scalar.crevice.susceptibility
+                assert grid["overall_risk"][i, j] == scalar.overall_risk
+
+    def test_batch_matches_scalar(self):
+        """Test the batch API returns the scalar results in case order"""
+        cases = [
+            {"material": "316L", "temperature_C": 20.0, "Cl_mg_L": 100.0},
+            {"material": "2205", "temperature_C": 30.0, "Cl_mg_L": 500.0, "pH": 6.0},
+            {"material": "316L", "temperature_C": 50.0, "Cl_mg_L": 500.0, "crevice_gap_mm": 0.5},
+        ]
+
+        results = calculate_localized_corrosion_batch(cases)
+
+        assert results == [calculate_localized_corrosion(**case) for case in cases]
+
+    def test_batch_validates_every_case(self):
+        """Test an invalid case anywhere in the batch raises before any work"""
+        with pytest.raises(ValueError, match="pH.*out of range"):
+            calculate_localized_corrosion_batch([
+                {"material": "316L", "temperature_C": 20.0, "Cl_mg_L": 100.0},
+                {"material": "316L", "temperature_C": 20.0, "Cl_mg_L": 100.0, "pH": 15.0},
+            ])
 
 
 class TestEdgeCases:
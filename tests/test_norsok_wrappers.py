@@ -14,6 +14,27 @@ from data.norsok_internal_corrosion import (
     get_ph_correction_factor,
 )
 
+# Wet-gas CO₂ pipeline case for calculate_norsok_corrosion_rate (pH_in per test)
+_NORSOK_BASE = dict(
+    co2_fraction=0.05,
+    pressure_bar=10.0,
+    temperature_C=40.0,
+    v_sg=1.0,  # Superficial gas velocity (m/s)
+    v_sl=0.5,  # Superficial liquid velocity (m/s)
+    mass_g=100.0,  # Mass flow gas (kg/hr)
+    mass_l=500.0,  # Mass flow liquid (kg/hr)
+    vol_g=80.0,  # Volumetric flow gas (m³/hr)
+    vol_l=50.0,  # Volumetric flow liquid (m³/hr)
+    holdup=50.0,  # Liquid holdup (%)
+    vis_g=0.02,  # Gas viscosity (cp)
+    vis_l=1.0,  # Liquid viscosity (cp)
+    roughness=0.000045,  # Pipe roughness (m)
+    diameter=0.2,  # Pipe diameter (m)
+    bicarbonate_mg_L=500.0,
+    ionic_strength_mg_L=5000.0,
+    calc_iterations=2,
+)
+
 
 class TestPHCalculatorFix:
     """Test that pHCalculator receives integer iterations, not boolean"""
@@ -79,97 +100,23 @@ class TestPHCalculatorFix:
 class TestNORSOKCorrosionRatePHHandling:
     """Test that user-supplied pH is honored (not ignored)"""
 
-    def test_corrosion_rate_with_calculated_pH(self):
-        """Test NORSOK corrosion rate with pH calculated from chemistry"""
-        # pH_in = 0 signals: calculate pH from chemistry
-        cr = calculate_norsok_corrosion_rate(
-            co2_fraction=0.05,
-            pressure_bar=10.0,
-            temperature_C=40.0,
-            v_sg=1.0,  # Superficial gas velocity (m/s)
-            v_sl=0.5,  # Superficial liquid velocity (m/s)
-            mass_g=100.0,  # Mass flow gas (kg/hr)
-            mass_l=500.0,  # Mass flow liquid (kg/hr)
-            vol_g=80.0,  # Volumetric flow gas (m³/hr)
-            vol_l=50.0,  # Volumetric flow liquid (m³/hr)
-            holdup=50.0,  # Liquid holdup (%)
-            vis_g=0.02,  # Gas viscosity (cp)
-            vis_l=1.0,  # Liquid viscosity (cp)
-            roughness=0.000045,  # Pipe roughness (m)
-            diameter=0.2,  # Pipe diameter (m)
-            pH_in=0.0,  # Calculate pH from chemistry
-            bicarbonate_mg_L=500.0,
-            ionic_strength_mg_L=5000.0,
-            calc_iterations=2,
-        )
+    @pytest.mark.parametrize("pH_in", [
+        0.0,  # pH_in = 0 signals: calculate pH from chemistry
+        5.5,  # pH_in > 0 signals: use this pH value
+    ], ids=["calculated_pH", "user_supplied_pH"])
+    def test_corrosion_rate_pH_source(self, pH_in):
+        """Test NORSOK corrosion rate with calculated and user-supplied pH"""
+        cr = calculate_norsok_corrosion_rate(**_NORSOK_BASE, pH_in=pH_in)
 
         # Should return positive corrosion rate
         assert cr >= 0
         # Typical CO₂ corrosion: 0.1 - 10 mm/year
         assert 0 <= cr <= 50
 
-    def test_corrosion_rate_with_user_supplied_pH(self):
-        """Test NORSOK corrosion rate with user-supplied pH"""
-        # pH_in > 0 signals: use this pH value
-        cr = calculate_norsok_corrosion_rate(
-            co2_fraction=0.05,
-            pressure_bar=10.0,
-            temperature_C=40.0,
-            v_sg=1.0,
-            v_sl=0.5,
-            mass_g=100.0,
-            mass_l=500.0,
-            vol_g=80.0,
-            vol_l=50.0,
-            holdup=50.0,
-            vis_g=0.02,
-            vis_l=1.0,
-            roughness=0.000045,
-            diameter=0.2,
-            pH_in=5.5,  # User-supplied pH (should be honored!)
-            bicarbonate_mg_L=500.0,
-            ionic_strength_mg_L=5000.0,
-            calc_iterations=2,
-        )
-
-        # Should return positive corrosion rate
-        assert cr >= 0
-        assert 0 <= cr <= 50
-
     def test_pH_effect_on_corrosion_rate(self):
         """Test that pH affects corrosion rate (lower pH → higher CR)"""
-        # Common parameters
-        common_params = dict(
-            co2_fraction=0.05,
-            pressure_bar=10.0,
-            temperature_C=40.0,
-            v_sg=1.0,
-            v_sl=0.5,
-            mass_g=100.0,
-            mass_l=500.0,
-            vol_g=80.0,
-            vol_l=50.0,
-            holdup=50.0,
-            vis_g=0.02,
-            vis_l=1.0,
-            roughness=0.000045,
-            diameter=0.2,
-            bicarbonate_mg_L=500.0,
-            ionic_strength_mg_L=5000.0,
-            calc_iterations=2,
-        )
-
-        # Low pH (acidic)
-        cr_low_pH = calculate_norsok_corrosion_rate(
-            **common_params,
-            pH_in=4.5,  # Low pH
-        )
-
-        # High pH (less acidic)
-        cr_high_pH = calculate_norsok_corrosion_rate(
-            **common_params,
-            pH_in=6.0,  # Higher pH
-        )
+        cr_low_pH = calculate_norsok_corrosion_rate(**_NORSOK_BASE, pH_in=4.5)  # Low pH
+        cr_high_pH = calculate_norsok_corrosion_rate(**_NORSOK_BASE, pH_in=6.0)  # Higher pH
 
         # Lower pH should give higher corrosion rate
         # (pH correction factor fpH increases with pH, so CR decreases)
@@ -178,24 +125,8 @@ class TestNORSOKCorrosionRatePHHandling:
     def test_zero_co2_gives_zero_corrosion(self):
         """Test that zero CO₂ gives zero corrosion rate"""
         cr = calculate_norsok_corrosion_rate(
-            co2_fraction=0.0,  # No CO₂
-            pressure_bar=10.0,
-            temperature_C=40.0,
-            v_sg=1.0,
-            v_sl=0.5,
-            mass_g=100.0,
-            mass_l=500.0,
-            vol_g=80.0,
-            vol_l=50.0,
-            holdup=50.0,
-            vis_g=0.02,
-            vis_l=1.0,
-            roughness=0.000045,
-            diameter=0.2,
+            **{**_NORSOK_BASE, "co2_fraction": 0.0},  # No CO₂
             pH_in=5.5,
-            bicarbonate_mg_L=500.0,
-            ionic_strength_mg_L=5000.0,
-            calc_iterations=2,
         )
 
         # No CO₂ → no CO₂ corrosion
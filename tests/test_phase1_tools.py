@@ -14,21 +14,33 @@ Tests cover:
 
 import pytest
 import json
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tools.chemistry.run_speciation import run_phreeqc_speciation
 from tools.mechanistic.co2_h2s_corrosion import predict_co2_h2s_corrosion
 from tools.mechanistic.aerated_chloride_corrosion import predict_aerated_chloride_corrosion
 
+# Baseline sweet-gas pipeline for predict_co2_h2s_corrosion (tests override fields)
+_CO2_BASE = dict(
+    temperature_C=40.0,
+    pressure_bar=10.0,
+    co2_fraction=0.05,
+    pipe_diameter_m=0.2,
+)
+
+# Baseline aerated freshwater for predict_aerated_chloride_corrosion
+_AERATED_BASE = dict(
+    temperature_C=25.0,
+    dissolved_oxygen_mg_L=8.0,
+    chloride_mg_L=100.0,
+    pH=7.0,
+)
+
 
+@pytest.mark.slow
 class TestRunPhreeqcSpeciation:
     """Test suite for run_phreeqc_speciation tool"""
 
-    def test_basic_freshwater_speciation(self):
+    def test_basic_freshwater_speciation(self, speciate):
         """Test speciation for typical freshwater composition"""
         ions_json = json.dumps({
             "Na+": 1000.0,
@@ -37,7 +49,7 @@ class TestRunPhreeqcSpeciation:
             "HCO3-": 200.0,
         })
 
-        result = run_phreeqc_speciation(
+        result = speciate(
             ions_json=ions_json,
             temperature_C=25.0,
         )
@@ -53,7 +65,7 @@ class TestRunPhreeqcSpeciation:
         assert 6.0 <= result["pH"] <= 9.0
         assert result["ionic_strength_M"] > 0
 
-    def test_seawater_speciation(self):
+    def test_seawater_speciation(self, speciate):
         """Test speciation for seawater composition"""
         ions_json = json.dumps({
             "Na+": 10752.0,
@@ -65,7 +77,7 @@ class TestRunPhreeqcSpeciation:
             "HCO3-": 142.0,
         })
 
-        result = run_phreeqc_speciation(
+        result = speciate(
             ions_json=ions_json,
             temperature_C=25.0,
         )
@@ -77,14 +89,14 @@ class TestRunPhreeqcSpeciation:
         # Seawater ionic strength ~0.7 M
         assert 0.5 <= result["ionic_strength_M"] <= 1.0
 
-    def test_acidic_solution_speciation(self):
+    def test_acidic_solution_speciation(self, speciate):
         """Test speciation for acidic solution"""
         ions_json = json.dumps({
             "Na+": 500.0,
             "Cl-": 800.0,
         })
 
-        result = run_phreeqc_speciation(
+        result = speciate(
             ions_json=ions_json,
             temperature_C=25.0,
             pH=4.5,  # Specify acidic pH
@@ -94,14 +106,14 @@ class TestRunPhreeqcSpeciation:
         assert 4.0 <= result["pH"] <= 5.0
         assert "acidic" in result["interpretation"].lower() or "Acidic" in result["interpretation"]
 
-    def test_high_temperature_speciation(self):
+    def test_high_temperature_speciation(self, speciate):
         """Test speciation at elevated temperature"""
         ions_json = json.dumps({
             "Na+": 1000.0,
             "Cl-": 1500.0,
         })
 
-        result = run_phreeqc_speciation(
+        result = speciate(
             ions_json=ions_json,
             temperature_C=80.0,
         )
@@ -171,26 +183,20 @@ class TestPredictCO2H2SCorrosion:
 
     def test_zero_co2_gives_zero_corrosion(self):
         """Test that zero CO₂ gives zero corrosion rate"""
-        result = predict_co2_h2s_corrosion(
-            temperature_C=40.0,
-            pressure_bar=10.0,
-            co2_fraction=0.0,  # No CO₂
-            pH=7.0,
-            pipe_diameter_m=0.2,
-        )
+        result = predict_co2_h2s_corrosion(**{**_CO2_BASE, "co2_fraction": 0.0}, pH=7.0)
 
         assert result["corrosion_rate_mm_y"] == 0.0
 
     def test_sour_corrosion_with_h2s(self):
         """Test H₂S sour corrosion prediction"""
-        result = predict_co2_h2s_corrosion(
-            temperature_C=50.0,
-            pressure_bar=30.0,
-            co2_fraction=0.01,
-            h2s_fraction=0.005,  # Significant H₂S
-            pH=5.5,
-            pipe_diameter_m=0.2,
-        )
+        result = predict_co2_h2s_corrosion(**{
+            **_CO2_BASE,
+            "temperature_C": 50.0,
+            "pressure_bar": 30.0,
+            "co2_fraction": 0.01,
+            "h2s_fraction": 0.005,  # Significant H₂S
+            "pH": 5.5,
+        })
 
         # Should detect H₂S
         assert result["h2s_partial_pressure_bar"] > 0
@@ -200,66 +206,55 @@ class TestPredictCO2H2SCorrosion:
 
     def test_high_temperature_corrosion(self):
         """Test corrosion at high temperature"""
-        result_high_temp = predict_co2_h2s_corrosion(
-            temperature_C=120.0,
-            pressure_bar=100.0,
-            co2_fraction=0.1,
-            pH=4.5,
-            pipe_diameter_m=0.2,
-        )
+        result_high_temp = predict_co2_h2s_corrosion(**{
+            **_CO2_BASE,
+            "temperature_C": 120.0,
+            "pressure_bar": 100.0,
+            "co2_fraction": 0.1,
+            "pH": 4.5,
+        })
 
         # Should have warning about high temperature
-        assert any("Temperature" in w or "temperature" in w
-                  for w in result_high_temp["provenance"]["warnings"])
+        assert "HIGH_TEMPERATURE" in result_high_temp["provenance"]["warning_codes"]
 
     def test_calculated_vs_supplied_pH(self):
         """Test that user-supplied pH is honored"""
         # With user-supplied pH
-        result_supplied = predict_co2_h2s_corrosion(
-            temperature_C=40.0,
-            pressure_bar=10.0,
-            co2_fraction=0.05,
-            pH=5.0,  # User supplies pH
-            pipe_diameter_m=0.2,
-        )
+        result_supplied = predict_co2_h2s_corrosion(**_CO2_BASE, pH=5.0)
 
         # pH should match supplied value
         assert result_supplied["pH_calculated"] == 5.0
 
         # With calculated pH
         result_calc = predict_co2_h2s_corrosion(
-            temperature_C=40.0,
-            pressure_bar=10.0,
-            co2_fraction=0.05,
+            **_CO2_BASE,
             pH=None,  # Let PHREEQC calculate
             bicarbonate_mg_L=500.0,
             ionic_strength_mg_L=5000.0,
-            pipe_diameter_m=0.2,
         )
 
         # pH should be calculated (not None)
         assert result_calc["pH_calculated"] is not None
         assert result_calc["pH_calculated"] > 0
 
-    def test_temperature_out_of_range_raises_error(self):
-        """Test that temperature outside NORSOK range raises ValueError"""
-        with pytest.raises(ValueError, match="outside NORSOK M-506 range"):
-            predict_co2_h2s_corrosion(
-                temperature_C=200.0,  # Too high
-                pressure_bar=10.0,
-                co2_fraction=0.05,
-                pipe_diameter_m=0.2,
-            )
+    @pytest.mark.parametrize("override, match", [
+        ({"temperature_C": 200.0}, "outside NORSOK M-506 range"),  # Too high
+        ({"co2_fraction": 1.5}, "CO₂ fraction.*must be between 0 and 1"),  # Invalid (>1)
+    ], ids=["temperature", "co2_fraction"])
+    def test_invalid_input_raises_error(self, override, match):
+        """Test that out-of-range inputs raise ValueError"""
+        with pytest.raises(ValueError, match=match):
+            predict_co2_h2s_corrosion(**{**_CO2_BASE, **override})
 
-    def test_invalid_co2_fraction_raises_error(self):
-        """Test that invalid CO₂ fraction raises ValueError"""
-        with pytest.raises(ValueError, match="CO₂ fraction.*must be between 0 and 1"):
-            predict_co2_h2s_corrosion(
-                temperature_C=40.0,
-                pressure_bar=10.0,
-                co2_fraction=1.5,  # Invalid (>1)
-                pipe_diameter_m=0.2,
-            )
+
+@pytest.fixture(scope="module")
+def do_scan():
+    """Air-saturated (Garcia-Benson DO) results at 5, 25 and 60°C, each solved once"""
+    air_saturated = {**_AERATED_BASE, "dissolved_oxygen_mg_L": None}  # Let tool calculate
+    return {
+        T: predict_aerated_chloride_corrosion(**{**air_saturated, "temperature_C": T})
+        for T in (5.0, 25.0, 60.0)
+    }
 
 
 class TestPredictAeratedChlorideCorrosion:
@@ -267,12 +262,7 @@ class TestPredictAeratedChlorideCorrosion:
 
     def test_basic_freshwater_corrosion(self):
         """Test basic aerated freshwater corrosion"""
-        result = predict_aerated_chloride_corrosion(
-            temperature_C=25.0,
-            dissolved_oxygen_mg_L=8.0,
-            chloride_mg_L=100.0,  # Freshwater
-            pH=7.0,
-        )
+        result = predict_aerated_chloride_corrosion(**_AERATED_BASE)
 
         # Verify result structure
         assert "corrosion_rate_mm_y" in result
@@ -286,142 +276,76 @@ class TestPredictAeratedChlorideCorrosion:
         assert result["corrosion_rate_mm_y"] > 0
         assert result["limiting_current_density_A_m2"] > 0
 
-        # Freshwater should be in mechanism
-        assert "freshwater" in result["mechanism"].lower()
-
-    def test_seawater_corrosion(self):
-        """Test aerated seawater corrosion"""
-        result = predict_aerated_chloride_corrosion(
-            temperature_C=25.0,
-            dissolved_oxygen_mg_L=6.5,
-            chloride_mg_L=19000.0,  # Seawater
-            pH=8.1,
-        )
-
-        # Seawater should be identified
-        assert "seawater" in result["mechanism"].lower()
+    @pytest.mark.parametrize("override, water_type", [
+        ({}, "freshwater"),
+        ({"dissolved_oxygen_mg_L": 6.5, "chloride_mg_L": 19000.0, "pH": 8.1}, "seawater"),
+        ({"dissolved_oxygen_mg_L": 7.0, "chloride_mg_L": 5000.0, "pH": 7.5}, "brackish"),
+    ], ids=["freshwater", "seawater", "brackish"])
+    def test_water_type_identified(self, override, water_type):
+        """Test that the chloride level selects the water type in the mechanism"""
+        result = predict_aerated_chloride_corrosion(**{**_AERATED_BASE, **override})
 
-        # Corrosion rate should be typical for seawater (very low due to ORR limit)
-        # Typical range: 0.005-0.3 mm/y for diffusion-limited corrosion
-        assert 0.001 <= result["corrosion_rate_mm_y"] <= 1.0
+        assert water_type in result["mechanism"].lower()
 
-    def test_brackish_water_corrosion(self):
-        """Test brackish water corrosion"""
-        result = predict_aerated_chloride_corrosion(
-            temperature_C=25.0,
-            dissolved_oxygen_mg_L=7.0,
-            chloride_mg_L=5000.0,  # Brackish
-            pH=7.5,
-        )
+        if water_type == "seawater":
+            # Corrosion rate should be typical for seawater (very low due to ORR limit)
+            # Typical range: 0.005-0.3 mm/y for diffusion-limited corrosion
+            assert 0.001 <= result["corrosion_rate_mm_y"] <= 1.0
 
-        # Brackish water should be identified
-        assert "brackish" in result["mechanism"].lower()
-
-    def test_air_saturated_assumption(self):
+    def test_air_saturated_assumption(self, do_scan):
         """Test DO calculation when not provided (air-saturated)"""
-        result = predict_aerated_chloride_corrosion(
-            temperature_C=25.0,
-            dissolved_oxygen_mg_L=None,  # Let tool calculate
-            chloride_mg_L=100.0,
-            pH=7.0,
-        )
+        result = do_scan[25.0]
 
         # Should calculate reasonable DO for 25°C (~8-9 mg/L for freshwater)
         assert 6.0 <= result["dissolved_oxygen_mg_L"] <= 10.0
 
-    def test_temperature_effect_on_do(self):
-        """Test that temperature affects dissolved oxygen solubility"""
-        result_cold = predict_aerated_chloride_corrosion(
-            temperature_C=5.0,
-            dissolved_oxygen_mg_L=None,  # Air-saturated
-            chloride_mg_L=100.0,
-            pH=7.0,
-        )
-
-        result_hot = predict_aerated_chloride_corrosion(
-            temperature_C=60.0,
-            dissolved_oxygen_mg_L=None,  # Air-saturated
-            chloride_mg_L=100.0,
-            pH=7.0,
-        )
+    def test_temperature_dependence_via_do(self, do_scan):
+        """Test that temperature affects corrosion via DO concentration (Codex-approved scaling)"""
+        # 25°C (CSV reference point), 5°C (outside CSV range, uses DO scaling), 60°C
+        result_ref, result_cold, result_hot = do_scan[25.0], do_scan[5.0], do_scan[60.0]
 
         # Cold water holds more DO
         assert result_cold["dissolved_oxygen_mg_L"] > result_hot["dissolved_oxygen_mg_L"]
 
-    def test_temperature_dependence_via_do(self):
-        """Test that temperature affects corrosion via DO concentration (Codex-approved scaling)"""
-        # Test at 25°C (CSV reference point)
-        result_ref = predict_aerated_chloride_corrosion(
-            temperature_C=25.0,
-            dissolved_oxygen_mg_L=None,  # Calculate from Garcia-Benson
-            chloride_mg_L=100.0,
-            pH=7.0,
-        )
-
-        # Test at lower temperature (outside CSV range, uses DO scaling)
-        result_cold = predict_aerated_chloride_corrosion(
-            temperature_C=5.0,
-            dissolved_oxygen_mg_L=None,  # Calculate from Garcia-Benson
-            chloride_mg_L=100.0,
-            pH=7.0,
-        )
-
         # Cold water has higher DO, so should have higher i_lim and corrosion rate
         assert result_cold["dissolved_oxygen_mg_L"] > result_ref["dissolved_oxygen_mg_L"]
         assert result_cold["limiting_current_density_A_m2"] > result_ref["limiting_current_density_A_m2"]
 
-    def test_low_do_warning(self):
-        """Test warning for low dissolved oxygen"""
-        result = predict_aerated_chloride_corrosion(
-            temperature_C=25.0,
-            dissolved_oxygen_mg_L=0.3,  # Very low DO
-            chloride_mg_L=100.0,
-            pH=7.0,
-        )
-
-        # Should have warning about low DO
-        assert any("DO" in w or "oxygen" in w.lower()
-                  for w in result["provenance"]["warnings"])
-
-    def test_low_ph_warning(self):
-        """Test warning for low pH (outside aerated model range)"""
-        result = predict_aerated_chloride_corrosion(
-            temperature_C=25.0,
-            dissolved_oxygen_mg_L=8.0,
-            chloride_mg_L=100.0,
-            pH=5.5,  # Low pH
-        )
-
-        # Should have warning about low pH
-        assert any("pH" in w or "acidic" in w.lower()
-                  for w in result["provenance"]["warnings"])
-
-    def test_stainless_steel_raises_error(self):
-        """Test that stainless steel material raises appropriate error"""
-        with pytest.raises(ValueError, match="not valid for aerated corrosion model"):
-            predict_aerated_chloride_corrosion(
-                temperature_C=25.0,
-                dissolved_oxygen_mg_L=8.0,
-                chloride_mg_L=19000.0,
-                pH=8.1,
-                material="stainless_304",  # Invalid for this model
-            )
-
-    def test_temperature_out_of_range_raises_error(self):
-        """Test that temperature outside range raises ValueError"""
-        with pytest.raises(ValueError, match="outside model range"):
-            predict_aerated_chloride_corrosion(
-                temperature_C=100.0,  # Too high
-                dissolved_oxygen_mg_L=8.0,
-                chloride_mg_L=100.0,
-                pH=7.0,
-            )
-
-
+    @pytest.mark.parametrize("override, code", [
+        ({"dissolved_oxygen_mg_L": 0.3}, "LOW_DO"),  # Very low DO
+        ({"pH": 5.5}, "LOW_PH"),  # Low pH, outside aerated model range
+    ], ids=["low_do", "low_pH"])
+    def test_out_of_model_range_warning(self, override, code):
+        """Test warnings for low DO and low pH"""
+        result = predict_aerated_chloride_corrosion(**{**_AERATED_BASE, **override})
+        provenance = result["provenance"]
+
+        assert code in provenance["warning_codes"]
+        assert len(provenance["warning_codes"]) == len(provenance["warnings"])
+
+    def test_no_warnings_in_model_range(self):
+        """Test aerated freshwater at neutral pH raises no warning codes"""
+        result = predict_aerated_chloride_corrosion(**_AERATED_BASE)
+
+        assert result["provenance"]["warning_codes"] == []
+
+    @pytest.mark.parametrize("override, match", [
+        # Stainless steel is invalid for this model
+        ({"chloride_mg_L": 19000.0, "pH": 8.1, "material": "stainless_304"},
+         "not valid for aerated corrosion model"),
+        ({"temperature_C": 100.0}, "outside model range"),  # Too high
+    ], ids=["stainless_steel", "temperature"])
+    def test_invalid_input_raises_error(self, override, match):
+        """Test that invalid materials and temperatures raise ValueError"""
+        with pytest.raises(ValueError, match=match):
+            predict_aerated_chloride_corrosion(**{**_AERATED_BASE, **override})
+
+
+@pytest.mark.slow
 class TestPhase1Integration:
     """Integration tests for Phase 1 tool interactions"""
 
-    def test_speciation_to_co2_corrosion_workflow(self):
+    def test_speciation_to_co2_corrosion_workflow(self, speciate):
         """Test workflow: run speciation, then use results for CO₂ corrosion"""
         # Step 1: Run speciation on CO₂-saturated water
         ions_json = json.dumps({
@@ -430,20 +354,17 @@ class TestPhase1Integration:
             "HCO3-": 500.0,
         })
 
-        speciation_result = run_phreeqc_speciation(
+        speciation_result = speciate(
             ions_json=ions_json,
             temperature_C=40.0,
         )
 
         # Step 2: Use calculated pH for CO₂ corrosion prediction
         corrosion_result = predict_co2_h2s_corrosion(
-            temperature_C=40.0,
-            pressure_bar=10.0,
-            co2_fraction=0.05,
+            **_CO2_BASE,
             pH=speciation_result["pH"],  # Use from speciation
             bicarbonate_mg_L=500.0,
             ionic_strength_mg_L=speciation_result["ionic_strength_M"] * 1000,  # Convert to mg/L approx
-            pipe_diameter_m=0.2,
         )
 
         # Both should complete successfully
@@ -462,12 +383,7 @@ class TestPhase1Integration:
         )
 
         # ORR aerated corrosion
-        orr_result = predict_aerated_chloride_corrosion(
-            temperature_C=25.0,
-            dissolved_oxygen_mg_L=8.0,
-            chloride_mg_L=100.0,
-            pH=7.0,
-        )
+        orr_result = predict_aerated_chloride_corrosion(**_AERATED_BASE)
 
         # Mechanisms should be different
         assert norsok_result["mechanism"] != orr_result["mechanism"]
@@ -11,9 +11,14 @@ Tests cover:
 Total: 45+ tests
 """
 
+import re
+
 import pytest
 import numpy as np
-from pathlib import Path
+from math import isclose
+from types import MappingProxyType
+
+from fastmcp.exceptions import ToolError
 
 # Phase 2 imports
 from utils.nrl_constants import C
@@ -21,19 +26,88 @@ from utils.nrl_materials import (
     create_material,
     HY80,
     HY100,
-    SS316,
-    Ti,
     I625,
-    CuNi,
     CorrodingMetal
 )
 from utils.nrl_electrochemical_reactions import (
     ReactionType,
     CathodicReaction,
-    AnodicReaction
+    AnodicReaction,
+    ReactionBatch
+)
+from tools.mechanistic.predict_galvanic_corrosion import (
+    predict_galvanic_corrosion,
+    predict_galvanic_corrosion_batch,
+    build_polarization,
+    solve_mixed_potential
 )
-from tools.mechanistic.predict_galvanic_corrosion import predict_galvanic_corrosion
-from tools.chemistry.calculate_pourbaix import calculate_pourbaix
+from tools.chemistry.calculate_pourbaix import calculate_pourbaix, calculate_pourbaix_batch
+
+# Seawater conditions used across the material and reaction tests
+# (read-only views: shared by every test, override via {**_SEAWATER, ...})
+_SEAWATER = MappingProxyType({
+    "chloride_M": 0.54,
+    "temperature_C": 25.0,
+    "pH": 8.0,
+    "velocity_m_s": 0.0
+})
+
+# HY80 coefficients are invalid at seawater chloride; use brackish water
+_BRACKISH = MappingProxyType({**_SEAWATER, "chloride_M": 0.01})  # ~600 mg/L
+
+# Shared polarization sweep, V_SCE (read-only so no test can alter it for others)
+_DEFAULT_APPLIED_POTENTIALS = np.linspace(-1.5, 0.5, 100)
+_DEFAULT_APPLIED_POTENTIALS.flags.writeable = False
+
+# Corrosion-rate unit conversion
+MM_YEAR_TO_MPY = 39.3701  # 1 mm/year = 39.3701 mils/year
+
+# ORR reactant concentrations: O₂ (g/cm³, air-saturated seawater) and the
+# squared water term (c_H2O = 1.0 g/cm³ × 18 g/mol)²
+_C_O2_SEAWATER = 8.0e-6
+_C_H2O_TERM = (1.0 * 18.0) ** 2
+
+
+# HY80/SS316 couple in seawater (mg/L chloride), shared by the galvanic tests;
+# only area ratio, temperature or chloride vary, via {**_HY80_SS316_SEAWATER, ...}
+_HY80_SS316_SEAWATER = MappingProxyType({
+    "anode_material": "HY80",
+    "cathode_material": "SS316",
+    "temperature_C": 25.0,
+    "pH": 8.0,
+    "chloride_mg_L": 19000.0,
+})
+
+# MCP wrapper request for the same couple in brackish water
+_MCP_GALVANIC_PARAMS = MappingProxyType({
+    "anode_material": "HY80",
+    "cathode_material": "SS316",
+    "temperature_C": 25.0,
+    "pH": 7.5,
+    "chloride_mg_L": 800.0,
+    "area_ratio_cathode_to_anode": 50.0,
+})
+
+
+# pytest.raises(match=...) patterns, compiled once at import
+ERROR_PATTERNS = {
+    "hy80_seawater_chloride": re.compile(r"Cl=0\.540 M"),
+    "cannot_batch": re.compile(r"cannot be batched"),
+    "area_ratio_range": re.compile(r"out of reasonable range"),
+    "read_only": re.compile(r"read-only"),
+    "not_supported": re.compile(r"not supported"),
+    "out_of_range": re.compile(r"out of range"),
+    "unknown_material": re.compile(r"Unknown material"),
+    "invalid_material": re.compile(r"INVALID_MATERIAL.*not supported"),
+}
+
+
+def _assert_scalars(actual, expected, atol):
+    """Assert |actual - expected| < atol elementwise, with per-element atol."""
+    np.testing.assert_array_less(
+        np.abs(np.asarray(actual, dtype=float) - np.asarray(expected, dtype=float)),
+        atol,
+    )
 
 
 # ============================================================================
@@ -45,31 +119,32 @@ class TestNRLConstants:
 
     def test_faraday_constant(self):
         """Verify Faraday constant matches NIST value."""
-        assert abs(C.F - 96485.3) < 0.1
+        np.testing.assert_allclose(C.F, 96485.3, rtol=0, atol=0.1)
 
     def test_gas_constant(self):
         """Verify gas constant matches NIST value."""
-        assert abs(C.R - 8.314) < 0.001
+        np.testing.assert_allclose(C.R, 8.314, rtol=0, atol=0.001)
 
     def test_standard_electrode_potentials(self):
         """Verify standard potentials match literature."""
         # ORR in alkaline: O₂ + 2H₂O + 4e⁻ → 4OH⁻
-        assert abs(C.e0_orr_alk - 0.401) < 0.01
         # Fe oxidation: Fe → Fe²⁺ + 2e⁻
-        assert abs(C.e0_Fe_ox - (-0.501)) < 0.01
+        np.testing.assert_allclose(
+            [C.e0_orr_alk, C.e0_Fe_ox], [0.401, -0.501], rtol=0, atol=0.01
+        )
 
     def test_molar_masses(self):
         """Verify molar masses match periodic table."""
-        assert abs(C.M_Fe - 55.845) < 0.01
-        assert abs(C.M_Cr - 51.9961) < 0.01
-        assert abs(C.M_O2 - 32.0) < 0.1
+        _assert_scalars(
+            [C.M_Fe, C.M_Cr, C.M_O2], [55.845, 51.9961, 32.0], atol=[0.01, 0.01, 0.1]
+        )
 
     def test_pH_calculations(self):
         """Test H⁺ and OH⁻ concentration calculations."""
         cH, cOH = C.calculate_cH_and_cOH(7.0)
-        assert abs(cH - 1.0e-7) < 1e-9
-        assert abs(cOH - 1.0e-7) < 1e-9
-        assert abs(cH * cOH - 1.0e-14) < 1e-16
+        _assert_scalars(
+            [cH, cOH, cH * cOH], [1.0e-7, 1.0e-7, 1.0e-14], atol=[1e-9, 1e-9, 1e-16]
+        )
 
 
 # ============================================================================
@@ -79,27 +154,24 @@ class TestNRLConstants:
 class TestNRLMaterials:
     """Test material property classes."""
 
-    @pytest.fixture
-    def seawater_conditions(self):
-        """Standard seawater test conditions."""
-        return {
-            "chloride_M": 0.54,
-            "temperature_C": 25.0,
-            "pH": 8.0,
-            "velocity_m_s": 0.0
-        }
-
-    def test_create_material_factory(self, seawater_conditions):
+    def test_create_material_factory(self):
         """Test material factory function."""
-        material = create_material("HY80", **seawater_conditions)
+        material = create_material("HY80", **_SEAWATER)
         assert isinstance(material, HY80)
         assert material.name == "HY80"
 
-    def test_all_materials_instantiate(self, seawater_conditions):
+    def test_create_material_reuses_instances(self):
+        """Test identical conditions share one cached material instance."""
+        first = create_material("SS316", **_SEAWATER)
+
+        assert create_material("SS316", **_SEAWATER) is first
+        assert create_material("SS316", **{**_SEAWATER, "pH": 7.0}) is not first
+
+    def test_all_materials_instantiate(self):
         """Test all 6 materials can be created."""
         materials = ["HY80", "HY100", "SS316", "Ti", "I625", "CuNi"]
         for mat_name in materials:
-            mat = create_material(mat_name, **seawater_conditions)
+            mat = create_material(mat_name, **_SEAWATER)
             assert isinstance(mat, CorrodingMetal)
             assert mat.metal_mass > 0
             assert mat.oxidation_level_z > 0
@@ -111,13 +183,7 @@ class TestNRLMaterials:
         so we test at lower chloride conditions where coefficients are valid.
         """
         # Use lower chloride where HY80 works (e.g., brackish water)
-        valid_conditions = {
-            "chloride_M": 0.01,  # ~600 mg/L (brackish, not full seawater)
-            "temperature_C": 25.0,
-            "pH": 8.0,
-            "velocity_m_s": 0.0
-        }
-        hy80 = HY80("HY-80", **valid_conditions)
+        hy80 = create_material("HY80", **_BRACKISH)
 
         # Material properties
         assert hy80.metal_mass == 55.845  # Fe molar mass
@@ -134,9 +200,9 @@ class TestNRLMaterials:
         assert dg_c_orr > 0  # Must be positive (energy barrier)
         assert dg_a_orr > 0  # Must be positive (energy barrier)
 
-    def test_ss316_passivation_properties(self, seawater_conditions):
+    def test_ss316_passivation_properties(self):
         """Test SS316 passivation properties."""
-        ss316 = SS316("SS316", **seawater_conditions)
+        ss316 = create_material("SS316", **_SEAWATER)
 
         # Has passivation (not active oxidation for low-alloy steels)
         dg_c_pass, dg_a_pass = ss316.delta_g_metal_passivation
@@ -146,9 +212,9 @@ class TestNRLMaterials:
         # Higher passive current than Ti
         assert ss316.passive_current_density > 1.0e-6
 
-    def test_titanium_high_corrosion_resistance(self, seawater_conditions):
+    def test_titanium_high_corrosion_resistance(self):
         """Test titanium exceptional corrosion resistance."""
-        ti = Ti("Ti", **seawater_conditions)
+        ti = create_material("Ti", **_SEAWATER)
 
         # Very noble (positive) oxidation potential
         # (Actually Ti is very negative, but passivates immediately)
@@ -158,22 +224,10 @@ class TestNRLMaterials:
     def test_cuni_velocity_dependence(self):
         """Test CuNi velocity-dependent diffusion layer."""
         # Low velocity
-        cuni_low_v = CuNi(
-            "CuNi",
-            chloride_M=0.54,
-            temperature_C=25.0,
-            pH=8.0,
-            velocity_m_s=0.0
-        )
+        cuni_low_v = create_material("CuNi", **_SEAWATER)
 
         # High velocity
-        cuni_high_v = CuNi(
-            "CuNi",
-            chloride_M=0.54,
-            temperature_C=25.0,
-            pH=8.0,
-            velocity_m_s=5.0
-        )
+        cuni_high_v = create_material("CuNi", **{**_SEAWATER, "velocity_m_s": 5.0})
 
         # Higher velocity = thinner diffusion layer
         assert cuni_high_v.del_orr < cuni_low_v.del_orr
@@ -183,13 +237,7 @@ class TestNRLMaterials:
 
         Use valid conditions (lower chloride) for HY80.
         """
-        valid_conditions = {
-            "chloride_M": 0.01,  # Brackish water
-            "temperature_C": 25.0,
-            "pH": 8.0,
-            "velocity_m_s": 0.0
-        }
-        hy80 = HY80("HY-80", **valid_conditions)
+        hy80 = create_material("HY80", **_BRACKISH)
 
         # Calculate ΔG for different conditions (both within valid range)
         dg1 = hy80.calculate_delta_g("ORR", 0.01, 7.0, 25.0)
@@ -203,17 +251,11 @@ class TestNRLMaterials:
 
         Use valid conditions (lower chloride) for HY80.
         """
-        valid_conditions = {
-            "chloride_M": 0.01,  # Brackish water
-            "temperature_C": 25.0,
-            "pH": 8.0,
-            "velocity_m_s": 0.0
-        }
-        hy80 = HY80("HY-80", **valid_conditions)
+        hy80 = create_material("HY80", **_BRACKISH)
 
         # ORR activation energy at different pH (use low Cl to stay in valid range)
-        dg_c_low_pH, _ = hy80.calculate_delta_g("ORR", 0.01, 5.0, 25.0)
-        dg_c_high_pH, _ = hy80.calculate_delta_g("ORR", 0.01, 10.0, 25.0)
+        dg_c, _ = hy80.calculate_delta_g("ORR", 0.01, np.array([5.0, 10.0]), 25.0)
+        dg_c_low_pH, dg_c_high_pH = dg_c
 
         # pH correction should change activation energy
         assert dg_c_low_pH != dg_c_high_pH
@@ -223,21 +265,55 @@ class TestNRLMaterials:
 
         Use valid conditions (lower chloride) for HY80.
         """
-        valid_conditions = {
-            "chloride_M": 0.01,  # Brackish water
-            "temperature_C": 25.0,
-            "pH": 8.0,
-            "velocity_m_s": 0.0
-        }
-        hy80 = HY80("HY-80", **valid_conditions)
+        hy80 = create_material("HY80", **_BRACKISH)
 
         # Test at valid chloride range
-        dg_cold, _ = hy80.calculate_delta_g("ORR", 0.01, 8.0, 10.0)
-        dg_hot, _ = hy80.calculate_delta_g("ORR", 0.01, 8.0, 40.0)
+        dg_c, _ = hy80.calculate_delta_g("ORR", 0.01, 8.0, np.array([10.0, 40.0]))
+        dg_cold, dg_hot = dg_c
 
         # Temperature should affect activation energy (polynomial)
         assert dg_cold != dg_hot
 
+    def test_delta_g_grid_matches_scalar(self):
+        """Test a broadcast (Cl, pH, T) grid reproduces pointwise calculate_delta_g."""
+        ss316 = create_material("SS316", **_SEAWATER)
+
+        chloride = np.array([0.01, 0.1, 0.54])
+        pH = np.array([5.0, 8.0])[:, None]
+        temperature = np.array([10.0, 25.0, 40.0, 60.0])[:, None, None]
+
+        dg_c, dg_a = ss316.calculate_delta_g("Passivation", chloride, pH, temperature)
+
+        assert dg_c.shape == dg_a.shape == (4, 2, 3)
+        for i, T in enumerate(temperature.ravel()):
+            for j, p in enumerate(pH.ravel()):
+                for k, cl in enumerate(chloride):
+                    assert (dg_c[i, j, k], dg_a[i, j, k]) == ss316.calculate_delta_g(
+                        "Passivation", cl, p, T
+                    )
+
+    def test_negative_delta_g_in_grid_raises(self):
+        """Test a negative activation energy anywhere in a grid raises ValueError."""
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["hy80_seawater_chloride"]):
+            CorrodingMetal._validate_activation_energy(
+                np.array([1.0e5, -1.0e3]), 8.0e6, "ORR",
+                np.array([0.01, 0.54]), 25.0, 8.0,
+            )
+
+    def test_coefficient_table_loaded_once(self):
+        """Test all NRL coefficient files are parsed once and shared read-only."""
+        from utils.nrl_materials import _load_all_coefficients
+
+        table = _load_all_coefficients()
+        assert "HY80ORRCoeffs.csv" in table
+        assert all(c.shape == (6,) and not c.flags.writeable for c in table.values())
+
+        hy80 = create_material("HY80", **_BRACKISH)
+        assert hy80._load_csv_coefficients("HY80ORRCoeffs.csv") is table["HY80ORRCoeffs.csv"]
+
+        with pytest.raises(FileNotFoundError):
+            hy80._load_csv_coefficients("NoSuchCoeffs.csv")
+
 
 # ============================================================================
 # Test Suite 3: Electrochemical Reactions
@@ -249,27 +325,18 @@ class TestElectrochemicalReactions:
     @pytest.fixture
     def hy80_material(self):
         """HY-80 steel for reaction tests."""
-        return HY80(
-            "HY-80",
-            chloride_M=0.54,
-            temperature_C=25.0,
-            pH=8.0,
-            velocity_m_s=0.0
-        )
+        return create_material("HY80", **_SEAWATER)
 
     @pytest.fixture
     def applied_potentials(self):
         """Standard potential range for polarization curves."""
-        return np.linspace(-1.5, 0.5, 100)
+        return _DEFAULT_APPLIED_POTENTIALS
 
     def test_cathodic_orr_reaction(self, hy80_material, applied_potentials):
         """Test ORR cathodic reaction."""
-        c_O2 = 8.0e-6  # g/cm³ (air-saturated seawater)
-        c_H2O = 1.0  # g/cm³
-
         orr = CathodicReaction(
             reaction_type=ReactionType.ORR,
-            c_oxidized=[c_O2, (c_H2O * 18.0)**2],
+            c_oxidized=[_C_O2_SEAWATER, _C_H2O_TERM],
             c_reduced=[1.0, 1.0],
             temperature_C=25.0,
             z=4,
@@ -305,9 +372,9 @@ class TestElectrochemicalReactions:
         )
 
         # HER should dominate at negative potentials (low E)
-        # Applied potentials go from -1.5 V (index 0) to +0.5 V (index -1)
-        # HER current should be more negative at index 0 (low E)
-        assert her.i_total[0] < her.i_total[-1]  # More negative at low E (index 0)
+        # HER current should be more negative at -1.5 V than at +0.5 V
+        low, high = np.searchsorted(applied_potentials, [-1.5, 0.5])
+        assert her.i_total[low] < her.i_total[high]
 
     def test_anodic_fe_oxidation(self, hy80_material, applied_potentials):
         """Test Fe oxidation anodic reaction."""
@@ -320,18 +387,13 @@ class TestElectrochemicalReactions:
             metal=hy80_material
         )
 
-        # Anodic current should be positive
-        assert fe_ox.i_total[50] > 0  # At mid-range potential
+        # Anodic current should be positive at mid-range potential
+        idx = np.searchsorted(applied_potentials, -0.5)
+        assert fe_ox.i_total[idx] > 0
 
     def test_anodic_passivation_ss316(self):
         """Test passivation reaction with film resistance."""
-        ss316 = SS316(
-            "SS316",
-            chloride_M=0.54,
-            temperature_C=25.0,
-            pH=8.0,
-            velocity_m_s=0.0
-        )
+        ss316 = create_material("SS316", **_SEAWATER)
 
         applied_potentials = np.linspace(-0.5, 1.0, 100)
 
@@ -366,30 +428,112 @@ class TestElectrochemicalReactions:
         # At low potentials: activation control (i_total ≈ i_act)
         # At high overpotentials: diffusion control (i_total ≈ i_lim)
         # Use <= to handle edge case where they're equal at boundary
-        assert abs(orr.i_total[0]) <= abs(orr.i_lim[0])
+        idx = np.searchsorted(applied_potentials, -1.5)
+        assert abs(orr.i_total[idx]) <= abs(orr.i_lim[idx])
+
+    def test_bv_kernel_matches_closed_form(self, hy80_material, applied_potentials):
+        """Test the Butler-Volmer kernel reproduces the explicit B-V/K-L expressions."""
+        from utils.nrl_electrochemical_reactions import _bv_current
+
+        orr = CathodicReaction(
+            reaction_type=ReactionType.ORR,
+            c_oxidized=[8.0e-6, 1.0],
+            c_reduced=[1.0, 1.0],
+            temperature_C=25.0,
+            z=4,
+            e0_SHE=0.401,
+            diffusion_coefficient_cm2_s=2.0e-5,
+            applied_potentials_VSCE=applied_potentials,
+            metal=hy80_material
+        )
+
+        RT = C.R * orr.temperature_K
+        i_c = orr.i0_cathodic * np.exp(-((1.0 - orr.alpha) * orr.z * C.F * orr.eta) / RT)
+        i_a = orr.i0_anodic * np.exp((orr.alpha * orr.z * C.F * orr.eta) / RT)
+        i_act = i_a - i_c
+        expected = (orr.i_lim * i_act) / (i_act + orr.i_lim)
+
+        *_, i_total = _bv_current(
+            orr.eta, orr.i0_cathodic, orr.i0_anodic, orr.alpha,
+            orr.z * C.F / RT, orr.i_lim,
+        )
+
+        np.testing.assert_allclose(i_total, expected, rtol=1e-12)
+        np.testing.assert_allclose(orr.i_total, expected, rtol=1e-12)
+
+    def test_reaction_batch_matches_individual(self, hy80_material, applied_potentials):
+        """Test one batched evaluation reproduces each reaction's i_total."""
+        reactions = [
+            CathodicReaction(
+                reaction_type=ReactionType.ORR,
+                c_oxidized=[8.0e-6, 1.0],
+                c_reduced=[1.0, 1.0],
+                temperature_C=25.0,
+                z=4,
+                e0_SHE=0.401,
+                diffusion_coefficient_cm2_s=2.0e-5,
+                applied_potentials_VSCE=applied_potentials,
+                metal=hy80_material
+            ),
+            CathodicReaction(
+                reaction_type=ReactionType.HER,
+                c_oxidized=[1.0, 1.0],
+                c_reduced=[1.0, 1.0],
+                temperature_C=25.0,
+                z=2,
+                e0_SHE=-0.83,
+                diffusion_coefficient_cm2_s=2.3e-5,
+                applied_potentials_VSCE=applied_potentials,
+                metal=hy80_material
+            ),
+            AnodicReaction(
+                reaction_type=ReactionType.FE_OX,
+                c_reactants=(1.0,),
+                c_products=(1.0e-6,),
+                temperature_C=25.0,
+                applied_potentials_VSCE=applied_potentials,
+                metal=hy80_material
+            ),
+        ]
+
+        i_total = ReactionBatch.from_list(reactions, applied_potentials).current_densities()
+
+        assert i_total.shape == (3, len(applied_potentials))
+        for row, reaction in zip(i_total, reactions):
+            np.testing.assert_allclose(row, reaction.i_total, rtol=1e-12)
+
+        passivation = AnodicReaction(
+            reaction_type=ReactionType.PASSIVATION,
+            c_reactants=(1.0,),
+            c_products=(1.0e-6,),
+            temperature_C=25.0,
+            applied_potentials_VSCE=applied_potentials,
+            metal=create_material("SS316", **_SEAWATER)
+        )
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["cannot_batch"]):
+            ReactionBatch.from_list([passivation], applied_potentials)
 
 
 # ============================================================================
 # Test Suite 4: Galvanic Corrosion Prediction
 # ============================================================================
 
+@pytest.fixture(scope="module")
+def hy80_ss316_polarization():
+    """HY80/SS316 seawater polarization curves, built once for area-ratio sweeps"""
+    return build_polarization(**_HY80_SS316_SEAWATER)
+
+
 class TestGalvanicCorrosion:
     """Test galvanic corrosion prediction tool."""
 
-    def test_hy80_ss316_couple_seawater(self):
+    def test_hy80_ss316_couple_seawater(self, galvanic_couple):
         """Test HY-100/SS316 galvanic couple in seawater.
 
         Note: Changed from HY80 to HY100 because HY80 coefficients are invalid
         at seawater conditions (Cl=19 g/L). HY100 has valid coefficients.
         """
-        result = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=25.0,
-            pH=8.0,
-            chloride_mg_L=19000.0,  # Seawater
-            area_ratio_cathode_to_anode=1.0
-        )
+        result = galvanic_couple(**_HY80_SS316_SEAWATER)
 
         # Basic checks
         assert "mixed_potential_VSCE" in result
@@ -406,30 +550,13 @@ class TestGalvanicCorrosion:
         # Anode CR should be higher than isolated
         assert result["current_ratio"] > 1.0
 
-    def test_area_ratio_effect(self):
+    def test_area_ratio_effect(self, hy80_ss316_polarization):
         """Test effect of large cathode area on galvanic attack.
 
         Changed from HY80 to HY100 (HY80 invalid at seawater).
         """
-        # Small cathode area
-        result_small = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=25.0,
-            pH=8.0,
-            chloride_mg_L=19000.0,
-            area_ratio_cathode_to_anode=0.1  # Small cathode
-        )
-
-        # Large cathode area
-        result_large = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=25.0,
-            pH=8.0,
-            chloride_mg_L=19000.0,
-            area_ratio_cathode_to_anode=10.0  # Large cathode
-        )
+        result_small = solve_mixed_potential(hy80_ss316_polarization, 0.1)  # Small cathode
+        result_large = solve_mixed_potential(hy80_ss316_polarization, 10.0)  # Large cathode
 
         # Large cathode should cause more severe attack
         # Note: Current density may be similar (it's per unit area of anode)
@@ -470,54 +597,26 @@ class TestGalvanicCorrosion:
         assert result["anode_corrosion_rate_mm_year"] > 0
         assert result["cathode_corrosion_rate_mm_year"] == 0.0
 
-    def test_temperature_effect_on_galvanic(self):
+    def test_temperature_effect_on_galvanic(self, galvanic_couple):
         """Test temperature effect on galvanic corrosion.
 
         Changed from HY80 to HY100 (HY80 invalid at seawater).
         """
-        result_cold = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=10.0,
-            pH=8.0,
-            chloride_mg_L=19000.0,
-            area_ratio_cathode_to_anode=1.0
-        )
-
-        result_hot = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=60.0,
-            pH=8.0,
-            chloride_mg_L=19000.0,
-            area_ratio_cathode_to_anode=1.0
-        )
+        result_cold = galvanic_couple(**{**_HY80_SS316_SEAWATER, "temperature_C": 10.0})
+        result_hot = galvanic_couple(**{**_HY80_SS316_SEAWATER, "temperature_C": 60.0})
 
         # Higher temperature typically increases corrosion rate
         assert result_hot["galvanic_current_density_A_cm2"] != result_cold["galvanic_current_density_A_cm2"]
 
-    def test_chloride_effect_on_galvanic(self):
+    def test_chloride_effect_on_galvanic(self, galvanic_couple):
         """Test chloride concentration effect.
 
         Changed from HY80 to HY100 (HY80 invalid at seawater).
         """
-        result_fresh = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=25.0,
-            pH=8.0,
-            chloride_mg_L=100.0,  # Freshwater
-            area_ratio_cathode_to_anode=1.0
-        )
-
-        result_seawater = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=25.0,
-            pH=8.0,
-            chloride_mg_L=19000.0,  # Seawater
-            area_ratio_cathode_to_anode=1.0
+        result_fresh = galvanic_couple(
+            **{**_HY80_SS316_SEAWATER, "chloride_mg_L": 100.0}  # Freshwater
         )
+        result_seawater = galvanic_couple(**_HY80_SS316_SEAWATER)  # Seawater
 
         # Chloride effect depends on passivation behavior
         # For HY100/SS316, passivation of SS316 improves in seawater
@@ -525,7 +624,7 @@ class TestGalvanicCorrosion:
         # Verify chloride has an effect (values are different)
         assert result_seawater["galvanic_current_density_A_cm2"] != result_fresh["galvanic_current_density_A_cm2"]
 
-    def test_warnings_for_severe_attack(self):
+    def test_warnings_for_severe_attack(self, hy80_ss316_polarization):
         """Test warning system for severe galvanic attack.
 
         Note: After temperature unit fix, HY80/SS316 with large area ratio (50:1)
@@ -533,32 +632,50 @@ class TestGalvanicCorrosion:
         severe attack warnings. The test validates that the calculation completes
         successfully for large area ratios.
         """
-        result = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=25.0,
-            pH=8.0,
-            chloride_mg_L=19000.0,
-            area_ratio_cathode_to_anode=50.0  # Very large cathode
-        )
+        result = solve_mixed_potential(hy80_ss316_polarization, 50.0)  # Very large cathode
 
         # Should complete successfully and show some galvanic effect
         assert result["current_ratio"] > 1.0  # Some amplification from large area ratio
         assert result["anode_corrosion_rate_mm_year"] > 0  # Anode corrodes
 
-    def test_polarization_curve_output(self):
+    def test_solver_matches_full_prediction(self, galvanic_couple, hy80_ss316_polarization):
+        """Test a prebuilt couple solves to the same result as the full tool."""
+        assert solve_mixed_potential(hy80_ss316_polarization, 1.0) == galvanic_couple(
+            **_HY80_SS316_SEAWATER
+        )
+
+    def test_area_ratio_batch_matches_single_calls(self, galvanic_couple):
+        """Test a batched area-ratio sweep equals one full prediction per ratio."""
+        ratios = [0.1, 1.0, 10.0]
+        results = predict_galvanic_corrosion_batch(**_HY80_SS316_SEAWATER, area_ratios=ratios)
+
+        assert [r["area_ratio"] for r in results] == ratios
+        for ratio, result in zip(ratios, results):
+            assert result == galvanic_couple(
+                **_HY80_SS316_SEAWATER, area_ratio_cathode_to_anode=ratio
+            )
+
+    def test_area_ratio_batch_validates_every_ratio(self):
+        """Test one out-of-range ratio fails the batch before any solve."""
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["area_ratio_range"]):
+            predict_galvanic_corrosion_batch(**_HY80_SS316_SEAWATER, area_ratios=[1.0, -1.0])
+
+    def test_polarization_bundle_read_only(self, hy80_ss316_polarization):
+        """Test shared polarization curves cannot be edited in place."""
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["read_only"]):
+            hy80_ss316_polarization.anode_curves["total_current_A_cm2"][0] = 0.0
+
+    def test_solver_rejects_bad_area_ratio(self, hy80_ss316_polarization):
+        """Test the area ratio is validated by the solver itself."""
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["area_ratio_range"]):
+            solve_mixed_potential(hy80_ss316_polarization, 5000.0)
+
+    def test_polarization_curve_output(self, galvanic_couple):
         """Test polarization curve data is returned.
 
         Changed from HY80 to HY100 (HY80 invalid at seawater).
         """
-        result = predict_galvanic_corrosion(
-            anode_material="HY80",
-            cathode_material="SS316",
-            temperature_C=25.0,
-            pH=8.0,
-            chloride_mg_L=19000.0,
-            area_ratio_cathode_to_anode=1.0
-        )
+        result = galvanic_couple(**_HY80_SS316_SEAWATER)
 
         assert "polarization_curves" in result
         assert "potential_VSCE" in result["polarization_curves"]
@@ -578,16 +695,9 @@ class TestGalvanicCorrosion:
 class TestPourbaixDiagrams:
     """Test Pourbaix diagram calculation."""
 
-    def test_iron_pourbaix_basic(self):
+    def test_iron_pourbaix_basic(self, fe_pourbaix):
         """Test basic Fe Pourbaix diagram generation."""
-        result = calculate_pourbaix(
-            element="Fe",
-            temperature_C=25.0,
-            soluble_concentration_M=1.0e-6,
-            pH_range=(0, 14),
-            E_range_VSHE=(-1.5, 1.5),
-            grid_points=50
-        )
+        result = fe_pourbaix[25.0]
 
         # Basic structure checks
         assert result["element"] == "Fe"
@@ -600,71 +710,77 @@ class TestPourbaixDiagrams:
         assert "passivation" in result["regions"]
         assert "corrosion" in result["regions"]
 
-    def test_chromium_pourbaix(self):
+    def test_chromium_pourbaix(self, pourbaix_grid):
         """Test Cr Pourbaix diagram."""
         result = calculate_pourbaix(
             element="Cr",
             temperature_C=25.0,
-            soluble_concentration_M=1.0e-6
+            soluble_concentration_M=1.0e-6,
+            grid_points=pourbaix_grid
         )
 
         assert result["element"] == "Cr"
         assert len(result["boundaries"]) > 0
 
-    def test_water_stability_lines(self):
+    def test_water_stability_lines(self, fe_pourbaix):
         """Test H₂O stability limits."""
-        result = calculate_pourbaix(
-            element="Fe",
-            temperature_C=25.0
-        )
+        result = fe_pourbaix[25.0]
 
         # Should have H₂ and O₂ evolution lines
         assert "H2_evolution" in result["water_lines"]
         assert "O2_evolution" in result["water_lines"]
 
         # H₂ line should be below O₂ line at all pH
-        H2_line = np.array(result["water_lines"]["H2_evolution"])
-        O2_line = np.array(result["water_lines"]["O2_evolution"])
+        H2_line = np.asarray(result["water_lines"]["H2_evolution"], dtype=np.float64)
+        O2_line = np.asarray(result["water_lines"]["O2_evolution"], dtype=np.float64)
 
-        assert np.all(O2_line[:, 1] > H2_line[:, 1])
+        assert (O2_line[:, 1] - H2_line[:, 1]).min() > 0
 
-    def test_temperature_effect_on_pourbaix(self):
+    def test_temperature_effect_on_pourbaix(self, fe_pourbaix):
         """Test temperature effect on Pourbaix boundaries."""
-        result_25C = calculate_pourbaix(
-            element="Fe",
-            temperature_C=25.0
-        )
-
-        result_80C = calculate_pourbaix(
-            element="Fe",
-            temperature_C=80.0
-        )
+        result_25C = fe_pourbaix[25.0]
+        result_80C = fe_pourbaix[80.0]
 
         # Water lines should shift with temperature
         # (Nernst equation temperature dependence)
-        assert result_25C["water_lines"] != result_80C["water_lines"]
+        O2_25C = np.asarray(result_25C["water_lines"]["O2_evolution"], dtype=np.float64)
+        O2_80C = np.asarray(result_80C["water_lines"]["O2_evolution"], dtype=np.float64)
+        assert not np.allclose(O2_25C, O2_80C)
 
-    def test_all_supported_elements(self):
+    @pytest.mark.parametrize("element", ["Fe", "Cr", "Ni", "Cu", "Ti", "Al"])
+    def test_all_supported_elements(self, element):
         """Test all supported elements can generate Pourbaix diagrams."""
-        elements = ["Fe", "Cr", "Ni", "Cu", "Ti", "Al"]
+        result = calculate_pourbaix(
+            element=element,
+            temperature_C=25.0,
+            grid_points=20  # Coarse grid for speed
+        )
+        assert result["element"] == element
+        assert len(result["boundaries"]) > 0
 
-        for element in elements:
-            result = calculate_pourbaix(
-                element=element,
-                temperature_C=25.0,
-                grid_points=20  # Coarse grid for speed
+    def test_batch_matches_single_element(self):
+        """Test batched diagrams equal individual calculate_pourbaix results."""
+        results = calculate_pourbaix_batch(["Fe", "Cu"], temperature_C=60.0, grid_points=20)
+
+        assert list(results) == ["Fe", "Cu"]
+        for element, result in results.items():
+            assert result == calculate_pourbaix(
+                element=element, temperature_C=60.0, grid_points=20
             )
-            assert result["element"] == element
-            assert len(result["boundaries"]) > 0
+
+    def test_batch_rejects_any_unsupported_element(self):
+        """Test one unsupported element fails the whole batch."""
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["not_supported"]):
+            calculate_pourbaix_batch(["Fe", "Ag"])
 
     def test_unsupported_element_raises_error(self):
         """Test error for unsupported element."""
-        with pytest.raises(ValueError, match="not supported"):
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["not_supported"]):
             calculate_pourbaix(element="Ag", temperature_C=25.0)
 
     def test_invalid_temperature_raises_error(self):
         """Test error for temperature out of range."""
-        with pytest.raises(ValueError, match="out of range"):
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["out_of_range"]):
             calculate_pourbaix(element="Fe", temperature_C=150.0)
 
 
@@ -677,7 +793,7 @@ class TestEdgeCases:
 
     def test_invalid_material_name(self):
         """Test error for invalid material."""
-        with pytest.raises(ValueError, match="Unknown material"):
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["unknown_material"]):
             create_material(
                 "UnknownAlloy",
                 chloride_M=0.54,
@@ -687,7 +803,7 @@ class TestEdgeCases:
 
     def test_temperature_out_of_range(self):
         """Test temperature validation."""
-        with pytest.raises(ValueError, match="out of range"):
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["out_of_range"]):
             predict_galvanic_corrosion(
                 anode_material="HY80",
                 cathode_material="SS316",
@@ -698,7 +814,7 @@ class TestEdgeCases:
 
     def test_pH_out_of_range(self):
         """Test pH validation."""
-        with pytest.raises(ValueError, match="out of range"):
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["out_of_range"]):
             predict_galvanic_corrosion(
                 anode_material="HY80",
                 cathode_material="SS316",
@@ -709,7 +825,7 @@ class TestEdgeCases:
 
     def test_negative_area_ratio(self):
         """Test area ratio validation."""
-        with pytest.raises(ValueError, match="out of reasonable range"):
+        with pytest.raises(ValueError, match=ERROR_PATTERNS["area_ratio_range"]):
             predict_galvanic_corrosion(
                 anode_material="HY80",
                 cathode_material="SS316",
@@ -719,27 +835,23 @@ class TestEdgeCases:
                 area_ratio_cathode_to_anode=-1.0
             )
 
-    def test_csv_file_exists(self):
+    def test_csv_file_exists(self, external_manifest):
         """Test CSV coefficient files exist."""
-        csv_dir = Path(__file__).parent.parent / "external" / "nrl_coefficients"
-
         # Check a few key CSV files
-        assert (csv_dir / "HY80ORRCoeffs.csv").exists()
-        assert (csv_dir / "SS316PassCoeffs.csv").exists()
-        assert (csv_dir / "TiORRCoeffs.csv").exists()
+        assert "nrl_coefficients/HY80ORRCoeffs.csv" in external_manifest
+        assert "nrl_coefficients/SS316PassCoeffs.csv" in external_manifest
+        assert "nrl_coefficients/TiORRCoeffs.csv" in external_manifest
 
-    def test_provenance_documentation_exists(self):
+    def test_provenance_documentation_exists(self, external_manifest):
         """Test PROVENANCE.md exists."""
-        provenance_file = Path(__file__).parent.parent / "external" / "nrl_coefficients" / "PROVENANCE.md"
-        assert provenance_file.exists()
+        assert "nrl_coefficients/PROVENANCE.md" in external_manifest
 
-    def test_matlab_reference_files_exist(self):
+    def test_matlab_reference_files_exist(self, external_manifest):
         """Test MATLAB reference files are organized."""
-        matlab_dir = Path(__file__).parent.parent / "external" / "nrl_matlab_reference"
-        assert matlab_dir.exists()
-        assert (matlab_dir / "Constants.m").exists()
-        assert (matlab_dir / "HY80.m").exists()
-        assert (matlab_dir / "README.md").exists()
+        assert "nrl_matlab_reference" in external_manifest
+        assert "nrl_matlab_reference/Constants.m" in external_manifest
+        assert "nrl_matlab_reference/HY80.m" in external_manifest
+        assert "nrl_matlab_reference/README.md" in external_manifest
 
 
 # ============================================================================
@@ -749,109 +861,68 @@ class TestEdgeCases:
 class TestMCPServerIntegration:
     """Test MCP server wrappers and schema validation (Bug regression tests)."""
 
-    @pytest.mark.asyncio
-    async def test_assess_galvanic_corrosion_wrapper(self):
+    @pytest.mark.parametrize("params, expected_do", [
+        (_MCP_GALVANIC_PARAMS, None),
+        ({**_MCP_GALVANIC_PARAMS, "dissolved_oxygen_mg_L": 5.0}, 5.0),
+    ], ids=["calculated_do", "explicit_do"])
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_assess_galvanic_corrosion_wrapper(self, mcp_client, params, expected_do):
         """
         Test full MCP wrapper with schema validation via FastMCP Client.
 
         Regression test for:
         - Bug #2a: Missing anode_corrosion_rate_mpy field
         - Bug #2b: String 'calculated' in environment dict (should be float)
+
+        With explicit dissolved oxygen the wrapper must echo the user value.
         """
-        from fastmcp import Client
-        from server import mcp
-        from core.schemas import GalvanicCorrosionResult
+        result = await mcp_client.call_tool(
+            "corrosion_assess_galvanic", {"params": dict(params)}
+        )
 
-        # Use FastMCP in-memory client for proper protocol testing
-        async with Client(mcp) as client:
-            result = await client.call_tool(
-                "corrosion_assess_galvanic",
-                {
-                    "params": {
-                        "anode_material": "HY80",
-                        "cathode_material": "SS316",
-                        "temperature_C": 25.0,
-                        "pH": 7.5,
-                        "chloride_mg_L": 800.0,
-                        "area_ratio_cathode_to_anode": 50.0
-                    }
-                }
-            )
+        # Typed output schema: structured content is already a dict
+        parsed = result.structured_content
+
+        # Verify critical fields exist
+        assert 'anode_corrosion_rate_mm_year' in parsed
+        assert 'anode_corrosion_rate_mpy' in parsed
+        assert 'mixed_potential_VSCE' in parsed
+        assert 'galvanic_current_density_A_cm2' in parsed
+
+        # Verify mpy conversion is correct
+        assert isclose(
+            parsed['anode_corrosion_rate_mpy'],
+            parsed['anode_corrosion_rate_mm_year'] * MM_YEAR_TO_MPY,
+            abs_tol=0.1
+        )
+
+        # Verify environment dict contains all numeric values (Bug #2b regression)
+        assert 'environment' in parsed
+        dissolved_oxygen = parsed['environment']['dissolved_oxygen_mg_L']
+        # Should NOT be the string 'calculated'
+        assert isinstance(dissolved_oxygen, (int, float))
+        if expected_do is not None:
+            # Should use user-provided value
+            assert dissolved_oxygen == expected_do
 
-            # Parse result data
-            result_data = result.content[0].text
-            import json
-            parsed = json.loads(result_data)
-
-            # Verify critical fields exist
-            assert 'anode_corrosion_rate_mm_year' in parsed
-            assert 'anode_corrosion_rate_mpy' in parsed
-            assert 'mixed_potential_VSCE' in parsed
-            assert 'galvanic_current_density_A_cm2' in parsed
-
-            # Verify mpy conversion is correct (1 mm/year = 39.3701 mils/year)
-            expected_mpy = parsed['anode_corrosion_rate_mm_year'] * 39.3701
-            assert abs(parsed['anode_corrosion_rate_mpy'] - expected_mpy) < 0.1
-
-            # Verify environment dict contains all numeric values (Bug #2b regression)
-            assert 'environment' in parsed
-            assert 'dissolved_oxygen_mg_L' in parsed['environment']
-            assert isinstance(parsed['environment']['dissolved_oxygen_mg_L'], (int, float))
-            # Should NOT be the string 'calculated'
-            assert parsed['environment']['dissolved_oxygen_mg_L'] != 'calculated'
-
-    @pytest.mark.asyncio
-    async def test_mcp_wrapper_with_explicit_dissolved_oxygen(self):
-        """Test MCP wrapper when user provides explicit dissolved oxygen."""
-        from fastmcp import Client
-        from server import mcp
-
-        async with Client(mcp) as client:
-            result = await client.call_tool(
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_mcp_wrapper_error_handling(self, mcp_client):
+        """Test MCP wrapper raises proper error on failure."""
+        # Invalid material should raise ToolError with validation error
+        with pytest.raises(ToolError, match=ERROR_PATTERNS["invalid_material"]):
+            await mcp_client.call_tool(
                 "corrosion_assess_galvanic",
                 {
                     "params": {
-                        "anode_material": "HY80",
+                        "anode_material": "INVALID_MATERIAL",
                         "cathode_material": "SS316",
                         "temperature_C": 25.0,
                         "pH": 7.5,
-                        "chloride_mg_L": 800.0,
-                        "area_ratio_cathode_to_anode": 50.0,
-                        "dissolved_oxygen_mg_L": 5.0
+                        "chloride_mg_L": 800.0
                     }
                 }
             )
 
-            # Parse result
-            import json
-            parsed = json.loads(result.content[0].text)
-
-            # Should use user-provided value
-            assert parsed['environment']['dissolved_oxygen_mg_L'] == 5.0
-
-    @pytest.mark.asyncio
-    async def test_mcp_wrapper_error_handling(self):
-        """Test MCP wrapper raises proper error on failure."""
-        from fastmcp import Client
-        from fastmcp.exceptions import ToolError
-        from server import mcp
-
-        async with Client(mcp) as client:
-            # Invalid material should raise ToolError with validation error
-            with pytest.raises(ToolError, match="INVALID_MATERIAL.*not supported"):
-                await client.call_tool(
-                    "corrosion_assess_galvanic",
-                    {
-                        "params": {
-                            "anode_material": "INVALID_MATERIAL",
-                            "cathode_material": "SS316",
-                            "temperature_C": 25.0,
-                            "pH": 7.5,
-                            "chloride_mg_L": 800.0
-                        }
-                    }
-                )
-
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -16,10 +16,22 @@ Date: 2025-10-19
 Codex Session: 0199ff66-c28e-7cf0-86b4-1f7b3abe09ba
 """
 
+from types import MappingProxyType
+
 import pytest
 from tools.mechanistic.localized_corrosion import calculate_localized_corrosion
 
 
+# SS316 in aerated seawater, assessed once and shared by the tests below
+_SS316_SEAWATER = MappingProxyType({
+    "material": "SS316",
+    "temperature_C": 25.0,
+    "Cl_mg_L": 19000.0,  # Seawater chloride
+    "pH": 8.0,
+    "dissolved_oxygen_mg_L": 8.0,  # Aerated seawater
+})
+
+
 # Test 1: Tier 1 only (no DO provided)
 def test_tier1_only_316L():
     """Test Tier 1 PREN/CPT assessment without dissolved oxygen."""
@@ -52,17 +64,39 @@ def test_tier1_only_316L():
     assert result["pitting"]["susceptibility"] in ["low", "moderate", "high", "critical"]
 
 
-# Test 2: Tier 1 + Tier 2 (SS316 with DO, seawater conditions)
-def test_tier1_tier2_SS316_seawater():
-    """Test dual-tier assessment for SS316 in seawater with dissolved oxygen."""
+def test_tier1_only_no_tier2_cost(monkeypatch):
+    """Test that without DO the Tier 2 kinetics are never evaluated."""
+    tier2_calls = []
+
+    def record(name):
+        def fake(*args, **kwargs):
+            tier2_calls.append(name)
+            raise AssertionError(f"{name} called without dissolved oxygen")
+        return fake
+
+    monkeypatch.setattr(
+        "utils.pitting_assessment.calculate_pitting_potential",
+        record("calculate_pitting_potential"),
+    )
+    monkeypatch.setattr("utils.redox_state.do_to_eh", record("do_to_eh"))
+
     result = calculate_localized_corrosion(
-        material="SS316",
+        material="SS316",  # NRL material, so only the missing DO skips Tier 2
         temperature_C=25.0,
-        Cl_mg_L=19000.0,  # Seawater chloride
+        Cl_mg_L=19000.0,
         pH=8.0,
-        dissolved_oxygen_mg_L=8.0,  # Aerated seawater
     )
 
+    assert tier2_calls == []
+    assert result["pitting"]["E_pit_VSCE"] is None
+    assert result["pitting"]["electrochemical_interpretation"] is None
+
+
+# Test 2:Tier 1 + Tier 2 (SS316 with DO, seawater conditions)
+def test_tier1_tier2_SS316_seawater(localized_corrosion):
+    """Test dual-tier assessment for SS316 in seawater with dissolved oxygen."""
+    result = localized_corrosion(**_SS316_SEAWATER)
+
     # Tier 1 fields must be present
     assert "pitting" in result
     assert result["pitting"]["CPT_C"] is not None
@@ -179,15 +213,9 @@ def test_tier2_low_DO_anaerobic():
 
 
 # Test 6: Output structure validation
-def test_output_structure():
+def test_output_structure(localized_corrosion):
     """Validate complete output structure matches documentation."""
-    result = calculate_localized_corrosion(
-        material="SS316",
-        temperature_C=25.0,
-        Cl_mg_L=19000.0,
-        pH=8.0,
-        dissolved_oxygen_mg_L=8.0,
-    )
+    result = localized_corrosion(**_SS316_SEAWATER)
 
     # Top-level keys
     assert "pitting" in result
@@ -21,6 +21,12 @@ from utils.redox_state import (
     create_redox_state_from_do,
     create_redox_state_from_orp,
 )
+from utils.redox_state import (
+    _DO_SAT_MAX_ERROR_MG_L,
+    _do_saturation_kernel,
+    _do_saturation_scalar,
+)
+from utils.oxygen_solubility import MMHG_PER_MB, calculate_do_saturation
 
 
 # ==============================================================================
@@ -48,12 +54,11 @@ class TestDOSaturation:
 
     def test_do_decreases_with_temperature(self):
         """DO solubility should decrease with increasing temperature."""
-        temps = [5, 15, 25, 35]
-        saturations = [do_saturation(T) for T in temps]
+        temps = np.array([5.0, 15.0, 25.0, 35.0])
+        saturations = do_saturation(temps)
 
-        for i in range(len(temps) - 1):
-            assert saturations[i] > saturations[i+1], \
-                f"DO should decrease with T: {saturations[i]:.1f} > {saturations[i+1]:.1f}"
+        assert np.all(np.diff(saturations) < 0), \
+            f"DO should decrease with T: {saturations}"
 
     def test_altitude_effect(self):
         """DO saturation should decrease with altitude (lower pressure)."""
@@ -64,6 +69,59 @@ class TestDOSaturation:
         assert DO_denver < DO_sea_level
         assert abs(DO_denver / DO_sea_level - 0.83) < 0.02  # Proportional to pressure
 
+    def test_matches_authoritative_garcia_benson(self):
+        """The saturation ufunc reproduces utils.oxygen_solubility over a T-P grid."""
+        temps = np.linspace(0.0, 40.0, 9)
+        pressures = np.array([0.7, 0.83, 1.0])
+
+        expected = [
+            [calculate_do_saturation(T, pressure_mbar=P * 1013.25) for P in pressures]
+            for T in temps
+        ]
+        np.testing.assert_allclose(
+            _do_saturation_kernel(temps[:, None], pressures[None, :] * 1013.25 * MMHG_PER_MB),
+            expected,
+            rtol=1e-12,
+        )
+        np.testing.assert_allclose(
+            henry_constant_o2(temps),
+            [calculate_do_saturation(T) / (0.2095 * 32.0 * 1000) for T in temps],
+            rtol=1e-12,
+        )
+
+    def test_lookup_table_accuracy(self):
+        """Bilinear lookup stays within the documented bound of the exact model, scalar or array."""
+        rng = np.random.default_rng(0)
+        # Random points plus T cell midpoints, where the interpolation error peaks
+        temps = np.concatenate([rng.uniform(0.0, 40.0, 500), np.repeat(np.arange(0.125, 40.0, 0.25), 3)])
+        pressures = np.concatenate([rng.uniform(0.5, 1.1, 500), np.tile([0.5, 1.0, 1.1], 160)])
+
+        exact = calculate_do_saturation(temps, pressure_mbar=pressures * 1013.25)
+        looked_up = do_saturation(temps, pressures)
+
+        assert np.max(np.abs(looked_up - exact)) < _DO_SAT_MAX_ERROR_MG_L
+        np.testing.assert_allclose(
+            [do_saturation(T, P) for T, P in zip(temps[:20], pressures[:20])],
+            looked_up[:20],
+            rtol=1e-12,
+        )
+
+    def test_scalar_results_memoized(self):
+        """Repeated scalar calls are served from the cache, numpy scalars included."""
+        first = do_saturation(25.0)
+        hits = _do_saturation_scalar.cache_info().hits
+
+        assert do_saturation(np.float64(25.0), pressure_atm=1) == first
+        assert _do_saturation_scalar.cache_info().hits == hits + 1
+
+    @pytest.mark.parametrize("temp_C, pressure_atm", [(45.0, 1.0), (25.0, 1.0 / 0.21)])
+    def test_off_grid_uses_exact_model(self, temp_C, pressure_atm):
+        """Points outside the tabulated range fall back to the exact model."""
+        exact = calculate_do_saturation(temp_C, pressure_mbar=pressure_atm * 1013.25)
+
+        assert do_saturation(temp_C, pressure_atm) == pytest.approx(exact, rel=1e-12)
+        assert do_saturation(np.array([temp_C]), pressure_atm)[0] == pytest.approx(exact, rel=1e-12)
+
 
 # ==============================================================================
 # Test DO → Eh Conversion vs Pourbaix Atlas
@@ -97,27 +155,21 @@ class TestDOtoEh:
     def test_eh_decreases_with_ph(self):
         """Eh should decrease ~59 mV per pH unit (Nernst slope)."""
         DO = 8.0  # mg/L
-        pHs = [6.0, 7.0, 8.0, 9.0]
-        Ehs = [do_to_eh(DO, pH, 25.0)[0] for pH in pHs]
+        pHs = np.array([6.0, 7.0, 8.0, 9.0])
+        Ehs, _ = do_to_eh(DO, pHs, 25.0)
 
         # Check slope ~-0.059 V/pH
-        for i in range(len(pHs) - 1):
-            dEh = Ehs[i+1] - Ehs[i]
-            dpH = pHs[i+1] - pHs[i]
-            slope = dEh / dpH
-
-            assert abs(slope - (-0.059)) < 0.005, \
-                f"Nernst slope = {slope:.3f} V/pH, expected -0.059 V/pH"
+        slopes = np.diff(Ehs) / np.diff(pHs)
+        assert np.all(np.abs(slopes - (-0.059)) < 0.005), \
+            f"Nernst slopes = {slopes} V/pH, expected -0.059 V/pH"
 
     def test_eh_increases_with_do(self):
         """Eh should increase with DO (more oxidizing)."""
         pH = 7.0
-        DOs = [0.5, 2.0, 5.0, 8.0]
-        Ehs = [do_to_eh(DO, pH, 25.0)[0] for DO in DOs]
+        DOs = np.array([0.5, 2.0, 5.0, 8.0])
+        Ehs, _ = do_to_eh(DOs, pH, 25.0)
 
-        for i in range(len(DOs) - 1):
-            assert Ehs[i] < Ehs[i+1], \
-                f"Eh should increase with DO: {Ehs[i]:.3f} < {Ehs[i+1]:.3f}"
+        assert np.all(np.diff(Ehs) > 0), f"Eh should increase with DO: {Ehs}"
 
     def test_anaerobic_warning(self):
         """Should warn when DO < 0.01 mg/L (anaerobic)."""
@@ -182,6 +234,27 @@ class TestEhtoDO:
             f"Low Eh ({Eh} V) should give near-zero DO: {DO:.4f} mg/L"
         assert len(warnings) > 0  # Should warn about anaerobic
 
+    def test_array_roundtrip_matches_scalar(self):
+        """Vectorized DO → Eh → DO matches per-point scalar calls."""
+        DOs = np.array([0.5, 2.0, 5.0, 8.0])
+        temps = np.array([10.0, 20.0, 30.0, 40.0])
+
+        Ehs, _ = do_to_eh(DOs, 7.5, temps)
+        DO_recovered, _ = eh_to_do(Ehs, 7.5, temps)
+
+        assert Ehs.shape == DOs.shape
+        np.testing.assert_allclose(
+            Ehs, [do_to_eh(DO, 7.5, T)[0] for DO, T in zip(DOs, temps)], rtol=1e-12
+        )
+        np.testing.assert_allclose(DO_recovered, DOs, rtol=1e-9)
+
+    def test_array_warnings_raised_once(self):
+        """A sweep with several anaerobic points yields one warning."""
+        _, warnings = do_to_eh(np.array([0.001, 0.005, 8.0]), 7.0, 25.0)
+
+        assert len(warnings) == 1
+        assert "anaerobic" in warnings[0].lower()
+
 
 # ==============================================================================
 # Test ORP Conversions
@@ -318,12 +391,11 @@ class TestTemperatureEffects:
         K_H = c/p decreases. This is distinct from the "inverse Henry constant"
         (p/c) which would increase with temperature.
         """
-        temps = [5, 15, 25, 35]
-        K_Hs = [henry_constant_o2(T) for T in temps]
+        temps = np.array([5.0, 15.0, 25.0, 35.0])
+        K_Hs = henry_constant_o2(temps)
 
-        for i in range(len(temps) - 1):
-            assert K_Hs[i] > K_Hs[i+1], \
-                f"K_H should decrease with T (less soluble): {K_Hs[i]:.2e} > {K_Hs[i+1]:.2e}"
+        assert np.all(np.diff(K_Hs) < 0), \
+            f"K_H should decrease with T (less soluble): {K_Hs}"
 
     def test_nernst_temperature_correction(self):
         """Nernst equation slope should change with temperature."""
@@ -338,6 +410,14 @@ class TestTemperatureEffects:
         assert abs(Eh_35 - Eh_25) < 0.05, \
             f"Eh change with T should be modest: ΔEh = {abs(Eh_35 - Eh_25):.3f} V"
 
+    def test_temperature_sweep_matches_scalar(self):
+        """Array temperatures give the same Nernst factors as memoized scalar calls."""
+        temps = np.array([5.0, 15.0, 25.0, 35.0])
+
+        Ehs, _ = do_to_eh(8.0, 7.0, temps)
+
+        np.testing.assert_array_equal(Ehs, [do_to_eh(8.0, 7.0, T)[0] for T in temps])
+
 
 # ==============================================================================
 # Run Tests
@@ -26,12 +26,13 @@ except ImportError:
 
 # Phase 2 Tools (Tier 2 - Galvanic Corrosion and Pourbaix)
 from tools.mechanistic.predict_galvanic_corrosion import predict_galvanic_corrosion
-from tools.chemistry.calculate_pourbaix import calculate_pourbaix
+from tools.chemistry.calculate_pourbaix import calculate_pourbaix, calculate_pourbaix_batch
 
 __all__ = [
     # Phase 2 (always available)
     "predict_galvanic_corrosion",
     "calculate_pourbaix",
+    "calculate_pourbaix_batch",
 ]
 
 # Add Phase 1 tools if available
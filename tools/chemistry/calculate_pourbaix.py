@@ -170,14 +170,109 @@ def calculate_pourbaix(
         - Corrosion: Metal dissolves (active corrosion expected)
         - Water stability: pH-dependent H₂ and O₂ evolution lines
     """
-    # Validate inputs
-    supported_elements = ["Fe", "Cr", "Ni", "Cu", "Ti", "Al"]
-    if element not in supported_elements:
-        raise ValueError(
-            f"Element '{element}' not supported. "
-            f"Supported elements: {supported_elements}"
+    _validate_elements([element])
+    pH_grid, E_grid, grid_points, warnings = _prepare_grids(
+        temperature_C, pH_range, E_range_VSHE, grid_points
+    )
+
+    # Calculate water stability lines
+    water_lines = _calculate_water_stability(pH_grid, temperature_C)
+
+    return _build_diagram(
+        element,
+        temperature_C,
+        soluble_concentration_M,
+        pH_range,
+        E_range_VSHE,
+        pH_grid,
+        E_grid,
+        grid_points,
+        water_lines,
+        warnings,
+        include_species
+    )
+
+
+def calculate_pourbaix_batch(
+    elements: List[str],
+    temperature_C: float = 25.0,
+    soluble_concentration_M: float = 1.0e-6,
+    pH_range: Tuple[float, float] = (0.0, 14.0),
+    E_range_VSHE: Tuple[float, float] = (-2.0, 2.0),
+    grid_points: int = 50,
+    include_species: Optional[List[str]] = None
+) -> Dict[str, Dict]:
+    """
+    Calculate Pourbaix diagrams for several elements under the same conditions.
+
+    Inputs are validated and the pH/E grids and water stability lines are
+    built once, then shared by every element; each diagram is identical to
+    the corresponding calculate_pourbaix() result.
+
+    Args:
+        elements: Chemical element symbols (see calculate_pourbaix)
+        temperature_C, soluble_concentration_M, pH_range, E_range_VSHE,
+        grid_points, include_species: As for calculate_pourbaix
+
+    Returns:
+        Dictionary mapping each element to its calculate_pourbaix() result
+
+    Raises:
+        ValueError: If any element is not supported or parameters out of range
+
+    Example:
+        >>> diagrams = calculate_pourbaix_batch(["Fe", "Cr", "Ni"], grid_points=20)
+        >>> sorted(diagrams)
+        ['Cr', 'Fe', 'Ni']
+    """
+    _validate_elements(elements)
+    pH_grid, E_grid, grid_points, warnings = _prepare_grids(
+        temperature_C, pH_range, E_range_VSHE, grid_points
+    )
+    water_lines = _calculate_water_stability(pH_grid, temperature_C)
+
+    return {
+        element: _build_diagram(
+            element,
+            temperature_C,
+            soluble_concentration_M,
+            pH_range,
+            E_range_VSHE,
+            pH_grid,
+            E_grid,
+            grid_points,
+            # Per-diagram copies so callers can edit one result safely
+            {name: [list(point) for point in line] for name, line in water_lines.items()},
+            list(warnings),
+            include_species
         )
+        for element in elements
+    }
+
+
+def _validate_elements(elements: List[str]) -> None:
+    """Raise ValueError for any element without Pourbaix reaction data."""
+    supported_elements = ["Fe", "Cr", "Ni", "Cu", "Ti", "Al"]
+    for element in elements:
+        if element not in supported_elements:
+            raise ValueError(
+                f"Element '{element}' not supported. "
+                f"Supported elements: {supported_elements}"
+            )
+
+
+def _prepare_grids(
+    temperature_C: float,
+    pH_range: Tuple[float, float],
+    E_range_VSHE: Tuple[float, float],
+    grid_points: int
+) -> Tuple[np.ndarray, np.ndarray, int, List[str]]:
+    """
+    Validate diagram conditions and build the pH and E grids.
 
+    Returns:
+        (pH_grid, E_grid, grid_points, warnings), with grid_points clamped
+    """
     if not (0.0 <= temperature_C <= 100.0):
         raise ValueError(f"Temperature {temperature_C}°C out of range (0-100°C)")
 
@@ -198,6 +293,23 @@ def calculate_pourbaix(
     pH_grid = np.linspace(pH_range[0], pH_range[1], grid_points)
     E_grid = np.linspace(E_range_VSHE[0], E_range_VSHE[1], grid_points)
 
+    return pH_grid, E_grid, grid_points, warnings
+
+
+def _build_diagram(
+    element: str,
+    temperature_C: float,
+    soluble_concentration_M: float,
+    pH_range: Tuple[float, float],
+    E_range_VSHE: Tuple[float, float],
+    pH_grid: np.ndarray,
+    E_grid: np.ndarray,
+    grid_points: int,
+    water_lines: Dict[str, List[List[float]]],
+    warnings: List[str],
+    include_species: Optional[List[str]] = None
+) -> Dict:
+    """Assemble one element's diagram on prepared grids and water lines."""
     # Calculate equilibrium boundaries using simplified thermodynamics
     boundaries = _calculate_equilibrium_boundaries(
         element,
@@ -217,9 +329,6 @@ def calculate_pourbaix(
         soluble_concentration_M
     )
 
-    # Calculate water stability lines
-    water_lines = _calculate_water_stability(pH_grid, temperature_C)
-
     return {
         "element": element,
         "temperature_C": temperature_C,
@@ -12,7 +12,7 @@ Performance: ~1 second
 Accuracy: ±0.1 pH units, ±10% for species concentrations
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 import json
 import logging
 
@@ -22,7 +22,7 @@ logger = logging.getLogger(__name__)
 
 
 def run_phreeqc_speciation(
-    ions_json: str,
+    ions_json: Union[str, Dict[str, float]],
     temperature_C: float = 25.0,
     pH: Optional[float] = None,
     pe: float = 4.0,
@@ -35,6 +35,8 @@ def run_phreeqc_speciation(
     Args:
         ions_json: JSON string of ion concentrations in mg/L
                    Example: '{"Na+": 1000.0, "Cl-": 1500.0, "Ca2+": 100.0, "HCO3-": 200.0}'
+                   An already-parsed dict is also accepted, which lets Python
+                   callers skip the JSON encode/decode round-trip.
         temperature_C: Water temperature in degrees Celsius (default 25.0)
         pH: Initial pH (if None, PHREEQC calculates from charge balance)
         pe: Redox potential, dimensionless (default 4.0 for oxic conditions)
@@ -67,11 +69,14 @@ def run_phreeqc_speciation(
         ValueError: If charge imbalance exceeds max_imbalance
         RuntimeError: If PHREEQC calculation fails
     """
-    # Parse ion concentrations
-    try:
-        ions = json.loads(ions_json)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON for ions: {e}") from e
+    # Parse ion concentrations (dicts from Python callers pass straight through)
+    if isinstance(ions_json, str):
+        try:
+            ions = json.loads(ions_json)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON for ions: {e}") from e
+    else:
+        ions = ions_json
 
     if not isinstance(ions, dict):
         raise ValueError("ions_json must be a JSON object (dictionary)")
@@ -19,15 +19,6 @@ from core.schemas import MaterialCompatibility, ProvenanceMetadata, ConfidenceLe
 from core.interfaces import HandbookLookup
 import logging
 
-# This will be imported from MCP client context
-# For now, we'll define the interface
-try:
-    from mcp import search_corrosion_kb  # Will be available via MCP server context
-    MCP_AVAILABLE = True
-except ImportError:
-    MCP_AVAILABLE = False
-    logging.warning("MCP corrosion_kb not available - using placeholder")
-
 
 class MaterialScreeningLookup(HandbookLookup):
     """
@@ -12,11 +12,24 @@ These tools implement detailed mechanistic models for:
 All tools integrate with Phase 1 PHREEQC speciation for water chemistry.
 """
 
-from .predict_galvanic_corrosion import predict_galvanic_corrosion
-from .localized_corrosion import calculate_localized_corrosion, calculate_pren
+from .predict_galvanic_corrosion import (
+    predict_galvanic_corrosion,
+    predict_galvanic_corrosion_batch,
+    build_polarization,
+    solve_mixed_potential,
+)
+from .localized_corrosion import (
+    calculate_localized_corrosion,
+    calculate_localized_corrosion_batch,
+    calculate_pren,
+)
 
 __all__ = [
     "predict_galvanic_corrosion",
+    "predict_galvanic_corrosion_batch",
+    "build_polarization",
+    "solve_mixed_potential",
     "calculate_localized_corrosion",
+    "calculate_localized_corrosion_batch",
     "calculate_pren",
 ]
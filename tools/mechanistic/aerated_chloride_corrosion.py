@@ -248,16 +248,19 @@ def predict_aerated_chloride_corrosion(
                 "Empirical ORR limits from CSV database (25, 40, 60°C)",
             ],
             "warnings": [],
+            "warning_codes": [],  # Stable identifiers, one per entry in "warnings"
         },
     }
 
     # Add warnings
     if dissolved_oxygen_mg_L < 2.0:
+        result["provenance"]["warning_codes"].append("LOW_DO")
         result["provenance"]["warnings"].append(
             f"Low DO ({dissolved_oxygen_mg_L:.2f} mg/L) - anaerobic corrosion possible (consider MIC)"
         )
 
     if pH < 6.5:
+        result["provenance"]["warning_codes"].append("LOW_PH")
         result["provenance"]["warnings"].append(
             f"Low pH ({pH:.1f}) - acidic corrosion may contribute (use CO₂/H₂S tool)"
         )
@@ -171,6 +171,7 @@ def predict_co2_h2s_corrosion(
                 "confidence": "high",
                 "assumptions": ["Zero CO₂ fraction implies zero CO₂ corrosion"],
                 "warnings": [],
+                "warning_codes": [],
             },
         }
 
@@ -269,21 +270,25 @@ def predict_co2_h2s_corrosion(
                 f"Calculation iterations: {calc_iterations} ({'saturated with FeCO₃' if calc_iterations == 2 else 'unsaturated'})",
             ],
             "warnings": [],
+            "warning_codes": [],  # Stable identifiers, one per entry in "warnings"
         },
     }
 
     # Add warnings if conditions are outside validated range
     if temperature_C > 100.0:
+        result["provenance"]["warning_codes"].append("HIGH_TEMPERATURE")
         result["provenance"]["warnings"].append(
             f"Temperature {temperature_C}°C > 100°C - extrapolation beyond most validation data"
         )
 
     if co2_partial_pressure_bar > 10.0:
+        result["provenance"]["warning_codes"].append("HIGH_CO2_PARTIAL_PRESSURE")
         result["provenance"]["warnings"].append(
             f"CO₂ partial pressure {co2_partial_pressure_bar:.2f} bar > 10 bar - outside typical NORSOK range"
         )
 
     if h2s_fraction > 0.01:
+        result["provenance"]["warning_codes"].append("SOUR_SERVICE")
         result["provenance"]["warnings"].append(
             "Significant H₂S present - consider sulfide stress cracking (SSC) risk per NACE MR0175"
         )
@@ -29,10 +29,10 @@ Per Codex guidance:
 - Simplified Oldfield-Sutton IR drop
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 
-from core.localized_backend import LocalizedBackend, MaterialComposition
+from core.localized_backend import LocalizedBackend, LocalizedResult, MaterialComposition
 
 logger = logging.getLogger(__name__)
 
@@ -166,7 +166,80 @@ def calculate_localized_corrosion(
     Raises:
         ValueError: If invalid material or parameters
     """
-    # Validate inputs
+    _validate_inputs(temperature_C, Cl_mg_L, pH, crevice_gap_mm)
+
+    # Run localized corrosion calculation
+    backend = LocalizedBackend()
+    result = backend.calculate_localized_corrosion(
+        material=material,
+        temperature_C=temperature_C,
+        Cl_mg_L=Cl_mg_L,
+        pH=pH,
+        crevice_gap_mm=crevice_gap_mm,
+        dissolved_oxygen_mg_L=dissolved_oxygen_mg_L,
+    )
+
+    return _format_output(result, temperature_C, Cl_mg_L, pH, water_chemistry_json)
+
+
+def calculate_localized_corrosion_batch(cases: List[Dict]) -> List[Dict]:
+    """
+    Run calculate_localized_corrosion over many cases with one shared backend.
+
+    Every case is validated before any is calculated, and material
+    compositions are resolved once per material across the batch, so
+    material x temperature x chloride sweeps skip the per-call setup.
+
+    Args:
+        cases: List of keyword-argument dicts for calculate_localized_corrosion
+            (material, temperature_C, Cl_mg_L, and optionally pH,
+            crevice_gap_mm, water_chemistry_json, dissolved_oxygen_mg_L)
+
+    Returns:
+        List of result dictionaries in the same order as cases
+
+    Raises:
+        ValueError: If any case has invalid parameters
+
+    Example:
+        >>> results = calculate_localized_corrosion_batch([
+        ...     {"material": "316L", "temperature_C": 20.0, "Cl_mg_L": 100.0},
+        ...     {"material": "2205", "temperature_C": 30.0, "Cl_mg_L": 500.0},
+        ... ])
+        >>> [r["pitting"]["CPT_C"] for r in results]
+        [15.0, 35.0]
+    """
+    cases = [{"pH": 7.0, "crevice_gap_mm": 0.1, **case} for case in cases]
+    for case in cases:
+        _validate_inputs(case["temperature_C"], case["Cl_mg_L"], case["pH"], case["crevice_gap_mm"])
+
+    backend = LocalizedBackend()
+    outputs = []
+    for case in cases:
+        result = backend.calculate_localized_corrosion(
+            material=case["material"],
+            temperature_C=case["temperature_C"],
+            Cl_mg_L=case["Cl_mg_L"],
+            pH=case["pH"],
+            crevice_gap_mm=case["crevice_gap_mm"],
+            dissolved_oxygen_mg_L=case.get("dissolved_oxygen_mg_L"),
+        )
+        outputs.append(
+            _format_output(
+                result, case["temperature_C"], case["Cl_mg_L"], case["pH"],
+                case.get("water_chemistry_json"),
+            )
+        )
+    return outputs
+
+
+def _validate_inputs(
+    temperature_C: float,
+    Cl_mg_L: float,
+    pH: float,
+    crevice_gap_mm: float,
+) -> None:
+    """Raise ValueError if any localized corrosion input is out of range."""
     if temperature_C < 0 or temperature_C > 150:
         raise ValueError(f"Temperature {temperature_C}°C out of range (0-150°C)")
 
@@ -179,16 +252,16 @@ def calculate_localized_corrosion(
     if crevice_gap_mm <= 0 or crevice_gap_mm > 10:
         raise ValueError(f"Crevice gap {crevice_gap_mm} mm out of range (0-10 mm)")
 
-    # Run localized corrosion calculation
-    backend = LocalizedBackend()
-    result = backend.calculate_localized_corrosion(
-        material=material,
-        temperature_C=temperature_C,
-        Cl_mg_L=Cl_mg_L,
-        pH=pH,
-        crevice_gap_mm=crevice_gap_mm,
-        dissolved_oxygen_mg_L=dissolved_oxygen_mg_L,
-    )
+
+def _format_output(
+    result: LocalizedResult,
+    temperature_C: float,
+    Cl_mg_L: float,
+    pH: float,
+    water_chemistry_json: Optional[str] = None,
+) -> Dict:
+    """Format a LocalizedResult as the tool's output dict, with recommendations."""
+    material = result.material
 
     # Format output
     output = {
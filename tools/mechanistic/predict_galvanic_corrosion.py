@@ -34,9 +34,10 @@ LIMITATIONS:
 """
 
 import logging
+from dataclasses import dataclass
 import numpy as np
 from scipy.optimize import brentq
-from typing import Dict, Tuple, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 import warnings
 
 from utils.nrl_constants import C
@@ -48,6 +49,9 @@ from utils.nrl_electrochemical_reactions import (
 )
 from utils.nacl_solution_chemistry import NaClSolutionChemistry
 
+# Corrosion-rate unit conversion
+_MM_YEAR_TO_MPY = 39.3701  # 1 mm/year = 39.3701 mils/year
+
 
 def predict_galvanic_corrosion(
     anode_material: str,
@@ -113,12 +117,92 @@ def predict_galvanic_corrosion(
         - For identical materials, galvanic current should be near zero
         - Results are for uniform conditions (no IR drop, no geometry effects)
     """
+    _validate_area_ratio(area_ratio_cathode_to_anode)
+
+    bundle = build_polarization(
+        anode_material,
+        cathode_material,
+        temperature_C,
+        pH,
+        chloride_mg_L,
+        velocity_m_s=velocity_m_s,
+        dissolved_oxygen_mg_L=dissolved_oxygen_mg_L
+    )
+    return solve_mixed_potential(bundle, area_ratio_cathode_to_anode)
+
+
+@dataclass(frozen=True)
+class PolarizationBundle:
+    """
+    Polarization curves of a galvanic couple in one environment.
+
+    Everything in predict_galvanic_corrosion that does not depend on the
+    area ratio: material instances, both polarization curves on the shared
+    potential sweep, and the isolated anode corrosion point. Build it once
+    with build_polarization() and pass it to solve_mixed_potential() for
+    each area ratio. Arrays are read-only.
+
+    Attributes:
+        anode_material: Anode material name as given
+        cathode_material: Cathode material name as given
+        anode: Anode material instance (molar mass, electrons transferred)
+        anode_density_g_cm3: Anode density for Faraday's law
+        e_applied_VSCE: Potential sweep, V_SCE
+        anode_curves: Anode currents from _calculate_polarization_curve
+        cathode_curves: Cathode currents (same as anode_curves if uncoupled)
+        E_corr_isolated_anode_VSCE: Isolated anode corrosion potential
+        i_corr_isolated_net_A_cm2: Net anode current at that potential
+        i_corr_isolated_anodic_A_cm2: Anodic branch current at that potential
+        dissolved_oxygen_mg_L: Dissolved oxygen used, mg/L
+        uncoupled: True for identical materials at rest (no galvanic couple)
+        warnings: Warnings raised while building the curves
+        i_anode_interp, i_cathode_interp: Cubic interpolants of the total
+            currents for the mixed-potential solve (None if uncoupled)
+    """
+
+    anode_material: str
+    cathode_material: str
+    anode: CorrodingMetal
+    anode_density_g_cm3: float
+    e_applied_VSCE: np.ndarray
+    anode_curves: Dict[str, np.ndarray]
+    cathode_curves: Dict[str, np.ndarray]
+    E_corr_isolated_anode_VSCE: float
+    i_corr_isolated_net_A_cm2: float
+    i_corr_isolated_anodic_A_cm2: float
+    dissolved_oxygen_mg_L: float
+    uncoupled: bool
+    warnings: Tuple[str, ...]
+    i_anode_interp: Optional[Callable] = None
+    i_cathode_interp: Optional[Callable] = None
+
+
+def build_polarization(
+    anode_material: str,
+    cathode_material: str,
+    temperature_C: float,
+    pH: float,
+    chloride_mg_L: float,
+    velocity_m_s: float = 0.0,
+    dissolved_oxygen_mg_L: Optional[float] = None
+) -> PolarizationBundle:
+    """
+    Build both polarization curves of a couple for one environment.
+
+    Args:
+        anode_material, cathode_material, temperature_C, pH, chloride_mg_L,
+        velocity_m_s, dissolved_oxygen_mg_L: As for predict_galvanic_corrosion
+
+    Returns:
+        PolarizationBundle for solve_mixed_potential()
+
+    Raises:
+        ValueError: If parameters out of range or materials unknown
+    """
     warnings_list = []
 
     # Validate inputs
-    _validate_inputs(
-        temperature_C, pH, chloride_mg_L, area_ratio_cathode_to_anode, warnings_list
-    )
+    _validate_inputs(temperature_C, pH, chloride_mg_L, warnings_list)
 
     # Convert chloride to molar
     chloride_M = chloride_mg_L / 35453.0  # MW of Cl⁻ = 35.453 g/mol
@@ -167,123 +251,153 @@ def predict_galvanic_corrosion(
     # Water activity (from NRL naclSolutionChemistry, accounts for salinity)
     a_water = nacl_soln.a_water  # mol/L
 
-    # Fast path for identical materials (prevents numerical issues with near-zero currents)
-    if anode_material == cathode_material and velocity_m_s == 0:
-        # For identical materials, calculate isolated corrosion only
-        # This avoids astronomically high current ratios from dividing by near-zero currents
+    # Define applied potential range for polarization curves
+    # Scan from -1.5 V to +0.5 V_SCE
+    e_applied_VSCE = np.linspace(-1.5, 0.5, 500)
+
+    # Calculate polarization curves for anode
+    anode_curves = _calculate_polarization_curve(
+        anode,
+        e_applied_VSCE,
+        temperature_C,
+        c_O2_g_cm3,
+        c_OH,
+        a_water,
+        d_O2_cm2_s=nacl_soln.d_O2  # From NRL naclSolutionChemistry
+    )
 
-        # Define applied potential range
-        e_applied_VSCE = np.linspace(-1.5, 0.5, 500)
+    # Identical materials at rest: no galvanic couple, so the single
+    # anode curve stands in for both (avoids dividing near-zero currents)
+    uncoupled = anode_material == cathode_material and velocity_m_s == 0
 
-        # Calculate single polarization curve
-        anode_curves = _calculate_polarization_curve(
-            anode,
+    # Calculate polarization curves for cathode
+    i_anode_interp = i_cathode_interp = None
+    if uncoupled:
+        cathode_curves = anode_curves
+    else:
+        cathode_curves = _calculate_polarization_curve(
+            cathode,
             e_applied_VSCE,
             temperature_C,
             c_O2_g_cm3,
             c_OH,
             a_water,
-            d_O2_cm2_s=nacl_soln.d_O2
+            d_O2_cm2_s=nacl_soln.d_O2  # From NRL naclSolutionChemistry
         )
-
-        # Find isolated corrosion potential
-        E_corr_isolated, i_corr_isolated = _find_isolated_corrosion_potential(
-            e_applied_VSCE, anode_curves
+        i_anode_interp, i_cathode_interp = _current_interpolants(
+            e_applied_VSCE, anode_curves, cathode_curves
         )
 
-        # CRITICAL FIX (Codex): Use anodic current magnitude, NOT net current (which is zero at E_corr)
-        # Net current is identically zero at corrosion potential, so we must get anodic branch
-        i_corr_anodic = np.interp(
-            E_corr_isolated,
-            anode_curves["potential_VSCE"],
-            anode_curves["anodic_current_A_cm2"]
-        )
+    # Calculate isolated (uncoupled) anode corrosion potential
+    E_corr_isolated_anode, i_corr_isolated_net = _find_isolated_corrosion_potential(
+        e_applied_VSCE, anode_curves
+    )
+
+    # CRITICAL FIX (Codex): Use anodic current magnitude, NOT net current (which is zero at E_corr)
+    # Net current is identically zero at corrosion potential, so we must get anodic branch
+    i_corr_isolated_anodic = np.interp(
+        E_corr_isolated_anode,
+        anode_curves["potential_VSCE"],
+        anode_curves["anodic_current_A_cm2"]
+    )
+
+    # Curves are reused for every area ratio: guard against in-place edits
+    for array in (e_applied_VSCE, *anode_curves.values(), *cathode_curves.values()):
+        array.flags.writeable = False
 
+    return PolarizationBundle(
+        anode_material=anode_material,
+        cathode_material=cathode_material,
+        anode=anode,
         # CRITICAL FIX (Codex): Use material-specific density, NOT hard-coded steel density
-        # Get density from material instance
-        density_g_cm3 = _get_material_density(anode_material)
+        anode_density_g_cm3=_get_material_density(anode_material),
+        e_applied_VSCE=e_applied_VSCE,
+        anode_curves=anode_curves,
+        cathode_curves=cathode_curves,
+        E_corr_isolated_anode_VSCE=E_corr_isolated_anode,
+        i_corr_isolated_net_A_cm2=i_corr_isolated_net,
+        i_corr_isolated_anodic_A_cm2=i_corr_isolated_anodic,
+        dissolved_oxygen_mg_L=c_O2_g_cm3 * 1.0e6,  # g/cm³ → mg/L for output
+        uncoupled=uncoupled,
+        warnings=tuple(warnings_list),
+        i_anode_interp=i_anode_interp,
+        i_cathode_interp=i_cathode_interp
+    )
+
+
+def solve_mixed_potential(
+    bundle: PolarizationBundle,
+    area_ratio_cathode_to_anode: float = 1.0
+) -> Dict:
+    """
+    Solve a prebuilt couple for one cathode/anode area ratio.
+
+    Only the mixed-potential root find and rate conversion run here, so an
+    area-ratio sweep reuses one PolarizationBundle.
+
+    Args:
+        bundle: Curves from build_polarization()
+        area_ratio_cathode_to_anode: Cathode area / anode area
+
+    Returns:
+        Same dictionary as predict_galvanic_corrosion()
+
+    Raises:
+        ValueError: If the area ratio is out of range or no mixed potential
+            can be found
 
-        # Calculate corrosion rate
+    Example:
+        >>> bundle = build_polarization("HY80", "SS316", 25.0, 8.0, 19000.0)
+        >>> results = [solve_mixed_potential(bundle, r) for r in (0.1, 1.0, 10.0)]
+    """
+    _validate_area_ratio(area_ratio_cathode_to_anode)
+
+    warnings_list = list(bundle.warnings)
+    anode = bundle.anode
+    anode_curves = bundle.anode_curves
+
+    if bundle.uncoupled:
+        # For identical materials, report isolated corrosion only
         anode_CR_mm_year = _current_to_corrosion_rate(
-            abs(i_corr_anodic),
+            abs(bundle.i_corr_isolated_anodic_A_cm2),
             anode.metal_mass,
             anode.oxidation_level_z,
-            density_g_cm3=density_g_cm3
+            density_g_cm3=bundle.anode_density_g_cm3
         )
 
-        anode_CR_mpy = anode_CR_mm_year * 39.3701
-        dissolved_oxygen_mg_L_output = c_O2_g_cm3 * 1.0e6
-
         warnings_list.append(
-            f"Identical materials ({anode_material}) - no galvanic coupling. "
+            f"Identical materials ({bundle.anode_material}) - no galvanic coupling. "
             f"Reporting isolated corrosion rate only."
         )
 
         return {
-            "mixed_potential_VSCE": E_corr_isolated,
-            "galvanic_current_density_A_cm2": abs(i_corr_anodic),
-            "galvanic_net_current_density_A_cm2": abs(i_corr_isolated),
+            "mixed_potential_VSCE": bundle.E_corr_isolated_anode_VSCE,
+            "galvanic_current_density_A_cm2": abs(bundle.i_corr_isolated_anodic_A_cm2),
+            "galvanic_net_current_density_A_cm2": abs(bundle.i_corr_isolated_net_A_cm2),
             "anode_corrosion_rate_mm_year": anode_CR_mm_year,
-            "anode_corrosion_rate_mpy": anode_CR_mpy,
+            "anode_corrosion_rate_mpy": anode_CR_mm_year * _MM_YEAR_TO_MPY,
             "cathode_corrosion_rate_mm_year": 0.0,
             "current_ratio": 1.0,  # No galvanic effect
-            "E_corr_isolated_anode_VSCE": E_corr_isolated,
+            "E_corr_isolated_anode_VSCE": bundle.E_corr_isolated_anode_VSCE,
             "area_ratio": area_ratio_cathode_to_anode,
-            "dissolved_oxygen_mg_L": dissolved_oxygen_mg_L_output,
+            "dissolved_oxygen_mg_L": bundle.dissolved_oxygen_mg_L,
             "warnings": warnings_list,
             "convergence": {"converged": True, "method": "isolated_corrosion_potential"},
-            "polarization_curves": {
-                "potential_VSCE": e_applied_VSCE.tolist(),
-                "anode": {
-                    "total_current": anode_curves["total_current_A_cm2"].tolist(),
-                    "anodic_current": anode_curves["anodic_current_A_cm2"].tolist(),
-                    "cathodic_current": anode_curves["cathodic_current_A_cm2"].tolist()
-                },
-                "cathode": {
-                    "total_current": anode_curves["total_current_A_cm2"].tolist(),
-                    "anodic_current": anode_curves["anodic_current_A_cm2"].tolist(),
-                    "cathodic_current": anode_curves["cathodic_current_A_cm2"].tolist()
-                }
-            }
+            "polarization_curves": _curves_output(bundle)
         }
 
-    # Define applied potential range for polarization curves
-    # Scan from -1.5 V to +0.5 V_SCE
-    e_applied_VSCE = np.linspace(-1.5, 0.5, 500)
-
-    # Calculate polarization curves for anode
-    anode_curves = _calculate_polarization_curve(
-        anode,
-        e_applied_VSCE,
-        temperature_C,
-        c_O2_g_cm3,
-        c_OH,
-        a_water,
-        d_O2_cm2_s=nacl_soln.d_O2  # From NRL naclSolutionChemistry
-    )
-
-    # Calculate polarization curves for cathode
-    cathode_curves = _calculate_polarization_curve(
-        cathode,
-        e_applied_VSCE,
-        temperature_C,
-        c_O2_g_cm3,
-        c_OH,
-        a_water,
-        d_O2_cm2_s=nacl_soln.d_O2  # From NRL naclSolutionChemistry
-    )
-
     # Find mixed potential (galvanic couple potential)
     try:
         E_galvanic, i_galvanic_net, convergence_info = _find_mixed_potential(
-            e_applied_VSCE,
-            anode_curves,
-            cathode_curves,
+            bundle.e_applied_VSCE,
+            bundle.i_anode_interp,
+            bundle.i_cathode_interp,
             area_ratio_cathode_to_anode
         )
     except Exception as e:
         raise ValueError(
-            f"Failed to find mixed potential for {anode_material}/{cathode_material} couple: {e}"
+            f"Failed to find mixed potential for "
+            f"{bundle.anode_material}/{bundle.cathode_material} couple: {e}"
         )
 
     # Interpolate galvanic anodic current directly from the anodic branch
@@ -294,22 +408,15 @@ def predict_galvanic_corrosion(
     )
 
     # Calculate corrosion rates
-    # CRITICAL FIX (Codex): Use material-specific density
-    anode_density = _get_material_density(anode_material)
     anode_CR_mm_year = _current_to_corrosion_rate(
         abs(i_galvanic_anodic),
         anode.metal_mass,
         anode.oxidation_level_z,
-        density_g_cm3=anode_density
+        density_g_cm3=bundle.anode_density_g_cm3
     )
 
     cathode_CR_mm_year = 0.0  # Cathode is protected (negligible corrosion)
 
-    # Calculate isolated (uncoupled) anode corrosion potential
-    E_corr_isolated_anode, _ = _find_isolated_corrosion_potential(
-        e_applied_VSCE, anode_curves
-    )
-
     # Validate convergence of mixed potential solver
     if not convergence_info.get("converged", False):
         warnings_list.append(
@@ -322,11 +429,7 @@ def predict_galvanic_corrosion(
     # CRITICAL FIX (Codex): Use anodic current magnitude, NOT total current (which is zero at E_corr)
     # Total current is identically zero at corrosion potential by definition,
     # so we must use the anodic branch magnitude to quantify galvanic amplification
-    i_isolated_anodic = np.interp(
-        E_corr_isolated_anode,
-        anode_curves["potential_VSCE"],
-        anode_curves["anodic_current_A_cm2"]
-    )
+    i_isolated_anodic = bundle.i_corr_isolated_anodic_A_cm2
 
     # Guard against near-zero isolated current (indicates numerical issues)
     EPSILON_CURRENT = 1e-8  # A/cm²
@@ -357,11 +460,8 @@ def predict_galvanic_corrosion(
             f"Localized attack likely at anode edges."
         )
 
-    # Convert corrosion rate to mils per year (1 mm/year = 39.3701 mils/year)
-    anode_CR_mpy = anode_CR_mm_year * 39.3701
-
-    # Convert dissolved oxygen from g/cm³ to mg/L for output
-    dissolved_oxygen_mg_L_output = c_O2_g_cm3 * 1.0e6
+    # Convert corrosion rate to mils per year
+    anode_CR_mpy = anode_CR_mm_year * _MM_YEAR_TO_MPY
 
     return {
         "mixed_potential_VSCE": E_galvanic,
@@ -371,23 +471,81 @@ def predict_galvanic_corrosion(
         "anode_corrosion_rate_mpy": anode_CR_mpy,
         "cathode_corrosion_rate_mm_year": cathode_CR_mm_year,
         "current_ratio": current_ratio,
-        "E_corr_isolated_anode_VSCE": E_corr_isolated_anode,
+        "E_corr_isolated_anode_VSCE": bundle.E_corr_isolated_anode_VSCE,
         "area_ratio": area_ratio_cathode_to_anode,
-        "dissolved_oxygen_mg_L": dissolved_oxygen_mg_L_output,
+        "dissolved_oxygen_mg_L": bundle.dissolved_oxygen_mg_L,
         "warnings": warnings_list,
         "convergence": convergence_info,
-        "polarization_curves": {
-            "potential_VSCE": e_applied_VSCE.tolist(),
-            "anode": {
-                "total_current": anode_curves["total_current_A_cm2"].tolist(),
-                "anodic_current": anode_curves["anodic_current_A_cm2"].tolist(),
-                "cathodic_current": anode_curves["cathodic_current_A_cm2"].tolist()
-            },
-            "cathode": {
-                "total_current": cathode_curves["total_current_A_cm2"].tolist(),
-                "anodic_current": cathode_curves["anodic_current_A_cm2"].tolist(),
-                "cathodic_current": cathode_curves["cathodic_current_A_cm2"].tolist()
-            }
+        "polarization_curves": _curves_output(bundle)
+    }
+
+
+def predict_galvanic_corrosion_batch(
+    anode_material: str,
+    cathode_material: str,
+    temperature_C: float,
+    pH: float,
+    chloride_mg_L: float,
+    area_ratios: Sequence[float],
+    velocity_m_s: float = 0.0,
+    dissolved_oxygen_mg_L: Optional[float] = None
+) -> List[Dict]:
+    """
+    Predict one couple in one environment over many area ratios.
+
+    Every ratio is validated first, then the polarization curves and their
+    interpolants are built once and only the mixed-potential solve runs per
+    ratio. Each result is identical to the matching
+    predict_galvanic_corrosion() call.
+
+    Args:
+        anode_material, cathode_material, temperature_C, pH, chloride_mg_L,
+        velocity_m_s, dissolved_oxygen_mg_L: As for predict_galvanic_corrosion
+        area_ratios: Cathode/anode area ratios (0.01-1000)
+
+    Returns:
+        List of predict_galvanic_corrosion() result dictionaries, one per
+        area ratio and in the same order
+
+    Raises:
+        ValueError: If any area ratio or other parameter is out of range
+
+    Example:
+        >>> results = predict_galvanic_corrosion_batch(
+        ...     "HY80", "SS316", 25.0, 8.0, 19000.0, area_ratios=[0.1, 1.0, 10.0]
+        ... )
+        >>> [r["area_ratio"] for r in results]
+        [0.1, 1.0, 10.0]
+    """
+    for ratio in area_ratios:
+        _validate_area_ratio(ratio)
+
+    bundle = build_polarization(
+        anode_material,
+        cathode_material,
+        temperature_C,
+        pH,
+        chloride_mg_L,
+        velocity_m_s=velocity_m_s,
+        dissolved_oxygen_mg_L=dissolved_oxygen_mg_L
+    )
+
+    return [solve_mixed_potential(bundle, ratio) for ratio in area_ratios]
+
+
+def _curves_output(bundle: PolarizationBundle) -> Dict:
+    """Polarization curves as JSON-ready lists for plotting."""
+    return {
+        "potential_VSCE": bundle.e_applied_VSCE.tolist(),
+        "anode": {
+            "total_current": bundle.anode_curves["total_current_A_cm2"].tolist(),
+            "anodic_current": bundle.anode_curves["anodic_current_A_cm2"].tolist(),
+            "cathodic_current": bundle.anode_curves["cathodic_current_A_cm2"].tolist()
+        },
+        "cathode": {
+            "total_current": bundle.cathode_curves["total_current_A_cm2"].tolist(),
+            "anodic_current": bundle.cathode_curves["anodic_current_A_cm2"].tolist(),
+            "cathodic_current": bundle.cathode_curves["cathodic_current_A_cm2"].tolist()
         }
     }
 
@@ -530,20 +688,12 @@ def _calculate_polarization_curve(
     }
 
 
-def _find_mixed_potential(
+def _current_interpolants(
     e_applied_VSCE: np.ndarray,
     anode_curves: Dict,
-    cathode_curves: Dict,
-    area_ratio: float
-) -> Tuple[float, float, Dict]:
-    """
-    Find mixed potential where i_anode + (area_ratio * i_cathode) = 0.
-
-    Uses Brent's method root finding.
-
-    Returns:
-        (E_galvanic, i_galvanic, convergence_info)
-    """
+    cathode_curves: Dict
+) -> Tuple[Callable, Callable]:
+    """Cubic interpolants of the anode and cathode total currents."""
     # Interpolate currents for smooth root finding
     from scipy.interpolate import interp1d
 
@@ -561,6 +711,24 @@ def _find_mixed_potential(
         fill_value="extrapolate"
     )
 
+    return i_anode_interp, i_cathode_interp
+
+
+def _find_mixed_potential(
+    e_applied_VSCE: np.ndarray,
+    i_anode_interp: Callable,
+    i_cathode_interp: Callable,
+    area_ratio: float
+) -> Tuple[float, float, Dict]:
+    """
+    Find mixed potential where i_anode + (area_ratio * i_cathode) = 0.
+
+    Uses Brent's method root finding on the interpolants from
+    _current_interpolants().
+
+    Returns:
+        (E_galvanic, i_galvanic, convergence_info)
+    """
     def residual(E: float) -> float:
         """Current balance equation: i_anode + area_ratio * i_cathode = 0"""
         i_a = i_anode_interp(E)
@@ -573,8 +741,8 @@ def _find_mixed_potential(
         i_galvanic = i_anode_interp(E_galvanic)
         convergence_info = {"converged": True, "method": "brentq"}
     except ValueError as e:
-        # Root not found in range - use minimum of residual
-        residuals = np.array([residual(E) for E in e_applied_VSCE])
+        # Root not found in range - use minimum of residual over the sweep
+        residuals = i_anode_interp(e_applied_VSCE) + area_ratio * i_cathode_interp(e_applied_VSCE)
         idx_min = np.argmin(np.abs(residuals))
         E_galvanic = e_applied_VSCE[idx_min]
         i_galvanic = i_anode_interp(E_galvanic)
@@ -703,7 +871,6 @@ def _validate_inputs(
     temperature_C: float,
     pH: float,
     chloride_mg_L: float,
-    area_ratio: float,
     warnings_list: list
 ) -> None:
     """Validate input parameters and add warnings."""
@@ -723,10 +890,19 @@ def _validate_inputs(
             f"Results may be less accurate."
         )
 
+
+def _validate_area_ratio(area_ratio: float) -> None:
+    """Reject cathode/anode area ratios outside 0.01-1000."""
     if area_ratio < 0.01 or area_ratio > 1000:
         raise ValueError(
             f"Area ratio {area_ratio} out of reasonable range (0.01-1000)"
         )
 
 
-__all__ = ["predict_galvanic_corrosion"]
+__all__ = [
+    "predict_galvanic_corrosion",
+    "predict_galvanic_corrosion_batch",
+    "PolarizationBundle",
+    "build_polarization",
+    "solve_mixed_potential",
+]
@@ -0,0 +1,29 @@
+"""
+Optional numba support shared by the JIT-compiled kernels.
+
+Re-exports numba's njit, vectorize and prange when numba is installed.
+Without numba, njit and vectorize become no-op decorators and prange is
+plain range, so the kernels run as ordinary Python/NumPy code.
+"""
+
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+    def vectorize(*args, **kwargs):
+        """No-op stand-in for numba.vectorize when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange", "vectorize"]
@@ -16,6 +16,12 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C parser; same safe semantics as yaml.SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class CoatingPermeabilityDatabase:
     """
@@ -59,7 +65,7 @@ class CoatingPermeabilityDatabase:
             yaml_file = Path(self.yaml_path)
             if yaml_file.exists():
                 with open(yaml_file, 'r') as f:
-                    self._yaml_data = yaml.safe_load(f)
+                    self._yaml_data = yaml.load(f, Loader=_YamlLoader)
                     logger.info(f"Loaded coating permeability from {self.yaml_path}")
             else:
                 logger.warning(f"YAML file not found: {self.yaml_path}")
@@ -8,15 +8,41 @@ Loads Tafel slopes, exchange current densities, and electrochemical parameters w
 Based on Codex review recommendations for Phase 0 completion.
 """
 
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
+from functools import lru_cache
 import yaml
 import logging
 from pathlib import Path
 import re
 import math
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C parser; same safe semantics as yaml.SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Butler-Volmer / Arrhenius constants
+_R_GAS = 8.314  # J/mol·K
+_T_REF_K = 298.15  # 25°C
+_INV_T_REF_K = 1.0 / _T_REF_K
+
+
+@lru_cache(maxsize=256)
+def _arrhenius_factor(activation_energy_kJ_per_mol: float, T_K: float) -> float:
+    """
+    Arrhenius ratio i0(T) / i0(T_ref) = exp(-Ea/R × (1/T - 1/T_ref)).
+
+    Memoized: base_parameters hold a handful of Ea values and callers
+    revisit the same temperatures.
+    """
+    Ea_over_R = activation_energy_kJ_per_mol * 1000.0 / _R_GAS
+    return math.exp(-Ea_over_R * (1.0 / T_K - _INV_T_REF_K))
+
 
 class ElectrochemistryDatabase:
     """
@@ -33,6 +59,12 @@ class ElectrochemistryDatabase:
     - Temperature dependencies
     """
 
+    # Patterns for _parse_electrochemistry_from_text, compiled once at class load
+    _BA_RE = re.compile(r"(?:anodic|ba).*?Tafel.*?(\d+\.?\d*)\s*[VmV]", re.IGNORECASE)
+    _BC_RE = re.compile(r"(?:cathodic|bc).*?Tafel.*?[-−]?(\d+\.?\d*)\s*[VmV]", re.IGNORECASE)
+    _I0_RE = re.compile(r"(?:exchange current|i0|i₀).*?(\d+\.?\d*[eE]?[-+]?\d*)\s*A", re.IGNORECASE)
+    _ALPHA_RE = re.compile(r"(?:transfer coefficient|alpha|α).*?[=:]?\s*(\d+\.?\d*)", re.IGNORECASE)
+
     def __init__(
         self,
         yaml_path: Optional[str] = None,
@@ -48,7 +80,17 @@ class ElectrochemistryDatabase:
         self.yaml_path = yaml_path or self._default_yaml_path()
         self.semantic_search = semantic_search_function
         self._yaml_data: Optional[Dict] = None
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Results are returned by reference (callers treat them as read-only)
+        self._cache: Dict[Tuple, Dict[str, Any]] = {}
+        # Columnar view of base_parameters, built by _base_parameter_arrays()
+        self._reactions_idx: Optional[Dict[str, int]] = None
+        self._n_electrons: Optional[np.ndarray] = None
+        self._alpha: Optional[np.ndarray] = None
+        self._i0_ref: Optional[np.ndarray] = None
+        self._Ea_kJ: Optional[np.ndarray] = None
+        # Last (T_K, i0 array) from get_exchange_current_densities; sweeps
+        # typically revisit the same temperature on consecutive calls
+        self._i0_sweep_cache: Tuple[Optional[float], Optional[np.ndarray]] = (None, None)
 
     def _default_yaml_path(self) -> str:
         """Get default YAML path relative to this module"""
@@ -64,7 +106,7 @@ class ElectrochemistryDatabase:
             yaml_file = Path(self.yaml_path)
             if yaml_file.exists():
                 with open(yaml_file, 'r') as f:
-                    self._yaml_data = yaml.safe_load(f)
+                    self._yaml_data = yaml.load(f, Loader=_YamlLoader)
                     logger.info(f"Loaded electrochemistry data from {self.yaml_path}")
             else:
                 logger.warning(f"YAML file not found: {self.yaml_path}")
@@ -75,6 +117,54 @@ class ElectrochemistryDatabase:
 
         return self._yaml_data
 
+    def _base_parameter_arrays(self) -> Dict[str, int]:
+        """
+        Lazily build columnar arrays from YAML base_parameters.
+
+        Fills self._n_electrons, _alpha, _i0_ref and _Ea_kJ (one entry per
+        reaction, missing values replaced by the Butler-Volmer defaults).
+
+        Returns:
+            Map of normalized reaction name to its row in those arrays
+        """
+        if self._reactions_idx is not None:
+            return self._reactions_idx
+
+        base_params = self._load_yaml().get("base_parameters", {})
+        names = list(base_params)
+        rows = [base_params[name] for name in names]
+
+        self._n_electrons = np.array([p.get("n_electrons", 2) for p in rows], dtype=int)
+        self._alpha = np.array([p.get("alpha", 0.5) for p in rows], dtype=float)
+        self._i0_ref = np.array([p.get("i0_A_per_m2_25C", 1e-6) for p in rows], dtype=float)
+        self._Ea_kJ = np.array(
+            [p.get("activation_energy_kJ_per_mol", 40.0) for p in rows], dtype=float
+        )
+        self._reactions_idx = {name: idx for idx, name in enumerate(names)}
+        return self._reactions_idx
+
+    def get_exchange_current_densities(self, temperature_C: float) -> Dict[str, float]:
+        """
+        Arrhenius-corrected i0 for every base_parameters reaction at once.
+
+        Args:
+            temperature_C: Temperature in Celsius
+
+        Returns:
+            Map of normalized reaction name to i0 (A/m²) at temperature_C
+        """
+        reactions_idx = self._base_parameter_arrays()
+        T_K = temperature_C + 273.15
+
+        cached_T_K, i0 = self._i0_sweep_cache
+        if T_K != cached_T_K:
+            i0 = self._i0_ref * np.exp(
+                -(self._Ea_kJ * 1000.0 / _R_GAS) * (1.0 / T_K - _INV_T_REF_K)
+            )
+            self._i0_sweep_cache = (T_K, i0)
+
+        return {name: float(i0[idx]) for name, idx in reactions_idx.items()}
+
     def get_tafel_slopes(
         self,
         material: str,
@@ -115,10 +205,11 @@ class ElectrochemistryDatabase:
                 },
             }
         """
-        # Check cache
-        cache_key = f"{material}_{reaction}_{electrolyte}_{temperature_C}_{pH}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        # Check cache (single dict probe; same object on every hit)
+        cache_key = (material, reaction, electrolyte, temperature_C, pH)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Try YAML lookup first (fast path)
         yaml_data = self._load_yaml()
@@ -166,13 +257,14 @@ class ElectrochemistryDatabase:
             material, reaction, electrolyte, temperature_C, pH
         )
 
+    @staticmethod
+    @lru_cache(maxsize=2048)
     def _normalize_reaction_key(
-        self,
         material: str,
         reaction: str,
         electrolyte: str,
     ) -> str:
-        """Generate normalized key for YAML lookup"""
+        """Generate normalized key for YAML lookup (memoized; pure function of its args)"""
         mat_norm = material.lower().replace(" ", "_").replace("-", "_")
         rxn_norm = reaction.lower().replace(" ", "_").replace("-", "_")
         elec_norm = electrolyte.lower().replace(" ", "_")
@@ -201,22 +293,20 @@ class ElectrochemistryDatabase:
         F = Faraday constant (96485 C/mol)
         """
         # Check if we have base parameters in YAML
-        yaml_data = self._load_yaml()
-        base_params = yaml_data.get("base_parameters", {})
+        reactions_idx = self._base_parameter_arrays()
 
         reaction_norm = reaction.lower().replace(" ", "_")
-        if reaction_norm not in base_params:
+        idx = reactions_idx.get(reaction_norm)
+        if idx is None:
             return None
 
-        params = base_params[reaction_norm]
-
         # Constants
-        R = 8.314  # J/mol·K
+        R = _R_GAS  # J/mol·K
         F = 96485  # C/mol
         T_K = temperature_C + 273.15
 
-        alpha = params.get("alpha", 0.5)
-        n = params.get("n_electrons", 2)
+        alpha = float(self._alpha[idx])
+        n = int(self._n_electrons[idx])
 
         # Calculate Tafel slopes
         RT_over_alphaF = (R * T_K) / (alpha * F)
@@ -224,12 +314,11 @@ class ElectrochemistryDatabase:
         bc = -2.303 * RT_over_alphaF
 
         # Exchange current density (temperature corrected if available)
-        i0_ref = params.get("i0_A_per_m2_25C", 1e-6)
-        Ea = params.get("activation_energy_kJ_per_mol", 40.0) * 1000  # Convert to J/mol
+        i0_ref = float(self._i0_ref[idx])
+        Ea_kJ = float(self._Ea_kJ[idx])
 
         # Arrhenius correction: i0(T) = i0_ref × exp(-Ea/R × (1/T - 1/T_ref))
-        T_ref = 298.15  # 25°C
-        i0 = i0_ref * math.exp(-(Ea / R) * (1 / T_K - 1 / T_ref))
+        i0 = i0_ref * _arrhenius_factor(Ea_kJ, T_K)
 
         return {
             "material": material,
@@ -372,14 +461,8 @@ class ElectrochemistryDatabase:
 
         combined_text = "\n".join([r.get("text", "") for r in search_results])
 
-        # Regex patterns
-        ba_pattern = r"(?:anodic|ba).*?Tafel.*?(\d+\.?\d*)\s*[VmV]"
-        bc_pattern = r"(?:cathodic|bc).*?Tafel.*?[-−]?(\d+\.?\d*)\s*[VmV]"
-        i0_pattern = r"(?:exchange current|i0|i₀).*?(\d+\.?\d*[eE]?[-+]?\d*)\s*A"
-        alpha_pattern = r"(?:transfer coefficient|alpha|α).*?[=:]?\s*(\d+\.?\d*)"
-
         # Extract ba
-        ba_match = re.search(ba_pattern, combined_text, re.IGNORECASE)
+        ba_match = self._BA_RE.search(combined_text)
         if ba_match:
             parsed["ba"] = float(ba_match.group(1))
             if parsed["ba"] > 1.0:  # Likely in mV, convert to V
@@ -387,7 +470,7 @@ class ElectrochemistryDatabase:
             parsed["confidence"] = "medium"
 
         # Extract bc
-        bc_match = re.search(bc_pattern, combined_text, re.IGNORECASE)
+        bc_match = self._BC_RE.search(combined_text)
         if bc_match:
             parsed["bc"] = -float(bc_match.group(1))  # Ensure negative
             if abs(parsed["bc"]) > 1.0:  # Likely in mV
@@ -395,13 +478,13 @@ class ElectrochemistryDatabase:
             parsed["confidence"] = "medium"
 
         # Extract i0
-        i0_match = re.search(i0_pattern, combined_text, re.IGNORECASE)
+        i0_match = self._I0_RE.search(combined_text)
         if i0_match:
             parsed["i0"] = float(i0_match.group(1))
             parsed["confidence"] = "medium"
 
         # Extract alpha
-        alpha_match = re.search(alpha_pattern, combined_text, re.IGNORECASE)
+        alpha_match = self._ALPHA_RE.search(combined_text)
         if alpha_match:
             parsed["alpha"] = float(alpha_match.group(1))
 
@@ -0,0 +1,171 @@
+"""
+Fast pH Solver for Simple Aqueous Carbonate Systems
+
+PROVENANCE:
+Equilibrium constants use the analytic log K(T) expressions of the
+phreeqc.dat database shipped with PHREEQC (Parkhurst & Appelo, 2013),
+which are the Plummer & Busenberg (1982) fits:
+
+    log10 K = A1 + A2*T + A3/T + A4*log10(T) + A5/T²   (T in K)
+
+1. CO₃²⁻ + H⁺ = HCO₃⁻           (log K 10.329 at 25°C)
+2. CO₃²⁻ + 2H⁺ = CO₂ + H₂O      (log K 16.681 at 25°C)
+3. H₂O = OH⁻ + H⁺               (log K -14.0 at 25°C)
+
+References:
+- Plummer, L. N., & Busenberg, E. (1982). "The solubilities of calcite,
+  aragonite and vaterite in CO2-H2O solutions between 0 and 90°C".
+  Geochim. Cosmochim. Acta, 46(6), 1011-1040.
+- Parkhurst, D. L., & Appelo, C. A. J. (2013). "Description of input and
+  examples for PHREEQC version 3". USGS Techniques and Methods 6-A43.
+
+SCOPE:
+Closed carbonate system at infinite dilution (activity coefficients = 1):
+total dissolved inorganic carbon C_T plus a net strong-base charge
+(e.g. Na⁺ from NaHCO₃ minus Cl⁻). The charge balance is solved for pH by
+Newton's method with an analytic Jacobian (steps limited to one pH unit,
+as PHREEQC limits its own master-species steps); residual and iteration
+are small @njit kernels so repeated solves in sweeps stay cheap.
+
+This is a screening solver. It does not replace PHREEQC speciation, which
+includes activity corrections, ion pairs and mineral equilibria; use
+run_phreeqc_speciation wherever those matter.
+"""
+
+import math
+from typing import Tuple
+
+# Optional JIT for the residual kernel (no-op without numba)
+from utils._numba_compat import njit
+
+
+# phreeqc.dat -analytic coefficients (A1, A2, A3, A4, A5)
+_LOGK_HCO3 = (107.8871, 0.03252849, -5151.79, -38.92561, 563713.9)
+_LOGK_CO2 = (464.1965, 0.09344813, -26986.16, -165.75951, 2248628.9)
+_LOGK_H2O = (-283.971, -0.05069842, 13323.0, 102.24447, -1119669.0)
+
+_LN10 = math.log(10.0)
+
+# Newton controls: largest pH step per iteration, convergence tolerance
+_MAX_PH_STEP = 1.0
+_PH_TOL = 1e-10
+_MAX_ITER = 50
+
+
+def _analytic_log_k(coeffs: Tuple[float, ...], temperature_K: float) -> float:
+    """Evaluate a phreeqc.dat -analytic log K expression."""
+    A1, A2, A3, A4, A5 = coeffs
+    T = temperature_K
+    return A1 + A2 * T + A3 / T + A4 * math.log10(T) + A5 / T**2
+
+
+def carbonate_constants(temperature_C: float) -> Tuple[float, float, float]:
+    """
+    Carbonic acid dissociation constants and water ionization product.
+
+    Args:
+        temperature_C: Temperature, °C (0-90°C fit range)
+
+    Returns:
+        (K_a1, K_a2, K_w) at infinite dilution
+    """
+    T = temperature_C + 273.15
+    log_k_hco3 = _analytic_log_k(_LOGK_HCO3, T)
+    log_k_co2 = _analytic_log_k(_LOGK_CO2, T)
+
+    K_a1 = 10.0 ** (log_k_hco3 - log_k_co2)  # CO₂ + H₂O = HCO₃⁻ + H⁺
+    K_a2 = 10.0 ** (-log_k_hco3)             # HCO₃⁻ = CO₃²⁻ + H⁺
+    K_w = 10.0 ** _analytic_log_k(_LOGK_H2O, T)
+    return K_a1, K_a2, K_w
+
+
+@njit(cache=True)
+def ph_residual_and_jac(pH, c_total, cb_net, K_a1, K_a2, K_w):
+    """
+    Charge-balance residual of a closed carbonate system and its pH derivative.
+
+    f(pH) = cb_net + [H⁺] - C_T*(α₁ + 2α₂) - K_w/[H⁺]
+
+    Args:
+        pH: Trial pH
+        c_total: Total dissolved inorganic carbon, mol/L
+        cb_net: Net strong-base charge (cations - anions, excluding
+            carbonate species, H⁺ and OH⁻), eq/L
+        K_a1, K_a2: Carbonic acid dissociation constants
+        K_w: Water ionization product
+
+    Returns:
+        (f, df/dpH) in eq/L and eq/L per pH unit
+    """
+    h = 10.0 ** (-pH)
+    D = h * h + K_a1 * h + K_a1 * K_a2
+    N = K_a1 * h + 2.0 * K_a1 * K_a2
+    g = N / D  # α₁ + 2α₂
+
+    f = cb_net + h - c_total * g - K_w / h
+
+    dg_dh = (K_a1 * D - N * (2.0 * h + K_a1)) / (D * D)
+    df_dh = 1.0 - c_total * dg_dh + K_w / (h * h)
+    return f, df_dh * (-_LN10 * h)
+
+
+@njit(cache=True)
+def _newton_pH(pH, c_total, cb_net, K_a1, K_a2, K_w):
+    """
+    Step-limited Newton iteration on the charge-balance residual.
+
+    Returns:
+        (pH, converged)
+    """
+    for _ in range(_MAX_ITER):
+        f, dfdpH = ph_residual_and_jac(pH, c_total, cb_net, K_a1, K_a2, K_w)
+        step = -f / dfdpH
+        if step > _MAX_PH_STEP:
+            step = _MAX_PH_STEP
+        elif step < -_MAX_PH_STEP:
+            step = -_MAX_PH_STEP
+        pH += step
+        if abs(step) < _PH_TOL:
+            return pH, True
+    return pH, False
+
+
+def solve_carbonate_pH(
+    c_total_mol_L: float,
+    cb_net_eq_L: float,
+    temperature_C: float = 25.0,
+    pH_guess: float = 7.0,
+) -> float:
+    """
+    pH of a closed carbonate system from its charge balance.
+
+    Args:
+        c_total_mol_L: Total dissolved inorganic carbon, mol/L
+        cb_net_eq_L: Net strong-base charge, eq/L (e.g. [Na⁺] for NaHCO₃)
+        temperature_C: Temperature, °C
+        pH_guess: Starting pH for Newton iteration
+
+    Returns:
+        Equilibrium pH
+
+    Raises:
+        ValueError: If c_total_mol_L is negative or Newton fails to converge
+
+    Example:
+        >>> round(solve_carbonate_pH(1e-3, 1e-3), 1)  # 1 mM NaHCO₃
+        8.3
+    """
+    if c_total_mol_L < 0:
+        raise ValueError(f"Total carbonate must be non-negative, got {c_total_mol_L}")
+
+    K_a1, K_a2, K_w = carbonate_constants(temperature_C)
+
+    pH, converged = _newton_pH(
+        float(pH_guess), float(c_total_mol_L), float(cb_net_eq_L), K_a1, K_a2, K_w
+    )
+    if not converged:
+        raise ValueError(
+            f"Carbonate pH solve did not converge in {_MAX_ITER} iterations "
+            f"(C_T={c_total_mol_L} mol/L, net charge={cb_net_eq_L} eq/L)"
+        )
+    return pH
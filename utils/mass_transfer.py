@@ -22,6 +22,9 @@ NO HEURISTICS: All equations traceable to peer-reviewed sources.
 
 from typing import Optional, Literal
 import logging
+import math
+
+import numpy as np
 
 # Import CalebBell libraries for authoritative correlations (REQUIRED)
 # fluids: Dimensionless number calculations (Re, Sc, Sh converters)
@@ -32,9 +35,16 @@ import logging
 from fluids.core import Reynolds, Schmidt, Sherwood as Sherwood_dimensionless
 from ht.conv_internal import turbulent_Colburn, laminar_T_const
 
+# Optional JIT for the Sherwood correlation kernels (no-op without numba)
+from utils._numba_compat import njit
+
 
 # Physical constants
 FARADAY_CONSTANT = 96485.33212  # C/mol (CODATA 2018)
+
+# Flat plate Sherwood coefficients (Bird, Stewart & Lightfoot Eqs. 22.2-10, 22.2-13)
+_SH_LAMINAR_PLATE_COEFF = 0.664
+_SH_TURB_PLATE_COEFF = 0.037
 logger = logging.getLogger(__name__)
 
 
@@ -175,14 +185,14 @@ def calculate_sherwood_number_laminar_pipe(
 
     if entry_effects:
         # Graetz number: Gz = (D/L) * Re * Sc
-        Gz = (diameter_m / length_m) * Re * Sc
+        Gz = _graetz_number(float(Re), float(Sc), float(length_m), float(diameter_m))
 
         # Graetz correlation validity: 10 < Gz < 2000 per Incropera Eq. 8.56
         if 10 < Gz <= 2000:
             # Developing flow (Sieder-Tate correlation for mass transfer)
             # Reference: Incropera & DeWitt (2002), Eq. 8.56
             # Valid range: Re*Sc*D/L < 2000
-            Sh_developing = 1.86 * (Gz)**(1/3)
+            Sh_developing = _sherwood_graetz(Gz)
 
             # Use larger of the two (entrance effects dominate for short pipes)
             return max(Sh_developing, Sh_fully_developed)
@@ -282,12 +292,12 @@ def calculate_sherwood_number_flat_plate(
         if Re > 5e5:
             logger.warning(f"Re={Re:.0f} suggests turbulent flow for flat plate.")
         # Blasius solution for laminar boundary layer
-        Sh = 0.664 * Re**0.5 * Sc**(1/3)
+        Sh = _flat_plate_laminar(float(Re), float(Sc))
     else:  # turbulent
         if Re < 5e5:
             logger.warning(f"Re={Re:.0f} suggests laminar flow for flat plate.")
         # Turbulent boundary layer correlation
-        Sh = 0.037 * Re**0.8 * Sc**(1/3)
+        Sh = _flat_plate_turbulent(float(Re), float(Sc))
 
     return Sh
 
@@ -349,6 +359,96 @@ def calculate_sherwood_number(
         raise ValueError(f"Unknown geometry: {geometry}. Use 'pipe' or 'plate'.")
 
 
+def calculate_sherwood_number_array(
+    Re: np.ndarray,
+    Sc: np.ndarray,
+    geometry: Literal["pipe", "plate"] = "pipe",
+    length_m: Optional[float] = None,
+    diameter_m: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Vectorized calculate_sherwood_number for Re/Sc parameter sweeps.
+
+    Applies the same regime selection as the scalar calculator element-wise
+    (Re, Sc, length_m and diameter_m broadcast against each other), so
+    each element equals the corresponding scalar call.
+
+    Args:
+        Re: Reynolds numbers
+        Sc: Schmidt numbers
+        geometry: Geometry type ("pipe" or "plate")
+        length_m: Pipe/plate length (required for laminar pipe with Graetz effects)
+        diameter_m: Pipe diameter (required for laminar pipe with Graetz effects)
+
+    Returns:
+        Array of Sherwood numbers (dimensionless)
+
+    Example:
+        >>> calculate_sherwood_number_array(np.array([1e3, 5e4]), 600.0,
+        ...                                 geometry="pipe", length_m=36.0, diameter_m=0.05)
+        array([  17.5, 1114.2])
+    """
+    Re = np.asarray(Re, dtype=float)
+    Sc = np.asarray(Sc, dtype=float)
+    cbrt_Sc = np.cbrt(Sc)
+
+    if geometry == "pipe":
+        Sh_fully_developed = laminar_T_const()  # Returns 3.66
+        turbulent = Re >= 10000
+
+        if not turbulent.all() and (length_m is None or diameter_m is None):
+            logger.warning("L and D required for Graetz effects. Using fully developed Sh=3.66.")
+            Sh_laminar = np.full(np.broadcast(Re, Sc).shape, Sh_fully_developed)
+        elif length_m is None or diameter_m is None:
+            Sh_laminar = Sh_fully_developed
+        else:
+            Gz = (np.asarray(diameter_m, dtype=float) / np.asarray(length_m, dtype=float)) * Re * Sc
+            Sh_developing = np.maximum(1.86 * np.cbrt(Gz), Sh_fully_developed)
+            Sh_laminar = np.where((Gz > 10) & (Gz <= 2000), Sh_developing, Sh_fully_developed)
+
+        # turbulent_Colburn is plain arithmetic, so it evaluates the whole array
+        Sh_turbulent = turbulent_Colburn(Re=Re, Pr=Sc)  # Pr→Sc by analogy
+        return np.where(turbulent, Sh_turbulent, Sh_laminar)
+
+    elif geometry == "plate":
+        return np.where(
+            Re < 5e5,
+            _SH_LAMINAR_PLATE_COEFF * np.sqrt(Re) * cbrt_Sc,
+            _SH_TURB_PLATE_COEFF * Re**0.8 * cbrt_Sc,
+        )
+
+    else:
+        raise ValueError(f"Unknown geometry: {geometry}. Use 'pipe' or 'plate'.")
+
+
+# ============================================================================
+# Correlation kernels (numba-compiled when available)
+# ============================================================================
+
+@njit(cache=True)
+def _graetz_number(Re, Sc, length_m, diameter_m):
+    """Gz = (D/L) * Re * Sc"""
+    return (diameter_m / length_m) * Re * Sc
+
+
+@njit(cache=True)
+def _sherwood_graetz(Gz):
+    """Developing laminar pipe flow: Sh = 1.86 * Gz^(1/3) (Incropera Eq. 8.56)"""
+    return 1.86 * np.cbrt(Gz)
+
+
+@njit(cache=True)
+def _flat_plate_laminar(Re, Sc):
+    """Blasius laminar boundary layer: Sh = 0.664 * Re^0.5 * Sc^(1/3)"""
+    return _SH_LAMINAR_PLATE_COEFF * math.sqrt(Re) * np.cbrt(Sc)
+
+
+@njit(cache=True)
+def _flat_plate_turbulent(Re, Sc):
+    """Turbulent boundary layer: Sh = 0.037 * Re^0.8 * Sc^(1/3)"""
+    return _SH_TURB_PLATE_COEFF * Re ** 0.8 * np.cbrt(Sc)
+
+
 # ============================================================================
 # Mass Transfer Coefficient
 # ============================================================================
@@ -14,15 +14,20 @@ import pandas as pd
 import requests
 import requests_cache
 import logging
+import os
 from pathlib import Path
 from core.interfaces import MaterialDatabase
 
 logger = logging.getLogger(__name__)
 
 # Install HTTP cache per Codex recommendation
-# Reduces repeated external calls on server restart
-_CACHE_DIR = Path(__file__).parent.parent / ".cache"
-_CACHE_DIR.mkdir(exist_ok=True)
+# Reduces repeated external calls on server restart.
+# CORROSION_MCP_CACHE_DIR overrides the location (the test suite points it
+# at a temp dir so runs never write into the repo).
+_CACHE_DIR = Path(
+    os.environ.get("CORROSION_MCP_CACHE_DIR", Path(__file__).parent.parent / ".cache")
+)
+_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 requests_cache.install_cache(
     str(_CACHE_DIR / "http_cache"),
     backend="sqlite",
@@ -27,14 +27,56 @@ Classes:
 - ReactionType: Enumeration of reaction types
 - CathodicReaction: ORR, HER (reduction reactions)
 - AnodicReaction: Metal oxidation, passivation, pitting (oxidation reactions)
+- ReactionBatch: Several reactions stacked for one broadcast evaluation
 """
 
+from dataclasses import dataclass
 from enum import Enum, auto
 import numpy as np
-from typing import Tuple, Optional
+from typing import Sequence, Tuple, Optional, Union
 from .nrl_constants import C
 from .nrl_materials import CorrodingMetal
 
+# Optional JIT for the Butler-Volmer kernels (no-op without numba)
+from ._numba_compat import njit
+
+
+@njit(cache=True)
+def _bv_branches(eta, i0_cathodic, i0_anodic, alpha, zF_RT):
+    """
+    Butler-Volmer partial currents over a potential sweep.
+
+    Args:
+        eta: Overpotentials, V (float64 array)
+        i0_cathodic: Cathodic exchange current density, A/cm²
+        i0_anodic: Anodic exchange current density, A/cm²
+        alpha: Transfer coefficient
+        zF_RT: z*F/(R*T), 1/V
+
+    Returns:
+        (i_cathodic, i_anodic) magnitudes, A/cm²
+    """
+    i_cathodic = i0_cathodic * np.exp(-((1.0 - alpha) * zF_RT) * eta)
+    i_anodic = i0_anodic * np.exp((alpha * zF_RT) * eta)
+    return i_cathodic, i_anodic
+
+
+@njit(cache=True)
+def _bv_current(eta, i0_cathodic, i0_anodic, alpha, zF_RT, i_lim):
+    """
+    Butler-Volmer activation current combined with the diffusion limit.
+
+    Evaluates both branches and the Koutecky-Levich total in one pass:
+    i_total = (i_lim * i_act) / (i_act + i_lim).
+
+    Returns:
+        (i_cathodic, i_anodic, i_act, i_total), A/cm²
+    """
+    i_cathodic, i_anodic = _bv_branches(eta, i0_cathodic, i0_anodic, alpha, zF_RT)
+    i_act = i_anodic - i_cathodic
+    i_total = (i_lim * i_act) / (i_act + i_lim)
+    return i_cathodic, i_anodic, i_act, i_total
+
 
 class ReactionType(Enum):
     """
@@ -156,27 +198,24 @@ class CathodicReaction:
         self.i0_cathodic = pF * np.exp(-self.delta_g_cathodic / RT)  # A/cm²
         self.i0_anodic = pF * np.exp(-self.delta_g_anodic / RT)  # A/cm²
 
-        # Butler-Volmer activation current
-        if reaction_type == ReactionType.NONE:
-            self.i_cathodic = np.zeros_like(self.eta)
-            self.i_anodic = np.zeros_like(self.eta)
-            self.i_act = np.zeros_like(self.eta)
-        else:
-            exp_val_cathodic = -(((1.0 - self.alpha) * self.z * C.F) * self.eta) / RT
-            exp_val_anodic = ((self.alpha * self.z * C.F) * self.eta) / RT
-
-            self.i_cathodic = self.i0_cathodic * np.exp(exp_val_cathodic)
-            self.i_anodic = self.i0_anodic * np.exp(exp_val_anodic)
-            self.i_act = self.i_anodic - self.i_cathodic  # Net activation current
-
         # Diffusion-limited current
         self.i_lim = self._calculate_diffusion_limit()
 
-        # Combined current (Koutecky-Levich)
+        # Butler-Volmer activation current and combined current (Koutecky-Levich)
         if reaction_type == ReactionType.NONE:
+            self.i_cathodic = np.zeros_like(self.eta)
+            self.i_anodic = np.zeros_like(self.eta)
+            self.i_act = np.zeros_like(self.eta)
             self.i_total = np.zeros_like(self.eta)
         else:
-            self.i_total = (self.i_lim * self.i_act) / (self.i_act + self.i_lim)
+            self.i_cathodic, self.i_anodic, self.i_act, self.i_total = _bv_current(
+                np.asarray(self.eta, dtype=np.float64),
+                float(self.i0_cathodic),
+                float(self.i0_anodic),
+                float(self.alpha),
+                self.z * C.F / RT,
+                np.asarray(self.i_lim, dtype=np.float64),
+            )
 
     def _calculate_diffusion_limit(self) -> np.ndarray:
         """
@@ -350,12 +389,14 @@ class AnodicReaction:
         self.i0_anodic = pF * np.exp(-self.delta_g_anodic / RT)
 
         # Butler-Volmer activation current
-        i_act_cathodic = -self.i0_cathodic * np.exp(
-            (-(1 - self.alpha) * self.z * C.F * self.eta) / RT
-        )
-        i_act_anodic = self.i0_anodic * np.exp(
-            (self.alpha * self.z * C.F * self.eta) / RT
+        i_act_cathodic, i_act_anodic = _bv_branches(
+            np.asarray(self.eta, dtype=np.float64),
+            float(self.i0_cathodic),
+            float(self.i0_anodic),
+            float(self.alpha),
+            self.z * C.F / RT,
         )
+        i_act_cathodic = -i_act_cathodic
 
         # Apply passive film resistance correction for passivation
         if reaction_type == ReactionType.PASSIVATION:
@@ -556,8 +597,107 @@ class AnodicReaction:
         return f_i, df_i
 
 
+@dataclass(frozen=True)
+class ReactionBatch:
+    """
+    Butler-Volmer parameters of several reactions as parallel arrays.
+
+    Evaluates every reaction at every potential in one broadcast instead of
+    one reaction object at a time. Row k of the result reproduces
+    reactions[k].i_total on the same potentials.
+
+    Passivation is not batchable: its film-resistance correction is a
+    per-point Newton solve that depends on the sweep history.
+
+    Attributes:
+        potentials_VSCE: Applied potentials, V_SCE, shape (n_potentials,)
+        e_eq_VSCE: Nernst potentials, V_SCE, shape (n_reactions,)
+        i0_cathodic: Cathodic exchange current densities, A/cm²
+        i0_anodic: Anodic exchange current densities, A/cm²
+        alpha: Transfer coefficients
+        zF_RT: z*F/(R*T) per reaction, 1/V
+        i_lim: Diffusion-limited current densities, A/cm² (NaN for anodic rows)
+        active: False for ReactionType.NONE rows (zero current)
+    """
+    potentials_VSCE: np.ndarray
+    e_eq_VSCE: np.ndarray
+    i0_cathodic: np.ndarray
+    i0_anodic: np.ndarray
+    alpha: np.ndarray
+    zF_RT: np.ndarray
+    i_lim: np.ndarray
+    active: np.ndarray
+
+    @classmethod
+    def from_list(
+        cls,
+        reactions: Sequence[Union[CathodicReaction, AnodicReaction]],
+        potentials_VSCE: np.ndarray,
+    ) -> "ReactionBatch":
+        """
+        Stack reaction parameters into (n_reactions,) arrays.
+
+        Args:
+            reactions: Constructed CathodicReaction/AnodicReaction objects
+            potentials_VSCE: Applied potentials to evaluate on, V_SCE
+
+        Returns:
+            ReactionBatch over the given potentials
+
+        Raises:
+            ValueError: If a passivation reaction is included
+        """
+        for reaction in reactions:
+            if reaction.reaction_type == ReactionType.PASSIVATION:
+                raise ValueError(
+                    "Passivation reactions cannot be batched "
+                    "(film-resistance correction is solved per point)"
+                )
+
+        def column(values) -> np.ndarray:
+            return np.array(values, dtype=np.float64)
+
+        return cls(
+            potentials_VSCE=np.asarray(potentials_VSCE, dtype=np.float64),
+            e_eq_VSCE=column([r.EN_SHE - C.E_SHE_to_SCE for r in reactions]),
+            i0_cathodic=column([r.i0_cathodic for r in reactions]),
+            i0_anodic=column([r.i0_anodic for r in reactions]),
+            alpha=column([r.alpha for r in reactions]),
+            zF_RT=column([r.z * C.F / (C.R * r.temperature_K) for r in reactions]),
+            i_lim=column([
+                r.i_lim[0] if isinstance(r, CathodicReaction) else np.nan
+                for r in reactions
+            ]),
+            active=np.array([r.reaction_type != ReactionType.NONE for r in reactions]),
+        )
+
+    def current_densities(self) -> np.ndarray:
+        """
+        Net current of every reaction at every potential.
+
+        Returns:
+            i_total, A/cm², shape (n_reactions, n_potentials)
+        """
+        eta = self.potentials_VSCE[None, :] - self.e_eq_VSCE[:, None]
+        zF_RT = self.zF_RT[:, None]
+        alpha = self.alpha[:, None]
+
+        i_cathodic = self.i0_cathodic[:, None] * np.exp(-((1.0 - alpha) * zF_RT) * eta)
+        i_anodic = self.i0_anodic[:, None] * np.exp((alpha * zF_RT) * eta)
+        i_act = i_anodic - i_cathodic
+
+        # Koutecky-Levich for diffusion-limited (cathodic) rows
+        i_lim = self.i_lim[:, None]
+        with np.errstate(invalid="ignore"):
+            i_kl = (i_lim * i_act) / (i_act + i_lim)
+        i_total = np.where(np.isnan(i_lim), i_act, i_kl)
+
+        return np.where(self.active[:, None], i_total, 0.0)
+
+
 __all__ = [
     "ReactionType",
     "CathodicReaction",
     "AnodicReaction",
+    "ReactionBatch",
 ]
@@ -31,7 +31,6 @@ Each material class encapsulates:
 
 import os
 import numpy as np
-import pandas as pd
 from pathlib import Path
 from typing import Tuple, Literal, Optional
 from functools import lru_cache
@@ -41,7 +40,7 @@ from functools import lru_cache
 NRL_COEFFICIENTS_DIR = Path(__file__).parent.parent / "external" / "nrl_coefficients"
 
 
-# Module-level CSV cache to avoid redundant pandas reads
+# Module-level CSV cache so each coefficient file is parsed once per process
 @lru_cache(maxsize=32)
 def _load_csv_coefficients_cached(csv_path_str: str) -> np.ndarray:
     """
@@ -51,7 +50,7 @@ def _load_csv_coefficients_cached(csv_path_str: str) -> np.ndarray:
         csv_path_str: Full path to CSV file as string (for hashability)
 
     Returns:
-        Array of 6 coefficients: [p00, p10, p01, p20, p11, p02]
+        Read-only array of 6 coefficients: [p00, p10, p01, p20, p11, p02]
 
     Raises:
         FileNotFoundError: If CSV file not found
@@ -66,16 +65,33 @@ def _load_csv_coefficients_cached(csv_path_str: str) -> np.ndarray:
         )
 
     # Read CSV (single row, 6 columns, no header)
-    data = pd.read_csv(csv_path, header=None).values[0]
+    data = np.loadtxt(csv_path, delimiter=",", ndmin=1)
 
     if len(data) != 6:
         raise ValueError(
             f"Expected 6 coefficients in {csv_path.name}, got {len(data)}"
         )
 
+    # Shared by every material instance: guard against in-place edits
+    data.flags.writeable = False
     return data
 
 
+@lru_cache(maxsize=None)
+def _load_all_coefficients() -> dict:
+    """
+    Load every vendored NRL coefficient file in one pass.
+
+    Returns:
+        Dict mapping CSV filename (e.g. "HY80ORRCoeffs.csv") to its
+        read-only 6-coefficient array
+    """
+    return {
+        csv_path.name: _load_csv_coefficients_cached(str(csv_path))
+        for csv_path in sorted(NRL_COEFFICIENTS_DIR.glob("*Coeffs.csv"))
+    }
+
+
 class CorrodingMetal:
     """
     Base class for corroding metals in NRL galvanic corrosion model.
@@ -180,7 +196,29 @@ class CorrodingMetal:
 
         Raises:
             ValueError: If either activation energy is negative
+
+        Note:
+            Array inputs (from a Cl⁻/pH/T grid) are broadcast together and
+            returned as arrays; the first offending grid point is reported.
         """
+        shape = np.broadcast_shapes(
+            np.shape(dg_cathodic), np.shape(dg_anodic),
+            np.shape(chloride_M), np.shape(temperature_C), np.shape(pH),
+        )
+        if shape:
+            dg_cathodic = np.broadcast_to(dg_cathodic, shape).astype(float)
+            dg_anodic = np.broadcast_to(dg_anodic, shape).astype(float)
+            invalid = (dg_cathodic < 0) | (dg_anodic < 0)
+            if invalid.any():
+                idx = tuple(np.argwhere(invalid)[0])
+                CorrodingMetal._validate_activation_energy(
+                    dg_cathodic[idx], dg_anodic[idx], reaction_type,
+                    np.broadcast_to(chloride_M, shape)[idx],
+                    np.broadcast_to(temperature_C, shape)[idx],
+                    np.broadcast_to(pH, shape)[idx],
+                )
+            return (dg_cathodic, dg_anodic)
+
         errors = []
 
         if dg_cathodic < 0:
@@ -227,6 +265,9 @@ class CorrodingMetal:
         Calculate activation energies from CSV polynomial coefficients.
 
         This method must be implemented by each material subclass.
+        chloride_M, pH and temperature_C may be scalars or NumPy arrays;
+        arrays broadcast against each other so a whole (Cl⁻, pH, T) grid
+        is evaluated in one call.
 
         Args:
             reaction_type: Type of electrochemical reaction
@@ -235,7 +276,8 @@ class CorrodingMetal:
             temperature_C: Temperature, °C
 
         Returns:
-            Tuple of (delta_g_cathodic, delta_g_anodic) in J/mol
+            Tuple of (delta_g_cathodic, delta_g_anodic) in J/mol, each an
+            array of the broadcast input shape when any input is an array
         """
         raise NotImplementedError("Subclasses must implement calculate_delta_g()")
 
@@ -253,12 +295,14 @@ class CorrodingMetal:
             FileNotFoundError: If CSV file not found in external/nrl_coefficients/
 
         Note:
-            Uses @lru_cache wrapper to avoid redundant pandas CSV reads.
-            Cache hit rate should be high since files are static.
+            All coefficient files are parsed together on first use, so
+            later material instances do no file I/O.
         """
-        csv_path = NRL_COEFFICIENTS_DIR / csv_filename
-        # Use cached loader (requires string path for hashability)
-        return _load_csv_coefficients_cached(str(csv_path))
+        coeffs = _load_all_coefficients().get(csv_filename)
+        if coeffs is None:
+            # Unknown name: the cached single-file loader raises FileNotFoundError
+            coeffs = _load_csv_coefficients_cached(str(NRL_COEFFICIENTS_DIR / csv_filename))
+        return coeffs
 
     def _apply_polynomial_response_surface(
         self,
@@ -277,11 +321,12 @@ class CorrodingMetal:
 
         Args:
             coeffs: Array of [p00, p10, p01, p20, p11, p02]
-            chloride_M: Chloride concentration, M
+            chloride_M: Chloride concentration, M (scalar or array)
             temperature_C: Temperature, °C (will be converted to Kelvin internally)
 
         Returns:
-            Activation energy without pH correction, J/mol
+            Activation energy without pH correction, J/mol (broadcast shape
+            of chloride_M and temperature_C)
         """
         p00, p10, p01, p20, p11, p02 = coeffs
 
@@ -1095,6 +1140,10 @@ def create_material(
     Raises:
         ValueError: If material_name not recognized
 
+    Note:
+        Instances are cached per (material_name, conditions) and shared
+        between callers; treat them as read-only.
+
     Supported Materials:
     - "HY80", "HY-80", "HY_80" → HY80
     - "HY100", "HY-100", "HY_100" → HY100
@@ -1133,8 +1182,28 @@ def create_material(
             f"Supported materials: {supported}"
         )
 
-    material_class = material_map[material_key]
+    return _create_material_cached(
+        material_map[material_key],
+        material_name,
+        chloride_M,
+        temperature_C,
+        pH,
+        velocity_m_s
+    )
 
+
+# Instances depend only on (class, name, conditions) and the immutable NRL
+# coefficients, so repeated builds for the same environment are shared
+@lru_cache(maxsize=128)
+def _create_material_cached(
+    material_class: type,
+    material_name: str,
+    chloride_M: float,
+    temperature_C: float,
+    pH: float,
+    velocity_m_s: float
+) -> CorrodingMetal:
+    """Build (or reuse) a material instance; callers must not mutate it."""
     return material_class(
         name=material_name,
         chloride_M=chloride_M,
@@ -36,12 +36,48 @@ NO heuristics, simplifications, or hard-coded approximations.
 import math
 from typing import Optional
 
+import numpy as np
+
 
 # Physical constants
 MGL_PER_MLL = 1.42905  # Conversion from mL/L to mg/L per USGS memo 2011.03
 MMHG_PER_MB = 0.750061683  # Conversion from mm Hg to millibars
 STANDARD_PRESSURE_MMHG = 760.0  # Standard atmospheric pressure (mm Hg)
 
+# Garcia-Benson (1992) coefficients - exact values from paper
+# ln(C) = sum(A[k]*Ts^k) + S*sum(B[k]*Ts^k) + C0*S^2
+GARCIA_BENSON_A = (2.00907, 3.22014, 4.05010, 4.94457, -0.256847, 3.88767)
+GARCIA_BENSON_B = (-6.24523e-3, -7.37614e-3, -1.03410e-2, -8.17083e-3)
+GARCIA_BENSON_C0 = -4.88682e-7
+
+# Antoine equation for water vapor pressure (mm Hg), USGS memo 81.11
+# u = 10^(ANTOINE_A - ANTOINE_B/(ANTOINE_C + T))
+ANTOINE_A = 8.10765
+ANTOINE_B = 1750.286
+ANTOINE_C = 235.0
+
+# Barometric formula (Colt 2012)
+MMHG_PER_INHG = 25.3970886
+STANDARD_PRESSURE_INHG = 29.92126  # inches Hg at sea level
+STANDARD_TEMP_K = 288.15  # 15°C in Kelvin
+GRAV_ACCEL = 9.80665  # m/s²
+AIR_MOLAR_MASS = 0.0289644  # kg/mol
+GAS_CONSTANT = 8.31447  # J/(mol·K)
+
+
+def estimate_barometric_pressure(altitude_m: float = 0.0) -> float:
+    """
+    Estimate barometric pressure (mm Hg) at altitude_m by the Colt (2012)
+    barometric formula, as used when no pressure is supplied.
+    """
+    return (MMHG_PER_INHG * STANDARD_PRESSURE_INHG *
+            math.exp((-GRAV_ACCEL * AIR_MOLAR_MASS * altitude_m) /
+                     (GAS_CONSTANT * STANDARD_TEMP_K)))
+
+
+# Barometric formula pressure at sea level (mm Hg)
+SEA_LEVEL_PRESSURE_MMHG = estimate_barometric_pressure(0.0)
+
 
 def calculate_do_saturation_weiss1970(
     temperature_C: float,
@@ -144,33 +180,27 @@ def calculate_do_saturation_garcia_benson(
         S = salinity (PSU)
 
     Args:
-        temperature_C: Water temperature (°C)
+        temperature_C: Water temperature (°C), scalar or array
         salinity_psu: Salinity in Practical Salinity Units (PSU)
         pressure_mbar: Barometric pressure (millibars). If None, calculated from altitude
         altitude_m: Elevation above sea level (m). Used if pressure_mbar is None
 
     Returns:
-        Dissolved oxygen saturation concentration (mg/L)
+        Dissolved oxygen saturation concentration (mg/L), broadcast over
+        array inputs
 
     Example:
         >>> calculate_do_saturation_garcia_benson(25.0, salinity_psu=0.0)
         8.26  # mg/L
     """
     # Calculate scaled temperature per Garcia & Gordon (1992)
-    Ts = math.log((298.15 - temperature_C) / (273.15 + temperature_C))
+    # (NumPy ufuncs so array temperatures evaluate elementwise)
+    Ts = np.log((298.15 - temperature_C) / (273.15 + temperature_C))
 
     # Garcia-Benson (1992) coefficients - exact values from paper
-    A0 = 2.00907
-    A1 = 3.22014
-    A2 = 4.05010
-    A3 = 4.94457
-    A4 = -0.256847
-    A5 = 3.88767
-    B0 = -6.24523e-3
-    B1 = -7.37614e-3
-    B2 = -1.03410e-2
-    B3 = -8.17083e-3
-    C0 = -4.88682e-7
+    A0, A1, A2, A3, A4, A5 = GARCIA_BENSON_A
+    B0, B1, B2, B3 = GARCIA_BENSON_B
+    C0 = GARCIA_BENSON_C0
 
     # Calculate ln(C) in mL/L
     ln_C = (A0 +
@@ -183,7 +213,7 @@ def calculate_do_saturation_garcia_benson(
             C0 * salinity_psu**2)
 
     # Convert from ln(C) to C (mL/L)
-    o2_sat_mL_per_L = math.exp(ln_C)
+    o2_sat_mL_per_L = np.exp(ln_C)
 
     # Convert from mL/L to mg/L
     o2_sat_mg_per_L = o2_sat_mL_per_L * MGL_PER_MLL
@@ -225,23 +255,14 @@ def _calculate_pressure_correction(
     # Estimate barometric pressure from altitude if not provided
     if pressure_mbar is None:
         # Barometric formula (Colt 2012)
-        MMHG_PER_INHG = 25.3970886
-        STANDARD_PRESSURE_INHG = 29.92126  # inches Hg at sea level
-        STANDARD_TEMP_K = 288.15  # 15°C in Kelvin
-        GRAV_ACCEL = 9.80665  # m/s²
-        AIR_MOLAR_MASS = 0.0289644  # kg/mol
-        GAS_CONSTANT = 8.31447  # J/(mol·K)
-
-        pressure_mmHg = (MMHG_PER_INHG * STANDARD_PRESSURE_INHG *
-                        math.exp((-GRAV_ACCEL * AIR_MOLAR_MASS * altitude_m) /
-                                (GAS_CONSTANT * STANDARD_TEMP_K)))
+        pressure_mmHg = estimate_barometric_pressure(altitude_m)
         pressure_mbar = pressure_mmHg / MMHG_PER_MB
     else:
         pressure_mmHg = pressure_mbar * MMHG_PER_MB
 
     # Calculate vapor pressure of water by Antoine equation
     # u = 10^(8.10765 - 1750.286/(235 + T))
-    u_mmHg = 10 ** (8.10765 - 1750.286 / (235.0 + temperature_C))
+    u_mmHg = 10 ** (ANTOINE_A - ANTOINE_B / (ANTOINE_C + temperature_C))
 
     # Pressure correction factor per USGS memos
     # press_corr = (P - u) / (760 - u)
@@ -17,18 +17,40 @@ References:
 
 import numpy as np
 from dataclasses import dataclass
-from typing import Optional, Literal
+from functools import lru_cache
+from typing import Optional, Literal, Union
 from enum import Enum
 
 # Import authoritative DO saturation implementation from project
+# (the ufunc is JIT-compiled when numba is installed)
 try:
-    from utils.oxygen_solubility import calculate_do_saturation
+    from utils._numba_compat import vectorize
+    from utils.oxygen_solubility import (
+        ANTOINE_A,
+        ANTOINE_B,
+        ANTOINE_C,
+        GARCIA_BENSON_A,
+        MGL_PER_MLL,
+        MMHG_PER_MB,
+        SEA_LEVEL_PRESSURE_MMHG,
+        STANDARD_PRESSURE_MMHG,
+    )
 except ImportError:
     # When running as __main__, adjust import path
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from utils.oxygen_solubility import calculate_do_saturation
+    from utils._numba_compat import vectorize
+    from utils.oxygen_solubility import (
+        ANTOINE_A,
+        ANTOINE_B,
+        ANTOINE_C,
+        GARCIA_BENSON_A,
+        MGL_PER_MLL,
+        MMHG_PER_MB,
+        SEA_LEVEL_PRESSURE_MMHG,
+        STANDARD_PRESSURE_MMHG,
+    )
 
 
 # ==============================================================================
@@ -105,28 +127,60 @@ class RedoxState:
 # Henry's Law for O₂ Solubility
 # ==============================================================================
 
-def henry_constant_o2(temperature_C: float) -> float:
+@vectorize(["float64(float64, float64)"], cache=True)
+def _do_saturation_kernel(temperature_C, pressure_mmHg):
+    """
+    Freshwater Garcia-Benson (1992) DO saturation (mg/L) at pressure_mmHg.
+
+    Same coefficients and USGS vapor-pressure correction as
+    calculate_do_saturation_garcia_benson at zero salinity, as a ufunc
+    (compiled by numba when available, plain NumPy otherwise).
+    """
+    A = GARCIA_BENSON_A
+    Ts = np.log((298.15 - temperature_C) / (273.15 + temperature_C))
+    ln_C = A[0] + Ts * (A[1] + Ts * (A[2] + Ts * (A[3] + Ts * (A[4] + Ts * A[5]))))
+    u_mmHg = 10 ** (ANTOINE_A - ANTOINE_B / (ANTOINE_C + temperature_C))
+    press_corr = (pressure_mmHg - u_mmHg) / (STANDARD_PRESSURE_MMHG - u_mmHg)
+    return np.exp(ln_C) * MGL_PER_MLL * press_corr
+
+
+# DO saturation tabulated on a uniform T × P grid for bilinear lookup;
+# points outside the grid fall back to the exact kernel. DO_sat is linear
+# in P, so the P direction interpolates exactly and the error is the
+# T-direction bound dT²/8 · max|∂²DO_sat/∂T²|. The curvature peaks at
+# 0 °C, 1.1 atm (~0.022 mg/L/°C²), giving 1.7e-4 mg/L for 0.25 °C steps.
+_DO_SAT_T0, _DO_SAT_DT, _DO_SAT_NT = 0.0, 0.25, 161   # 0-40 °C
+_DO_SAT_P0, _DO_SAT_DP, _DO_SAT_NP = 0.5, 0.01, 61    # 0.5-1.1 atm
+_DO_SAT_MAX_ERROR_MG_L = 2e-4
+_DO_SAT_TABLE = _do_saturation_kernel(
+    (_DO_SAT_T0 + _DO_SAT_DT * np.arange(_DO_SAT_NT))[:, None],
+    (_DO_SAT_P0 + _DO_SAT_DP * np.arange(_DO_SAT_NP))[None, :] * (1013.25 * MMHG_PER_MB),
+)
+_DO_SAT_TABLE.flags.writeable = False
+_DO_SAT_ROWS = tuple(tuple(row) for row in _DO_SAT_TABLE.tolist())  # scalar path
+
+
+def henry_constant_o2(temperature_C: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Calculate temperature-dependent Henry's law constant for O₂.
 
-    Derived from Garcia & Gordon (1992) DO saturation model via
-    utils/oxygen_solubility.py (authoritative implementation).
+    Derived from the Garcia & Gordon (1992) DO saturation model of
+    utils/oxygen_solubility.py (authoritative implementation) at sea level.
 
     Args:
-        temperature_C: Temperature (°C)
+        temperature_C: Temperature (°C), scalar or array
 
     Returns:
-        Henry's constant (mol/(L·atm))
+        Henry's constant (mol/(L·atm)), same shape as temperature_C
+        (scalar results are memoized per temperature)
 
     Reference:
         Derived from Garcia & Gordon (1992)
     """
-    # Get DO saturation from authoritative implementation
-    DO_sat_mg_L = calculate_do_saturation(
-        temperature_C,
-        salinity_psu=0.0,
-        model="garcia-benson"
-    )
+    if isinstance(temperature_C, (int, float)):
+        return _henry_constant_o2_scalar(float(temperature_C))
+
+    DO_sat_mg_L = _do_saturation_kernel(temperature_C, SEA_LEVEL_PRESSURE_MMHG)
 
     # Convert to Henry's constant
     # DO_sat = K_H * p_O2 * MW_O2 * 1000
@@ -137,44 +191,119 @@ def henry_constant_o2(temperature_C: float) -> float:
     return K_H
 
 
-def do_saturation(temperature_C: float, pressure_atm: float = 1.0) -> float:
+@lru_cache(maxsize=512)
+def _henry_constant_o2_scalar(temperature_C: float) -> float:
+    """Scalar henry_constant_o2, memoized: callers revisit a few temperatures."""
+    p_O2 = 0.2095  # atm (air)
+    DO_sat_mg_L = float(_do_saturation_kernel(temperature_C, SEA_LEVEL_PRESSURE_MMHG))
+    return DO_sat_mg_L / (p_O2 * C.MW_O2 * 1000)  # mol/(L·atm)
+
+
+def do_saturation(
+    temperature_C: Union[float, np.ndarray],
+    pressure_atm: Union[float, np.ndarray] = 1.0,
+) -> Union[float, np.ndarray]:
     """
     Calculate DO saturation concentration at air equilibrium.
 
-    Uses Garcia & Gordon (1992) model via utils/oxygen_solubility.py
-    (authoritative implementation with full provenance).
+    Uses the Garcia & Gordon (1992) model of utils/oxygen_solubility.py
+    (authoritative implementation with full provenance). Inside 0-40 °C
+    and 0.5-1.1 atm the value is bilinearly interpolated from a table of
+    that model (error < 2e-4 mg/L); elsewhere it is evaluated exactly.
+    Temperature and pressure sweeps are one call.
 
     Args:
-        temperature_C: Temperature (°C)
-        pressure_atm: Atmospheric pressure (atm)
+        temperature_C: Temperature (°C), scalar or array
+        pressure_atm: Atmospheric pressure (atm), scalar or array
 
     Returns:
-        DO saturation (mg/L)
+        DO saturation (mg/L), broadcast over array inputs
 
     Note:
-        Assumes air with 20.95% O₂ by volume
+        Assumes air with 20.95% O₂ by volume. Scalar results are memoized
+        per (temperature_C, pressure_atm); arrays are always evaluated.
     """
-    # Use authoritative implementation
-    # Garcia & Gordon is normalized to 1 atm, scale with pressure
-    DO_sat = calculate_do_saturation(
-        temperature_C,
-        salinity_psu=0.0,
-        pressure_mbar=pressure_atm * 1013.25,  # Convert atm to mbar
-        model="garcia-benson"
+    if isinstance(temperature_C, (int, float)) and isinstance(pressure_atm, (int, float)):
+        return _do_saturation_scalar(float(temperature_C), float(pressure_atm))
+
+    T_C, P_atm = np.broadcast_arrays(
+        np.asarray(temperature_C, dtype=float), np.asarray(pressure_atm, dtype=float)
     )
 
-    return DO_sat
+    # Fractional grid coordinates and the lower corner of each cell
+    x = (T_C - _DO_SAT_T0) / _DO_SAT_DT
+    y = (P_atm - _DO_SAT_P0) / _DO_SAT_DP
+    i = np.clip(np.floor(x).astype(np.intp), 0, _DO_SAT_NT - 2)
+    j = np.clip(np.floor(y).astype(np.intp), 0, _DO_SAT_NP - 2)
+    fx = x - i
+    fy = y - j
+
+    t = _DO_SAT_TABLE
+    DO_sat = np.asarray(
+        (t[i, j] * (1.0 - fx) + t[i + 1, j] * fx) * (1.0 - fy)
+        + (t[i, j + 1] * (1.0 - fx) + t[i + 1, j + 1] * fx) * fy
+    )
+
+    off_grid = (x < 0) | (x > _DO_SAT_NT - 1) | (y < 0) | (y > _DO_SAT_NP - 1)
+    if np.any(off_grid):
+        # Garcia & Gordon is normalized to 1 atm, scale with pressure
+        pressure_mmHg = P_atm[off_grid] * (1013.25 * MMHG_PER_MB)  # atm → mbar → mm Hg
+        DO_sat[off_grid] = _do_saturation_kernel(T_C[off_grid], pressure_mmHg)
+
+    return float(DO_sat) if DO_sat.ndim == 0 else DO_sat
+
+
+@lru_cache(maxsize=512)
+def _do_saturation_scalar(temperature_C: float, pressure_atm: float) -> float:
+    """
+    Scalar do_saturation: the same bilinear lookup on plain floats.
+
+    Memoized, since callers revisit a few (T, P) pairs such as 25 °C, 1 atm.
+    """
+    x = (temperature_C - _DO_SAT_T0) / _DO_SAT_DT
+    y = (pressure_atm - _DO_SAT_P0) / _DO_SAT_DP
+    if not (0.0 <= x <= _DO_SAT_NT - 1 and 0.0 <= y <= _DO_SAT_NP - 1):
+        pressure_mmHg = pressure_atm * (1013.25 * MMHG_PER_MB)  # atm → mbar → mm Hg
+        return float(_do_saturation_kernel(temperature_C, pressure_mmHg))
+
+    i = min(int(x), _DO_SAT_NT - 2)
+    j = min(int(y), _DO_SAT_NP - 2)
+    fx = x - i
+    fy = y - j
+    row0, row1 = _DO_SAT_ROWS[i], _DO_SAT_ROWS[i + 1]
+    t00, t01, t10, t11 = row0[j], row0[j + 1], row1[j], row1[j + 1]
+    return (t00 * (1.0 - fx) + t10 * fx) * (1.0 - fy) + (t01 * (1.0 - fx) + t11 * fx) * fy
 
 
 # ==============================================================================
 # DO ↔ Eh Conversions
 # ==============================================================================
 
+def _nernst_factors(temperature_C: Union[float, np.ndarray]):
+    """
+    Nernst pH slope (RT/F)·ln(10) and ORR prefactor RT/4F, both in V.
+
+    Scalar temperatures are memoized; arrays are evaluated elementwise.
+    """
+    if isinstance(temperature_C, (int, float)):
+        return _nernst_factors_scalar(float(temperature_C))
+
+    T_K = np.asarray(temperature_C, dtype=float) + 273.15
+    return 2.303 * C.R * T_K / C.F, (C.R * T_K) / (4.0 * C.F)
+
+
+@lru_cache(maxsize=256)
+def _nernst_factors_scalar(temperature_C: float) -> tuple[float, float]:
+    """Scalar _nernst_factors, memoized: callers revisit a few temperatures."""
+    T_K = temperature_C + 273.15
+    return 2.303 * C.R * T_K / C.F, (C.R * T_K) / (4.0 * C.F)
+
+
 def do_to_eh(
-    dissolved_oxygen_mg_L: float,
-    pH: float,
-    temperature_C: float = 25.0,
-) -> tuple[float, list[str]]:
+    dissolved_oxygen_mg_L: Union[float, np.ndarray],
+    pH: Union[float, np.ndarray],
+    temperature_C: Union[float, np.ndarray] = 25.0,
+) -> tuple[Union[float, np.ndarray], list[str]]:
     """
     Convert dissolved oxygen to redox potential using ORR Nernst equation.
 
@@ -185,15 +314,20 @@ def do_to_eh(
         Eh = E⁰ + (RT/4F) * ln(a_O2) - (RT/F) * ln([OH⁻]²)
         Eh = E⁰ - 0.059*pH + (0.059/4) * log10(p_O2)  [at 25°C]
 
+    Inputs broadcast against each other, so a DO, pH or temperature sweep
+    is one vectorized call.
+
     Args:
-        dissolved_oxygen_mg_L: Dissolved oxygen (mg/L)
-        pH: Solution pH
-        temperature_C: Temperature (°C)
+        dissolved_oxygen_mg_L: Dissolved oxygen (mg/L), scalar or array
+        pH: Solution pH, scalar or array
+        temperature_C: Temperature (°C), scalar or array
 
     Returns:
         Tuple of (Eh_VSHE, warnings)
-            - Eh_VSHE: Redox potential vs SHE (V)
-            - warnings: List of warning messages
+            - Eh_VSHE: Redox potential vs SHE (V); float for scalar inputs,
+              otherwise an array of the broadcast shape
+            - warnings: List of warning messages (each raised at most once,
+              quoting the first offending point of a sweep)
 
     Example:
         >>> Eh, warnings = do_to_eh(8.0, pH=8.1, temperature_C=25.0)
@@ -202,59 +336,74 @@ def do_to_eh(
     """
     warnings = []
 
+    DO, pH, T_C = np.broadcast_arrays(
+        np.asarray(dissolved_oxygen_mg_L, dtype=float),
+        np.asarray(pH, dtype=float),
+        np.asarray(temperature_C, dtype=float),
+    )
+
     # Convert DO (mg/L) to partial pressure (atm) using Henry's law
-    K_H = henry_constant_o2(temperature_C)
-    c_O2_mol_L = dissolved_oxygen_mg_L / (C.MW_O2 * 1000)  # mg/L → mol/L
+    K_H = henry_constant_o2(T_C)
+    c_O2_mol_L = DO / (C.MW_O2 * 1000)  # mg/L → mol/L
     p_O2 = c_O2_mol_L / K_H  # atm
 
     # Check if DO is at or below detection limit (anaerobic conditions)
-    if dissolved_oxygen_mg_L <= 0.01:
+    anaerobic = DO <= 0.01
+    if np.any(anaerobic):
         warnings.append(
             "DO <= 0.01 mg/L (anaerobic conditions). Eh calculation assumes ORR "
             "equilibrium, which may not apply in anaerobic environments where "
             "hydrogen evolution reaction (HER) or sulfate reduction may dominate."
         )
         # Use epsilon to prevent log(0)
-        p_O2 = max(p_O2, 1e-10)
+        p_O2 = np.where(anaerobic, np.maximum(p_O2, 1e-10), p_O2)
 
     # Check if oversaturated
-    DO_sat = do_saturation(temperature_C)
-    if dissolved_oxygen_mg_L > 1.1 * DO_sat:
+    DO_sat = do_saturation(T_C)
+    oversaturated = DO > 1.1 * DO_sat
+    if np.any(oversaturated):
+        k = np.flatnonzero(oversaturated)[0]
         warnings.append(
-            f"DO ({dissolved_oxygen_mg_L:.1f} mg/L) exceeds saturation "
-            f"({DO_sat:.1f} mg/L) by >10%. This may indicate supersaturation "
+            f"DO ({DO.flat[k]:.1f} mg/L) exceeds saturation "
+            f"({np.ravel(DO_sat)[k]:.1f} mg/L) by >10%. This may indicate supersaturation "
             f"or measurement error."
         )
 
     # Nernst equation for ORR
-    T_K = temperature_C + 273.15
-    RT_4F = (C.R * T_K) / (4.0 * C.F)  # V
+    nernst_slope, RT_4F = _nernst_factors(temperature_C)  # V
 
     # Eh = E⁰ - (RT/F)*ln(10)*pH + (RT/4F)*ln(p_O2)
     # Using natural log
-    Eh_VSHE = C.E0_ORR_SHE - (2.303 * C.R * T_K / C.F) * pH + RT_4F * np.log(p_O2)
+    Eh_VSHE = C.E0_ORR_SHE - nernst_slope * pH + RT_4F * np.log(p_O2)
 
-    return Eh_VSHE, warnings
+    return (float(Eh_VSHE) if Eh_VSHE.ndim == 0 else Eh_VSHE), warnings
 
 
 def eh_to_do(
-    eh_VSHE: float,
-    pH: float,
-    temperature_C: float = 25.0,
-) -> tuple[float, list[str]]:
+    eh_VSHE: Union[float, np.ndarray],
+    pH: Union[float, np.ndarray],
+    temperature_C: Union[float, np.ndarray] = 25.0,
+) -> tuple[Union[float, np.ndarray], list[str]]:
     """
     Convert redox potential to dissolved oxygen (inverse of do_to_eh).
 
-    Solves Nernst equation for p_O2, then converts to DO using Henry's law.
+    Inverts the Nernst equation for p_O2 in closed form (no iteration),
+    then converts to DO using Henry's law:
+
+        ln(p_O2) = (4F/RT) * (Eh - E⁰ + (RT/F)*ln(10)*pH)
+        DO = K_H(T) * p_O2 * MW_O2 * 1000
+
+    Inputs broadcast against each other like do_to_eh.
 
     Args:
-        eh_VSHE: Redox potential vs SHE (V)
-        pH: Solution pH
-        temperature_C: Temperature (°C)
+        eh_VSHE: Redox potential vs SHE (V), scalar or array
+        pH: Solution pH, scalar or array
+        temperature_C: Temperature (°C), scalar or array
 
     Returns:
         Tuple of (DO_mg_L, warnings)
-            - DO_mg_L: Dissolved oxygen (mg/L)
+            - DO_mg_L: Dissolved oxygen (mg/L); float for scalar inputs,
+              otherwise an array of the broadcast shape
             - warnings: List of warning messages
 
     Example:
@@ -264,36 +413,45 @@ def eh_to_do(
     """
     warnings = []
 
+    eh, pH, T_C = np.broadcast_arrays(
+        np.asarray(eh_VSHE, dtype=float),
+        np.asarray(pH, dtype=float),
+        np.asarray(temperature_C, dtype=float),
+    )
+
     # Solve Nernst equation for p_O2
-    T_K = temperature_C + 273.15
-    RT_4F = (C.R * T_K) / (4.0 * C.F)
+    nernst_slope, RT_4F = _nernst_factors(temperature_C)
 
     # Eh = E⁰ - (RT/F)*ln(10)*pH + (RT/4F)*ln(p_O2)
     # ln(p_O2) = (Eh - E⁰ + (RT/F)*ln(10)*pH) / (RT/4F)
-    pH_term = (2.303 * C.R * T_K / C.F) * pH
-    ln_p_O2 = (eh_VSHE - C.E0_ORR_SHE + pH_term) / RT_4F
+    pH_term = nernst_slope * pH
+    ln_p_O2 = (eh - C.E0_ORR_SHE + pH_term) / RT_4F
     p_O2 = np.exp(ln_p_O2)
 
     # Check if p_O2 is physically realistic
-    if p_O2 > 1.0:
+    too_oxidizing = p_O2 > 1.0
+    if np.any(too_oxidizing):
+        k = np.flatnonzero(too_oxidizing)[0]
         warnings.append(
-            f"Calculated p_O2 = {p_O2:.2f} atm exceeds atmospheric pressure. "
-            f"This Eh ({eh_VSHE:.3f} V) is too oxidizing for ORR equilibrium."
+            f"Calculated p_O2 = {p_O2.flat[k]:.2f} atm exceeds atmospheric pressure. "
+            f"This Eh ({eh.flat[k]:.3f} V) is too oxidizing for ORR equilibrium."
         )
-        p_O2 = min(p_O2, 1.0)  # Cap at 1 atm
+        p_O2 = np.minimum(p_O2, 1.0)  # Cap at 1 atm
 
-    if p_O2 < 1e-10:
+    negligible = p_O2 < 1e-10
+    if np.any(negligible):
+        k = np.flatnonzero(negligible)[0]
         warnings.append(
-            f"Calculated p_O2 = {p_O2:.2e} atm is negligible. "
-            f"This Eh ({eh_VSHE:.3f} V) indicates anaerobic/reducing conditions."
+            f"Calculated p_O2 = {p_O2.flat[k]:.2e} atm is negligible. "
+            f"This Eh ({eh.flat[k]:.3f} V) indicates anaerobic/reducing conditions."
         )
 
     # Convert p_O2 to DO using Henry's law
-    K_H = henry_constant_o2(temperature_C)
+    K_H = henry_constant_o2(T_C)
     c_O2_mol_L = K_H * p_O2
     DO_mg_L = c_O2_mol_L * C.MW_O2 * 1000
 
-    return DO_mg_L, warnings
+    return (float(DO_mg_L) if DO_mg_L.ndim == 0 else DO_mg_L), warnings
 
 
 # ==============================================================================